@@ -0,0 +1,52 @@
+"""
+Measures how long an adversarial game takes to pick the largest feedback bucket for a guess over
+every possible answer, compared with grouping the answers by feedback in a dictionary.  Run with
+``python -m benchmarks.bench_adversary``
+"""
+
+import time
+from collections import Counter
+
+from src.wordall.adversary import AdversarialGame  # type: ignore
+from src.wordall.candidates import get_candidate_pool  # type: ignore
+from src.wordall.feedback import target_word  # type: ignore
+
+ROUNDS = 50
+OPENERS = {5: ("CRANE", "EERIE"), 6: ("CRANES", "EERIES")}
+
+
+def dictionary_partition(guess: str, words: list[str]) -> int:
+    """
+    Groups the words by the feedback they give the guess
+    Returns:
+        the code of the largest group
+    """
+    buckets = Counter(target_word(word).score(guess) for word in words)
+    return max(buckets, key=buckets.__getitem__)
+
+
+def main():
+    """
+    Prints the milliseconds per first guess for each approach
+    """
+    for word_length, openers in OPENERS.items():
+        pool = get_candidate_pool(word_length)
+        words = list(pool.store)
+        game = AdversarialGame(pool)
+        for guess in openers:
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                game.new_game()
+                game.make_guess(guess)
+            partition = (time.perf_counter() - start) / ROUNDS * 1e3
+            start = time.perf_counter()
+            dictionary_partition(guess, words)
+            grouped = (time.perf_counter() - start) * 1e3
+            print(
+                f"{guess:<6} over {len(words)} answers: partition {partition:6.2f} ms, "
+                f"dictionary {grouped:7.2f} ms ({grouped / partition:.0f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
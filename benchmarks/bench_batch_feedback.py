@@ -0,0 +1,46 @@
+"""
+Measures the throughput of the vectorized scorer in (guess, answer) pairs per second on the
+shipped word lists.  Run with ``python -m benchmarks.bench_batch_feedback``
+"""
+
+import time
+
+import numpy as np
+
+from src.wordall.batch_feedback import (  # type: ignore
+    DEFAULT_BLOCK_PAIRS,
+    feedback_dtype,
+    score_matrix,
+    store_letters,
+)
+from src.wordall.word_store import load_word_store  # type: ignore
+
+GUESS_ROWS = 2_000
+
+
+def main():
+    """
+    Prints the pairs scored per second for a slice of each word list scored against all of it,
+    at a few block sizes
+    """
+    print(f"{'letters':>8} {'block pairs':>12} {'pairs':>12} {'M pairs/s':>10}")
+    for word_length in (5, 6):
+        words = store_letters(load_word_store(word_length))
+        guesses = words[:GUESS_ROWS]
+        out = np.empty((len(guesses), len(words)), feedback_dtype(word_length))
+        for block_pairs in (
+            DEFAULT_BLOCK_PAIRS // 4,
+            DEFAULT_BLOCK_PAIRS,
+            DEFAULT_BLOCK_PAIRS * 4,
+        ):
+            start = time.perf_counter()
+            score_matrix(guesses, words, out, block_pairs)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{word_length:>8} {block_pairs:>12} {out.size:>12} "
+                f"{out.size / elapsed / 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
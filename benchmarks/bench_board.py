@@ -0,0 +1,71 @@
+"""
+Compares redrawing the board with ``utilities.show_results`` against the incremental
+``BoardRenderer``: CPU time and terminal bytes written per turn.  Run with
+``python -m benchmarks.bench_board``
+"""
+
+import io
+import random
+import time
+
+from rich.console import Console
+
+from src.wordall.board import BoardRenderer  # type: ignore
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.utilities import show_results  # type: ignore
+from src.wordall.word_store import load_word_store  # type: ignore
+
+GAMES = 200
+
+
+def play(draw, output: io.StringIO, words: list[str], rng: random.Random):
+    """
+    Plays ``GAMES`` random games, drawing the board after every guess
+    Returns:
+        tuple of the seconds spent drawing, bytes written and turns drawn
+    """
+    seconds = 0.0
+    turns = 0
+    for _ in range(GAMES):
+        game = GameState(rng.choice(words))
+        while game.remaining_guesses:
+            game.make_guess(rng.choice(words))
+            start = time.perf_counter()
+            draw(game)
+            seconds += time.perf_counter() - start
+            turns += 1
+    return seconds, len(output.getvalue().encode("utf-8")), turns
+
+
+def main():
+    """
+    Prints the per turn cost of both renderers on a 40 column truecolor terminal
+    """
+    words = list(load_word_store(5))
+    for name in ("show_results", "BoardRenderer"):
+        output = io.StringIO()
+        console = Console(
+            file=output, force_terminal=True, width=40, color_system="truecolor"
+        )
+        if name == "show_results":
+
+            def draw(game, console=console):
+                show_results(game, console)
+
+        else:
+            renderer = BoardRenderer(console)
+
+            def draw(game, renderer=renderer):
+                if game.guess_count == 1:
+                    renderer.reset()
+                renderer.draw(game)
+
+        seconds, written, turns = play(draw, output, words, random.Random(0))
+        print(
+            f"{name:<14} {seconds / turns * 1e6:>8.0f} us/turn "
+            f"{written / turns:>8.0f} bytes/turn"
+        )
+
+
+if __name__ == "__main__":
+    main()
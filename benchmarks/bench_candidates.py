@@ -0,0 +1,44 @@
+"""
+Measures how long narrowing the candidate set takes for each guess of a game.  Run with
+``python -m benchmarks.bench_candidates``
+"""
+
+import random
+import time
+
+from src.wordall.candidates import get_candidate_pool  # type: ignore
+from src.wordall.feedback import score_guess  # type: ignore
+
+GAMES = 200
+
+
+def main():
+    """
+    Prints the mean time per candidate update for each turn of randomly played games
+    """
+    rng = random.Random(0)
+    for word_length in (5, 6):
+        pool = get_candidate_pool(word_length)
+        words = list(pool.store)
+        candidates = pool.new_set()
+        turn_times = [0.0] * 6
+        turn_sizes = [0] * 6
+        for _ in range(GAMES):
+            answer = rng.choice(words)
+            candidates.reset()
+            for turn in range(6):
+                guess = rng.choice(words)
+                turn_sizes[turn] += len(candidates)
+                start = time.perf_counter()
+                candidates.update(guess, score_guess(guess, answer))
+                turn_times[turn] += time.perf_counter() - start
+        print(f"{word_length} letters ({len(words)} words)")
+        for turn in range(6):
+            print(
+                f"  turn {turn + 1}: {turn_sizes[turn] / GAMES:>9.1f} candidates "
+                f"{turn_times[turn] / GAMES * 1e6:>8.1f} us/update"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares checking a guess against the incrementally kept hard mode constraints with a naive
+check which replays the feedback of every earlier guess.  Run with
+``python -m benchmarks.bench_constraints``
+"""
+
+import random
+import time
+
+from src.wordall.candidates import get_candidate_pool  # type: ignore
+from src.wordall.constraints import LetterConstraints  # type: ignore
+from src.wordall.feedback import feedback_digits, score_guess  # type: ignore
+
+CHECKS = 50_000
+
+
+def naive_violation(history: list[tuple[str, int]], guess: str) -> str | None:
+    """
+    Hard mode check walking every earlier guess and its feedback
+    Returns:
+        message describing the broken rule, or None when the guess may be played
+    """
+    for earlier, code in history:
+        digits = feedback_digits(code, len(earlier))
+        revealed = [char for char, digit in zip(earlier, digits) if digit]
+        for position, (char, digit) in enumerate(zip(earlier, digits)):
+            if digit == 2 and guess[position] != char:
+                return f"letter {position + 1} must be {char}"
+        for char in set(revealed):
+            if guess.count(char) < revealed.count(char):
+                return f"Guess must contain {char}"
+    return None
+
+
+def checks_per_second(check, guesses: list[str]) -> float:
+    """
+    Runs a check over ``CHECKS`` guesses
+    Returns:
+        checks per second
+    """
+    start = time.perf_counter()
+    for index in range(CHECKS):
+        check(guesses[index % len(guesses)])
+    return CHECKS / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Prints the rate of both checks after one to five earlier guesses
+    """
+    rng = random.Random(0)
+    words = list(get_candidate_pool(5).store)
+    answer = rng.choice(words)
+    guesses = rng.sample(words, 1000)
+    history = []
+    constraints = LetterConstraints(5)
+    for played in rng.sample(words, 5):
+        code = score_guess(played, answer)
+        history.append((played, code))
+        constraints.update(played, code)
+        # Both checks must agree on which guesses are allowed
+        assert [naive_violation(history, guess) is None for guess in guesses] == [
+            constraints.violation(guess) is None for guess in guesses
+        ]
+        # Random guesses mostly fail early, allowed guesses have every rule checked
+        allowed = [guess for guess in words if constraints.violation(guess) is None]
+        for label, sample in (("random", guesses), ("allowed", allowed)):
+            naive = checks_per_second(
+                lambda guess: naive_violation(history, guess), sample
+            )
+            masks = checks_per_second(constraints.violation, sample)
+            print(
+                f"{len(history)} earlier, {label:<7} guesses: replay {naive:>8.0f}/s, "
+                f"constraints {masks:>8.0f}/s ({masks / naive:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measures the session event log: append throughput with fsync batched over a growing number of
+records, and recovery time of many sessions from the log alone and from a snapshot plus a short
+tail.  Run with ``python -m benchmarks.bench_event_log``
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.wordall.event_log import (  # type: ignore
+    KIND_GUESS,
+    KIND_NEW,
+    EventLog,
+    load_histories,
+    load_sessions,
+)
+from src.wordall.word_store import load_word_store  # type: ignore
+
+APPENDS = 20_000
+SESSIONS = 100_000
+GUESSES_PER_SESSION = 3
+
+
+def appends_per_second(directory: Path, sync_every: int) -> float:
+    """
+    Appends ``APPENDS`` guess events, syncing every ``sync_every`` of them
+    Returns:
+        events per second
+    """
+    log = EventLog(directory, sync_every=sync_every, sync_interval=60.0)
+    start = time.perf_counter()
+    for index in range(APPENDS):
+        log.append(index, KIND_GUESS, 5, index, "SAVER", 200, index % 6)
+    log.close()
+    return APPENDS / (time.perf_counter() - start)
+
+
+def write_sessions(directory: Path, rng: random.Random) -> EventLog:
+    """
+    Logs ``SESSIONS`` games with a few guesses each
+    Returns:
+        the open log
+    """
+    store = load_word_store(5)
+    log = EventLog(directory, sync_every=4096)
+    for session in range(SESSIONS):
+        log.append(session, KIND_NEW, 5, store.random_index(rng))
+        for turn in range(GUESSES_PER_SESSION):
+            log.append(session, KIND_GUESS, 5, 0, store.choice(rng), 0, turn)
+    log.sync()
+    return log
+
+
+def timed(function, *args):
+    """
+    Calls a function
+    Returns:
+        tuple of its result and the seconds it took
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """
+    Prints append throughput per batch size and recovery times
+    """
+    for sync_every in (1, 16, 256, 4096):
+        with tempfile.TemporaryDirectory() as directory:
+            rate = appends_per_second(Path(directory), sync_every)
+        print(f"append, fsync every {sync_every:>5} records {rate:>12.0f} events/s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = write_sessions(Path(directory), random.Random(0))
+        histories, seconds = timed(load_histories, Path(directory))
+        print(
+            f"replay {len(histories)} sessions from segments {seconds * 1e3:>9.0f} ms"
+        )
+        _, seconds = timed(log.snapshot, histories.items())
+        print(f"snapshot {len(histories)} sessions {seconds * 1e3:>23.0f} ms")
+        for session in range(1000):
+            log.append(session, KIND_GUESS, 5, 0, "SAVER", 0, GUESSES_PER_SESSION)
+        log.close()
+        histories, seconds = timed(load_histories, Path(directory))
+        print(f"load snapshot plus tail {seconds * 1e3:>24.0f} ms")
+        games, seconds = timed(load_sessions, Path(directory))
+        print(f"rebuild {len(games)} games {seconds * 1e3:>26.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
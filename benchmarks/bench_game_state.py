@@ -0,0 +1,85 @@
+"""
+Compares the pydantic ``GameTracker`` with the slotted ``GameState`` on memory held per live
+game and on games created and played per second.  Run with ``python -m benchmarks.bench_game_state``
+"""
+
+import gc
+import random
+import time
+import tracemalloc
+from functools import partial
+
+from src.wordall.candidates import get_candidate_pool  # type: ignore
+from src.wordall.dictionary import get_word_index  # type: ignore
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+
+SESSIONS = 100_000
+GAMES = 20_000
+GUESSES_PER_GAME = 3
+
+
+def memory_per_session(factory, words: list[str], guesses: list[str]) -> float:
+    """
+    Holds ``SESSIONS`` games with a few guesses each and measures the memory they retain
+    Returns:
+        bytes per game
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    sessions = []
+    for index in range(SESSIONS):
+        game = factory(words[index % len(words)])
+        for guess in guesses:
+            game.make_guess(guess)
+        sessions.append(game)
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del sessions
+    return used / SESSIONS
+
+
+def games_per_second(factory, words: list[str], rng: random.Random) -> float:
+    """
+    Creates and plays ``GAMES`` short games
+    Returns:
+        games per second
+    """
+    start = time.perf_counter()
+    for _ in range(GAMES):
+        answer = rng.choice(words)
+        game = factory(answer)
+        for guess in rng.sample(words, GUESSES_PER_GAME):
+            if guess != answer:
+                game.make_guess(guess)
+    return GAMES / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Prints the memory and throughput of both representations, with and without a shared
+    dictionary and candidate pool
+    """
+    rng = random.Random(0)
+    dictionary = get_word_index(5)
+    pool = get_candidate_pool(5)
+    words = list(pool.store)
+    guesses = rng.sample(words, GUESSES_PER_GAME)
+    answers = [word for word in words if word not in guesses]
+    for name, game_type in (("GameTracker", GameTracker), ("GameState", GameState)):
+        for label, options in (
+            ("bare", {}),
+            ("dictionary", {"dictionary": dictionary}),
+            ("candidates", {"dictionary": dictionary, "candidate_pool": pool}),
+        ):
+            factory = partial(game_type, word_length=5, **options)
+            print(
+                f"{name:<12} {label:<11} "
+                f"{memory_per_session(factory, answers, guesses):>9.0f} bytes/session "
+                f"{games_per_second(factory, answers, rng):>9.0f} games/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
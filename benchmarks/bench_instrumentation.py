@@ -0,0 +1,46 @@
+"""
+Measures what the stage timers cost around ``GameState.make_guess``: nothing instrumented, timers
+disabled and timers recording.  Run with ``python -m benchmarks.bench_instrumentation``
+"""
+
+import time
+
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.instrumentation import metrics  # type: ignore
+
+GAMES = 50_000
+GUESSES = ("CRANE", "SLOTH", "PUDGY")
+
+
+def nanoseconds_per_guess(make_guess) -> float:
+    """
+    Plays ``GAMES`` short games through a ``make_guess`` function
+    Returns:
+        nanoseconds per guess
+    """
+    game = GameState("SAVED")
+    start = time.perf_counter()
+    for _ in range(GAMES):
+        game.new_game("SAVED")
+        for guess in GUESSES:
+            make_guess(game, guess)
+    return (time.perf_counter() - start) / (GAMES * len(GUESSES)) * 1e9
+
+
+def main():
+    """
+    Prints the time per guess of each variant
+    """
+    bare = GameState.make_guess.__wrapped__  # pylint: disable=E1101
+    results = {"uninstrumented": nanoseconds_per_guess(bare)}
+    results["disabled"] = nanoseconds_per_guess(GameState.make_guess)
+    metrics.enable()
+    results["recording"] = nanoseconds_per_guess(GameState.make_guess)
+    metrics.disable()
+    for label, nanoseconds in results.items():
+        overhead = nanoseconds - results["uninstrumented"]
+        print(f"{label:<15} {nanoseconds:>7.0f} ns/guess ({overhead:+.0f} ns)")
+
+
+if __name__ == "__main__":
+    main()
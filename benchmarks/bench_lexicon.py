@@ -0,0 +1,56 @@
+"""
+Ingests a generated lexicon of 500,000 lines and reports the time taken and the peak memory
+traced, which grows with the distinct words kept rather than with the size of the file.  Run with
+``python -m benchmarks.bench_lexicon``
+"""
+
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.wordall.lexicon import ingest_lexicon  # type: ignore
+
+LINES = 500_000
+
+
+def write_lexicon(path: Path, rng: random.Random):
+    """
+    Writes ``LINES`` random entries of 2 to 15 letters, with some duplicates and junk lines
+    """
+    with path.open("w", encoding="ascii") as lexicon:
+        for _ in range(LINES):
+            roll = rng.random()
+            if roll < 0.02:
+                lexicon.write("not-a-word\n")
+            elif roll < 0.1:
+                lexicon.write("duplicate\n")
+            else:
+                letters = rng.choices(string.ascii_lowercase, k=rng.randint(2, 15))
+                lexicon.write("".join(letters) + "\n")
+
+
+def main():
+    """
+    Prints the ingest rate and peak memory
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "lexicon.txt"
+        write_lexicon(source, random.Random(0))
+        size = source.stat().st_size
+        tracemalloc.start()
+        start = time.perf_counter()
+        summary = ingest_lexicon(source, Path(directory) / "lists")
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    print(f"{LINES} lines in {seconds:.2f}s ({LINES / seconds:,.0f} lines/s)")
+    print(f"{summary.total} words kept, {summary.duplicates} duplicates, ", end="")
+    print(f"{summary.rejected} rejected")
+    print(f"peak traced memory {peak / 1e6:.1f} MB for a {size / 1e6:.1f} MB lexicon")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures the latency of one guess in a multi-board game against the number of boards, compared
+with one ``make_guess`` call per board.  From ``BATCH_BOARDS`` open boards the multi-board game
+scores the guess in one batch against the packed answers.
+Run with ``python -m benchmarks.bench_multi_board``
+"""
+
+import random
+import time
+
+from src.wordall.dictionary import get_word_index  # type: ignore
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+from src.wordall.multi_board import MultiBoardGame  # type: ignore
+from src.wordall.word_store import load_word_store  # type: ignore
+
+BOARD_COUNTS = (1, 2, 4, 8, 16, 32)
+GAMES = 400
+GUESSES_PER_GAME = 5
+
+
+def batched(words: list[str], guesses: list[str], dictionary) -> float:
+    """
+    Plays the guesses on a ``MultiBoardGame``
+    Returns:
+        seconds spent making guesses
+    """
+    game = MultiBoardGame(words, dictionary)
+    start = time.perf_counter()
+    for guess in guesses:
+        game.make_guess(guess)
+    return time.perf_counter() - start
+
+
+def per_board(factory, words: list[str], guesses: list[str], dictionary) -> float:
+    """
+    Plays the guesses on one game per board
+    Returns:
+        seconds spent making guesses
+    """
+    games = [factory(word, dictionary=dictionary) for word in words]
+    start = time.perf_counter()
+    for guess in guesses:
+        for game in games:
+            if not game.is_solved:
+                game.make_guess(guess)
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Prints the microseconds per guess of each approach for each number of boards
+    """
+    rng = random.Random(0)
+    store = load_word_store(5)
+    words = [store[index] for index in range(len(store))]
+    dictionary = get_word_index(5)
+    print(f"{'boards':>6} {'multi-board':>12} {'GameState':>10} {'GameTracker':>12}")
+    for boards in BOARD_COUNTS:
+        totals = [0.0, 0.0, 0.0]
+        for _ in range(GAMES):
+            answers = rng.sample(words, boards)
+            guesses = rng.sample(words, GUESSES_PER_GAME)
+            totals[0] += batched(answers, guesses, dictionary)
+            totals[1] += per_board(GameState, answers, guesses, dictionary)
+            totals[2] += per_board(GameTracker, answers, guesses, dictionary)
+        batch, state, tracker = (
+            total / (GAMES * GUESSES_PER_GAME) * 1e6 for total in totals
+        )
+        print(f"{boards:>6} {batch:>10.1f}us {state:>8.1f}us {tracker:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
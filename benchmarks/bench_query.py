@@ -0,0 +1,71 @@
+"""
+Measures how long the query index takes to answer typical queries, counting and listing the
+matches, compared with scanning every word with a regular expression and letter counts.  Run
+with ``python -m benchmarks.bench_query``
+"""
+
+import re
+import time
+
+from src.wordall.query import get_query_index  # type: ignore
+
+ROUNDS = 200
+QUERIES = {
+    5: {
+        "S?A?E": lambda w: re.fullmatch("S.A.E", w),
+        "+RT -E": lambda w: "R" in w and "T" in w and "E" not in w,
+        "O=2": lambda w: w.count("O") == 2,
+        "ST*": lambda w: w.startswith("ST"),
+        "[^S]R[AEIOU]?? -T E<=1": lambda w: (
+            re.fullmatch("[^S]R[AEIOU]..", w) and "T" not in w and w.count("E") <= 1
+        ),
+    },
+    6: {
+        "S?A??E": lambda w: re.fullmatch("S.A..E", w),
+        "+RT -E": lambda w: "R" in w and "T" in w and "E" not in w,
+        "ST*": lambda w: w.startswith("ST"),
+    },
+}
+
+
+def per_round(function) -> float:
+    """
+    Times a function
+    Returns:
+        the microseconds per call
+    """
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        function()
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+def compare_length(word_length: int, queries: dict):
+    """
+    Prints the microseconds per query for each approach on the words of one length
+    """
+    start = time.perf_counter()
+    index = get_query_index(word_length)
+    built = (time.perf_counter() - start) * 1e3
+    words = index.words
+    print(f"{len(words)} words of {word_length} letters, indexed in {built:.1f} ms")
+    for query, predicate in queries.items():
+        counted = per_round(lambda q=query: index.count(q))
+        listed = per_round(lambda q=query: list(index.search(q)))
+        scanned = per_round(lambda p=predicate: [w for w in words if p(w)])
+        print(
+            f"  {query:<24} count {counted:7.1f} us, list {listed:7.1f} us, "
+            f"scan {scanned:8.1f} us ({scanned / listed:.0f}x)"
+        )
+
+
+def main():
+    """
+    Prints the microseconds per query for each approach
+    """
+    for word_length, queries in QUERIES.items():
+        compare_length(word_length, queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measures the session store operations of the server with the sessions in shared memory,
+compared with the single process store, plus a look up by a worker which has not cached the
+game and has to rebuild it from its slot.  Run with ``python -m benchmarks.bench_shared_sessions``
+"""
+
+import random
+import time
+
+from src.wordall.server import SessionStore  # type: ignore
+from src.wordall.shared_sessions import SharedSessionStore  # type: ignore
+
+SESSIONS = 2000
+GUESSES = ("CRANE", "SLOTH", "PUDGY")
+
+
+def time_operations(store) -> dict[str, float]:
+    """
+    Times each operation over many sessions
+    Returns:
+        microseconds per operation, by name
+    """
+    timings = {}
+    start = time.perf_counter()
+    session_ids = [store.create(5)[0] for _ in range(SESSIONS)]
+    timings["create"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for guess in GUESSES:
+        for session_id in session_ids:
+            store.play(session_id, guess)
+    timings["play"] = (time.perf_counter() - start) / len(GUESSES)
+    start = time.perf_counter()
+    for session_id in session_ids:
+        store.get(session_id)
+    timings["get"] = time.perf_counter() - start
+    if isinstance(store, SharedSessionStore):
+        store._games.clear()  # pylint: disable=W0212
+        start = time.perf_counter()
+        for session_id in session_ids:
+            store.get(session_id)
+        timings["get (rebuilt)"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for session_id in session_ids:
+        store.remove(session_id)
+    timings["remove"] = time.perf_counter() - start
+    return {name: seconds / SESSIONS * 1e6 for name, seconds in timings.items()}
+
+
+def main():
+    """
+    Prints the microseconds per operation of each store
+    """
+    local = time_operations(SessionStore(rng=random.Random(0)))
+    shared_store = SharedSessionStore(max_sessions=SESSIONS, rng=random.Random(0))
+    try:
+        shared = time_operations(shared_store)
+    finally:
+        shared_store.close()
+        shared_store.unlink()
+    print(f"{'operation':<14} {'local':>9} {'shared':>9}")
+    for name, micros in shared.items():
+        baseline = f"{local[name]:6.1f} us" if name in local else ""
+        print(f"{name:<14} {baseline:>9} {micros:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
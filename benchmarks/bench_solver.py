@@ -0,0 +1,34 @@
+"""
+Measures the seconds taken to rank every opening guess of a word list with 1, 2, 4 and 8
+worker processes.  Run with ``python -m benchmarks.bench_solver [word length]``
+"""
+
+import sys
+import time
+
+from src.wordall.candidates import get_candidate_pool  # type: ignore
+from src.wordall.solver import rank_guesses  # type: ignore
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def main():
+    """
+    Prints the seconds to the best opener, and the opener found, for each worker count
+    """
+    word_length = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pool = get_candidate_pool(word_length)
+    words = pool.letters
+    print(f"{word_length} letters, {len(words)} guesses x {len(words)} candidates")
+    print(f"{'workers':>8} {'seconds':>9} opener")
+    for workers in WORKER_COUNTS:
+        start = time.perf_counter()
+        best = rank_guesses(words, words, workers=workers, top_k=1)[0]
+        elapsed = time.perf_counter() - start
+        print(
+            f"{workers:>8} {elapsed:>9.2f} {pool.store[best.guess_index]} ({best.entropy:.3f} bits)"
+        )
+
+
+if __name__ == "__main__":
+    main()
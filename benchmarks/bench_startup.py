@@ -0,0 +1,133 @@
+"""
+Measures how quickly the console game gets to its first prompt when launched, and how much
+memory it holds by then.  Fails (exit status 1) when either goes over its threshold, so it can
+guard against imports creeping back onto the startup path.  Run with
+``python -m benchmarks.bench_startup [--runs N] [--max-prompt-ms MS] [--max-rss-mb MB]``
+"""
+
+import argparse
+import io
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+FIRST_PROMPT = b"Word length"
+MAX_PROMPT_MS = 250.0
+MAX_RSS_MB = 40.0
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def peak_rss_mb(pid: int) -> float:
+    """
+    Peak resident memory of a running process, from ``/proc`` (Linux only)
+    Returns:
+        megabytes, or 0 when unavailable
+    """
+    try:
+        status = Path(f"/proc/{pid}/status").read_text(encoding="ascii")
+    except OSError:
+        return 0.0
+    match = re.search(r"VmHWM:\s+(\d+) kB", status)
+    return int(match.group(1)) / 1024 if match else 0.0
+
+
+def launch_to_prompt() -> tuple[float, float]:
+    """
+    Launches the game and waits for its first prompt
+    Returns:
+        tuple of the milliseconds until the prompt appeared and the peak RSS in megabytes
+    """
+    start = time.perf_counter()
+    with subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=ROOT,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    ) as process:
+        # A piped stdout is a buffered reader, which can return whatever is available
+        stdout = process.stdout
+        assert isinstance(stdout, io.BufferedReader)
+        output = b""
+        while FIRST_PROMPT not in output:
+            chunk = stdout.read1(4096)
+            if not chunk:
+                raise RuntimeError(f"main.py exited before prompting: {output!r}")
+            output += chunk
+        elapsed = (time.perf_counter() - start) * 1000
+        rss = peak_rss_mb(process.pid)
+        process.kill()
+    return elapsed, rss
+
+
+def slowest_imports(count: int = 10) -> list[tuple[str, int]]:
+    """
+    Runs ``python -X importtime`` on the game module
+    Returns:
+        the ``count`` top level imports of ``main`` taking longest, with their cumulative
+            microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports: list[tuple[str, int]] = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        name, cumulative, depth = (
+            match.group(4),
+            int(match.group(2)),
+            len(match.group(3)),
+        )
+        # Modules are listed after everything they import, so the imports made directly by
+        # main.py (one level deep) are those since the previous top level module
+        if depth == 0 and name == "main":
+            imports.append(("main (total)", cumulative))
+            break
+        if depth == 0:
+            imports.clear()
+        elif depth == 2:
+            imports.append((name, cumulative))
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:count]
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Prints the startup measurements
+    Returns:
+        exit status, 1 when a threshold was exceeded
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-prompt-ms", type=float, default=MAX_PROMPT_MS)
+    parser.add_argument("--max-rss-mb", type=float, default=MAX_RSS_MB)
+    options = parser.parse_args(arguments)
+
+    for name, microseconds in slowest_imports():
+        print(f"  {name:<32} {microseconds / 1000:>8.1f} ms")
+    launches = [launch_to_prompt() for _ in range(options.runs)]
+    prompt_ms = statistics.median(elapsed for elapsed, _ in launches)
+    rss_mb = max(rss for _, rss in launches)
+    print(f"time to first prompt {prompt_ms:8.1f} ms (median of {options.runs})")
+    print(f"peak RSS at prompt   {rss_mb:8.1f} MB")
+
+    failed = False
+    if prompt_ms > options.max_prompt_ms:
+        print(f"FAIL: first prompt slower than {options.max_prompt_ms} ms")
+        failed = True
+    if rss_mb > options.max_rss_mb:
+        print(f"FAIL: peak RSS above {options.max_rss_mb} MB")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Ingests ten million synthetic game results into the statistics aggregator in batches, compares
+the rate with recording one result at a time, and times the queries afterwards.  Run with
+``python -m benchmarks.bench_stats``
+"""
+
+import time
+
+import numpy as np
+
+from src.wordall.stats import SECONDS_PER_DAY, StatsAggregator  # type: ignore
+
+EVENTS = 10_000_000
+BATCH = 100_000
+SINGLE_EVENTS = 200_000
+PLAYERS = 1_000_000
+ANSWERS = 2_315
+DAYS = 90
+
+
+def synthetic_results(rng: np.random.Generator, count: int, start_day: float):
+    """
+    Random results spread over a day, in the order they finished
+    Returns:
+        tuple of players, answers, guess counts, solved flags and timestamps
+    """
+    return (
+        rng.integers(0, PLAYERS, count),
+        rng.integers(0, ANSWERS, count),
+        rng.integers(1, 7, count),
+        rng.random(count) < 0.9,
+        np.sort(rng.uniform(start_day, start_day + 1, count)) * SECONDS_PER_DAY,
+    )
+
+
+def batched_rate(stats: StatsAggregator, rng: np.random.Generator) -> float:
+    """
+    Ingests ``EVENTS`` results spread over ``DAYS`` days in batches of ``BATCH``
+    Returns:
+        results per second, not counting their generation
+    """
+    batches_per_day = EVENTS // BATCH // DAYS + 1
+    elapsed = 0.0
+    for batch in range(EVENTS // BATCH):
+        results = synthetic_results(rng, BATCH, batch // batches_per_day)
+        start = time.perf_counter()
+        stats.record_batch(*results)
+        elapsed += time.perf_counter() - start
+    return EVENTS / elapsed
+
+
+def single_rate(rng: np.random.Generator) -> float:
+    """
+    Records ``SINGLE_EVENTS`` results one at a time
+    Returns:
+        results per second
+    """
+    stats = StatsAggregator(ANSWERS, players=PLAYERS)
+    results = zip(
+        *(values.tolist() for values in synthetic_results(rng, SINGLE_EVENTS, 0))
+    )
+    start = time.perf_counter()
+    for result in results:
+        stats.record(*result)
+    return SINGLE_EVENTS / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Prints ingest rates and query latencies
+    """
+    rng = np.random.default_rng(0)
+    stats = StatsAggregator(ANSWERS, players=PLAYERS)
+    rate = batched_rate(stats, rng)
+    print(f"batched ingest of {EVENTS} results {rate:>14.0f} results/s")
+    rate = single_rate(rng)
+    print(f"one at a time ({SINGLE_EVENTS} results) {rate:>17.0f} results/s")
+
+    for name, query in (
+        ("player", lambda: stats.player(12345)),
+        ("totals", stats.totals),
+        ("daily window", lambda: stats.window(1, today=stats.latest_day)),
+        ("weekly window", lambda: stats.window(7, today=stats.latest_day)),
+        ("hardest 10", lambda: stats.hardest(10, min_games=100)),
+    ):
+        start = time.perf_counter()
+        for _ in range(1000):
+            query()
+        print(f"{name:<14} {(time.perf_counter() - start) * 1e3:>30.3f} us/query")
+    print(f"totals {stats.totals()}")
+
+
+if __name__ == "__main__":
+    main()
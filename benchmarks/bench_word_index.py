@@ -0,0 +1,74 @@
+"""
+Measures the per-guess cost of dictionary validation as the dictionary grows.  Run with
+``python -m benchmarks.bench_word_index``
+"""
+
+import random
+import string
+import timeit
+
+from src.wordall.dictionary import WordIndex  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+
+DICTIONARY_SIZES = (5_000, 20_000, 100_000, 250_000)
+GUESSES_PER_RUN = 50_000
+
+
+def synthetic_words(count: int, word_length: int, seed: int = 0) -> list[str]:
+    """
+    Produces a list of distinct random upper-case words
+    Args:
+        count: number of words to produce
+        word_length: letters per word
+        seed: seed for the random generator so runs are repeatable
+
+    Returns:
+        list of unique words
+    """
+    rng = random.Random(seed)
+    words: set[str] = set()
+    while len(words) < count:
+        words.add("".join(rng.choices(string.ascii_uppercase, k=word_length)))
+    return sorted(words)
+
+
+def main():
+    """
+    Prints nanoseconds per membership check, and per full ``make_guess`` validation, for each
+    dictionary size
+    """
+    rng = random.Random(1)
+    print(f"{'words':>10} {'ns/check':>10} {'ns/make_guess':>14}")
+    for size in DICTIONARY_SIZES:
+        words = synthetic_words(size, 5)
+        index = WordIndex(words, 5)
+        # Half hits, half misses, so both outcomes are represented
+        probes = rng.choices(words, k=GUESSES_PER_RUN // 2) + synthetic_words(
+            GUESSES_PER_RUN // 2, 5, seed=size
+        )
+        check_time = timeit.timeit(
+            lambda index_in=index, probes_in=probes: [
+                probe in index_in for probe in probes_in
+            ],
+            number=5,
+        )
+
+        # The target is never in the dictionary, so no guess ends the game early
+        game = GameTracker("*****", 5, dictionary=index)
+        game.max_guesses = GUESSES_PER_RUN
+        hits = probes[: GUESSES_PER_RUN // 2]
+
+        def play(game_in=game, guesses=hits):
+            game_in.new_game("*****")
+            for guess in guesses:
+                game_in.make_guess(guess)
+
+        guess_time = timeit.timeit(play, number=1)
+        print(
+            f"{size:>10} {check_time / (5 * GUESSES_PER_RUN) * 1e9:>10.1f} "
+            f"{guess_time / len(hits) * 1e9:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
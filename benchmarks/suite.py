@@ -0,0 +1,269 @@
+"""
+Benchmark suite for the game engine and renderer: microbenchmarks of the hot paths of a turn and
+of loading a word list, plus macro runs of whole simulated games on the 5 and 6 letter lists.
+Results can be saved as a JSON baseline, and a later run compared against it fails (exit status
+1) when any benchmark slowed down by more than a given percentage.  Run with
+``python -m benchmarks.suite [--only TEXT] [--save FILE] [--compare FILE] [--max-slowdown PCT]``
+"""
+
+import argparse
+import io
+import json
+import platform
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from rich.console import Console
+
+from src.wordall.candidates import CandidatePool  # type: ignore
+from src.wordall.dictionary import WordIndex  # type: ignore
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+from src.wordall.simulate import RandomStrategy, play_game  # type: ignore
+from src.wordall.utilities import (  # type: ignore
+    QWERTY_TOP,
+    keyboard_character_format,
+    show_results,
+    style_guess,
+)
+from src.wordall.word_store import (  # type: ignore
+    CACHE_DIR,
+    WordStore,
+    compile_word_store,
+    load_word_store,
+    word_source_path,
+)
+
+BASELINE_FORMAT = 1
+MAX_SLOWDOWN_PCT = 10.0
+REPEATS = 5
+GUESSES = ("CRANE", "SLOTH", "PUDGY")
+MACRO_GAMES = 200
+
+
+class Case(NamedTuple):
+    """
+    One benchmark: ``setup`` prepares what is measured and returns the callable to time, which
+    performs ``operations`` of the benchmarked operation per call
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    operations: int = 1
+    # Calls per timing, or None to find a number taking at least 0.2 s
+    number: int | None = None
+
+
+def make_guess_case(factory) -> Callable[[], Callable[[], object]]:
+    """
+    Benchmark of ``make_guess`` on a type of game, three guesses per fresh game
+    Returns:
+        the setup function
+    """
+
+    def setup():
+        game = factory("SAVED")
+
+        def run():
+            game.new_game("SAVED")
+            for guess in GUESSES:
+                game.make_guess(guess)
+
+        return run
+
+    return setup
+
+
+def style_guess_setup() -> Callable[[], object]:
+    """Styles a guess with every kind of feedback"""
+    return lambda: style_guess("SAUVE", "SAVED")
+
+
+def keyboard_setup() -> Callable[[], object]:
+    """Formats the top keyboard row after a few guesses"""
+    game = GameState("SAVED")
+    for guess in GUESSES:
+        game.make_guess(guess)
+    used_letters = game.used_letters
+    return lambda: keyboard_character_format(QWERTY_TOP, used_letters)
+
+
+def show_results_setup() -> Callable[[], object]:
+    """Draws a game in progress on an in-memory console"""
+    output = io.StringIO()
+    console = Console(file=output, width=40)
+    game = GameState("SAVED")
+    for guess in GUESSES:
+        game.make_guess(guess)
+
+    def run():
+        output.seek(0)
+        output.truncate()
+        show_results(game, console)
+
+    return run
+
+
+def compile_words_setup() -> Callable[[], object]:
+    """Compiles the 5 letter list from its text file"""
+    # Next to the real store, under a name nothing else reads
+    target = CACHE_DIR / "bench_words_5.bin"
+    source = word_source_path(5)
+    return lambda: compile_word_store(source, target)
+
+
+def open_words_setup() -> Callable[[], object]:
+    """Maps a compiled 5 letter list and builds its dictionary index"""
+    path = load_word_store(5).path
+
+    def run():
+        store = WordStore(path)
+        WordIndex.from_store(store)
+        store.close()
+
+    return run
+
+
+def macro_setup(word_length: int) -> Callable[[], Callable[[], object]]:
+    """
+    Benchmark of whole games played by the random candidate strategy
+    Returns:
+        the setup function
+    """
+
+    def setup():
+        pool = CandidatePool(load_word_store(word_length))
+        answers = random.Random(0).sample(list(pool.store), MACRO_GAMES)
+
+        def run():
+            strategy = RandomStrategy(0)
+            for answer in answers:
+                play_game(answer, strategy, pool)
+
+        return run
+
+    return setup
+
+
+CASES = (
+    Case("make_guess[GameState]", make_guess_case(GameState), len(GUESSES)),
+    Case("make_guess[GameTracker]", make_guess_case(GameTracker), len(GUESSES)),
+    Case("style_guess", style_guess_setup),
+    Case("keyboard_character_format", keyboard_setup),
+    Case("show_results", show_results_setup),
+    Case("compile_words[5]", compile_words_setup),
+    Case("open_words[5]", open_words_setup),
+    Case("simulated_game[5]", macro_setup(5), MACRO_GAMES, number=1),
+    Case("simulated_game[6]", macro_setup(6), MACRO_GAMES, number=1),
+)
+
+
+def run_case(case: Case, repeats: int = REPEATS) -> dict:
+    """
+    Times a benchmark, keeping the fastest of several timings as the least disturbed one
+    Returns:
+        the seconds per operation, with the calls per timing and the number of timings
+    """
+    timer = timeit.Timer(case.setup())
+    number = case.number or timer.autorange()[0]
+    fastest = min(timer.repeat(repeat=repeats, number=number))
+    return {
+        "seconds": fastest / number / case.operations,
+        "number": number,
+        "repeats": repeats,
+    }
+
+
+def compare(baseline: dict, results: dict, max_slowdown_pct: float) -> list[str]:
+    """
+    Finds the benchmarks which slowed down too much since a baseline
+    Args:
+        baseline: results of an earlier run, by benchmark name
+        results: results of this run, by benchmark name
+        max_slowdown_pct: percentage by which a benchmark may be slower than its baseline
+
+    Returns:
+        the names of the benchmarks which regressed
+    """
+    regressed = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = (result["seconds"] / baseline[name]["seconds"] - 1) * 100
+        if change > max_slowdown_pct:
+            regressed.append(name)
+    return regressed
+
+
+def format_seconds(seconds: float) -> str:
+    """
+    Formats a duration in the most readable unit
+    Returns:
+        the duration with its unit
+    """
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Runs the suite and prints each result, with its change when comparing with a baseline
+    Returns:
+        exit status, 1 when a benchmark regressed
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--only", help="run the benchmarks whose name contains this")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--save", type=Path, help="file to save the results to")
+    parser.add_argument("--compare", type=Path, help="baseline file to compare with")
+    parser.add_argument("--max-slowdown", type=float, default=MAX_SLOWDOWN_PCT)
+    options = parser.parse_args(arguments)
+
+    baseline = {}
+    if options.compare:
+        saved = json.loads(options.compare.read_text(encoding="utf-8"))
+        if saved.get("format") != BASELINE_FORMAT:
+            parser.error(
+                f"{options.compare} is not a format {BASELINE_FORMAT} baseline"
+            )
+        baseline = saved["results"]
+
+    results = {}
+    for case in CASES:
+        if options.only and options.only not in case.name:
+            continue
+        results[case.name] = run_case(case, options.repeats)
+        line = f"{case.name:<28} {format_seconds(results[case.name]['seconds']):>10}"
+        if case.name in baseline:
+            old = baseline[case.name]["seconds"]
+            line += f"  {(results[case.name]['seconds'] / old - 1) * 100:+6.1f}%"
+        print(line, flush=True)
+
+    if options.save:
+        options.save.write_text(
+            json.dumps(
+                {
+                    "format": BASELINE_FORMAT,
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    regressed = compare(baseline, results, options.max_slowdown)
+    for name in regressed:
+        print(
+            f"FAIL: {name} is more than {options.max_slowdown}% slower than the baseline"
+        )
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
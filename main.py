@@ -3,22 +3,80 @@ Primary point of entry for the wordall module.  Houses the interface which a use
 in order to play the game
 """
 
+import importlib
+import os
 import random
-from pathlib import Path
+import threading
 
 from rich.console import Console
-from rich.prompt import Prompt
+from rich.prompt import Confirm, Prompt
 
-from src.wordall.game_tracker import GameTracker, InvalidEntryError  # type: ignore
-from src.wordall.utilities import show_results, refresh_display  # type: ignore
-
-FIVE_WORD_DATAFILE_PATH = Path(__file__).parent / "src" / "data" / "words_5.txt"
-SIX_WORD_DATAFILE_PATH = Path(__file__).parent / "src" / "data" / "words_6.txt"
+from src.wordall.constraints import MODES, NORMAL  # type: ignore
+from src.wordall.game_state import GameState, InvalidEntryError  # type: ignore
+from src.wordall.instrumentation import instrument_from_env  # type: ignore
+from src.wordall.utilities import refresh_display  # type: ignore
+from src.wordall.word_store import available_lengths  # type: ignore
 
 console = Console(width=40)
+BOARD_COUNTS = ("1", "2", "4", "8", "16", "32")
+
+# Only needed once the first prompt has been answered.  They are imported in the background
+# while the player reads it, instead of delaying the prompt (numpy alone takes ~70 ms)
+DEFERRED_MODULES = (
+    "src.wordall.candidates",
+    "src.wordall.dictionary",
+    "src.wordall.board",
+    "src.wordall.definitions",
+    "src.wordall.solver",
+    "src.wordall.opening_book",
+    "src.wordall.scheduler",
+    "src.wordall.stats",
+    "src.wordall.multi_board",
+    "src.wordall.adversary",
+)
+
+
+def preload():
+    """
+    Imports the modules deferred at startup
+    """
+    for name in DEFERRED_MODULES:
+        importlib.import_module(name)
+
+
+def play_boards(boards: int, word_store, dictionary, mode: str = NORMAL):
+    """
+    Runs multi-board games until the player stops.  Their answers are drawn at random, so they
+    do not advance the single board schedule or its statistics
+    Args:
+        boards: number of boards per game
+        word_store: the words of the chosen length
+        dictionary: the valid guesses
+        mode: the rules guesses are held to on every board
+    """
+    # pylint: disable=C0415
+    from src.wordall.multi_board import MultiBoardGame  # type: ignore
+    from src.wordall.utilities import show_results  # type: ignore
+
+    # pylint: enable=C0415
+
+    while True:
+        answers = random.sample(range(len(word_store)), boards)
+        game = MultiBoardGame(
+            [word_store[answer] for answer in answers], dictionary, mode=mode
+        )
+        while game.remaining_guesses > 0:
+            try:
+                game.make_guess(console.input("Enter your next guess:-> ").upper())
+            except InvalidEntryError as iee:
+                console.print(iee)
+                continue
+            show_results(game, console)
+        if console.input(" New game? (Y/N) -> ").upper() != "Y":
+            return
 
 
-def main():
+def main():  # pylint: disable=R0914,R0915
     """
     Encapsulates the logic to display and capture the game "interface".
     Returns:
@@ -26,42 +84,106 @@ def main():
     """
 
     refresh_display(console)
-
-    word_size = Prompt.ask(
-        "5 word or 6 word game (Click Enter for the default)? -> ", default=5
-    )
-
-    word_source = (
-        FIVE_WORD_DATAFILE_PATH if int(word_size) == 5 else SIX_WORD_DATAFILE_PATH
+    threading.Thread(target=preload, name="preload", daemon=True).start()
+
+    lengths = [str(length) for length in available_lengths()]
+    word_length = int(Prompt.ask("Word length", choices=lengths, default="5"))
+    mode = Prompt.ask("Mode", choices=list(MODES), default=NORMAL)
+    boards = int(Prompt.ask("Boards", choices=list(BOARD_COUNTS), default="1"))
+    adversarial = boards == 1 and Confirm.ask("Adversarial answer", default=False)
+
+    # pylint: disable=C0415
+    from src.wordall.adversary import AdversarialGame  # type: ignore
+    from src.wordall.board import BoardRenderer  # type: ignore
+    from src.wordall.candidates import get_candidate_pool  # type: ignore
+    from src.wordall.definitions import BackgroundDefinitions  # type: ignore
+    from src.wordall.dictionary import get_word_index  # type: ignore
+    from src.wordall.scheduler import DEFAULT_SEED, AnswerScheduler  # type: ignore
+    from src.wordall.stats import StatsAggregator, describe, stats_path  # type: ignore
+    from src.wordall.word_store import load_word_store  # type: ignore
+
+    # pylint: enable=C0415
+
+    word_store = load_word_store(word_length)
+    if boards > 1:
+        play_boards(boards, word_store, get_word_index(word_length), mode)
+        return
+    stats_file = stats_path(word_length)
+    stats = StatsAggregator.load(stats_file, len(word_store), word_store.digest)
+
+    # Game numbers count finished games, so answers only repeat once the list is exhausted
+    scheduler = AnswerScheduler(
+        len(word_store), os.environ.get("WORDALL_SEED", DEFAULT_SEED)
     )
-    word_list = [
-        word.upper()
-        for word in word_source.read_text(encoding="utf-8").strip().split("\n")
-    ]
-
-    chosen_word = random.choice(word_list)
-
-    game = GameTracker(chosen_word, int(word_size))
-
+    answer = scheduler[stats.player(0).played]
+    chosen_word = word_store[answer]
+    # Looked up while the game is played, so it is usually there once the game ends
+    definitions = BackgroundDefinitions()
+    if adversarial:
+        # The answer is only known once the game is over, too late to look it up
+        game = AdversarialGame(
+            get_candidate_pool(word_length), get_word_index(word_length), mode=mode
+        )
+    else:
+        definitions.request(chosen_word)
+        game = GameState(
+            chosen_word,
+            word_length,
+            dictionary=get_word_index(word_length),
+            candidate_pool=get_candidate_pool(word_length),
+            mode=mode,
+        )
+
+    renderer = BoardRenderer(console, definitions)
     finished: bool = False  # type: ignore
 
     while not finished:
         if game.remaining_guesses > 0:
-            next_guess = console.input("Enter your next guess:-> ").upper()
+            next_guess = console.input(
+                "Enter your next guess (? for a hint):-> "
+            ).upper()
+            if next_guess == "?":
+                # pylint: disable=C0415
+                from src.wordall.opening_book import get_opening_book  # type: ignore
+                from src.wordall.pattern_matrix import (  # type: ignore
+                    find_pattern_matrix,
+                )
+                from src.wordall.solver import best_guess  # type: ignore
+
+                # pylint: enable=C0415
+
+                book = get_opening_book(word_length)
+                # Building the matrix takes too long for a hint, so only one already built is used
+                matrix = find_pattern_matrix(get_candidate_pool(word_length).store)
+                hint = best_guess(game, time_budget=1.0, book=book, matrix=matrix)
+                console.print(f"Try {hint}")
+                continue
 
             try:
                 game.make_guess(next_guess)
-                show_results(game, console)
+                renderer.draw(game)
             except InvalidEntryError as iee:
                 console.print(iee)
+                continue
+            # Adversarial games are not scheduled, so they stay out of the statistics
+            if game.remaining_guesses == 0 and not adversarial:
+                stats.record(0, answer, game.guess_count, game.is_solved)
+                stats.save(stats_file, word_store.digest)
+                console.print("\n".join(describe(stats.player(0))), highlight=False)
         else:
             restart = console.input(" New game? (Y/N) -> ").upper()
             if restart == "Y":
+                renderer.reset()
                 refresh_display(console)
-                game.new_game(random.choice(word_list))
+                answer = scheduler[stats.player(0).played]
+                game.new_game(word_store[answer])
+                if not adversarial:
+                    definitions.request(game.word)
             else:
                 finished = True
+    definitions.close()
 
 
 if __name__ == "__main__":
-    main()
+    with instrument_from_env():
+        main()
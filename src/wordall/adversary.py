@@ -0,0 +1,88 @@
+"""
+Adversarial (Absurdle style) games: no answer is picked up front.  Each guess partitions the
+answers still possible by the feedback they would give it, and the game keeps the largest part,
+so the answer is only pinned down once a single word is left (or the guesses run out).
+"""
+
+from typing import Container
+
+import numpy as np
+
+from .candidates import CandidatePool, CandidateSet  # type: ignore
+from .constraints import NORMAL  # type: ignore
+from .game_state import GameState, validate_guess  # type: ignore
+from .instrumentation import timed  # type: ignore
+
+ADVERSARIAL_GUESSES = 8
+
+
+class AdversarialGame(GameState):
+    """
+    Game whose answer dodges the guesses.  Offers the ``GameState`` interface; ``word`` stays
+    empty until the possible answers collapse to one word or the game is lost.
+    """
+
+    __slots__ = ("_answers", "_codes")
+
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        candidate_pool: CandidatePool,
+        dictionary: Container[str] | None = None,
+        max_guesses: int = ADVERSARIAL_GUESSES,
+        mode: str = NORMAL,
+    ):
+        """
+        Starts a game
+        Args:
+            candidate_pool: shared pool of the possible answers
+            dictionary: Optional collection of valid words
+            max_guesses: number of guesses allowed
+            mode: ``"normal"``, ``"hard"`` or ``"strict"``
+        """
+        super().__init__(
+            None, candidate_pool.word_length, dictionary, None, max_guesses, mode
+        )
+        # Also the base class' candidates, which this game can never be without
+        self._answers: CandidateSet = candidate_pool.new_set()
+        self._candidates = self._answers
+        # Feedback code of each possible answer, reused by every guess of every game
+        self._codes = np.empty(len(candidate_pool), dtype=np.int64)
+
+    @timed("adversarial_guess")
+    def make_guess(self, guess: str):
+        """
+        Validates a guess and answers it with the feedback shared by most of the possible
+        answers
+        Args:
+            guess: the guess which the user has made currently
+        """
+        validate_guess(guess, self._word_length, self._dictionary, self._constraints)
+        if self.remaining_guesses < 1:
+            raise UserWarning("Unable to make any more guesses")
+        guess = guess.upper()
+        code = self._answers.dodge(guess, self._codes)
+        self._record(guess, code)
+        if len(self._answers) == 1 or self.remaining_guesses == 0:
+            # One of the answers left is as good as any other once the game is over
+            self._word = self._answers.words(1)[0]
+
+    def new_game(
+        self, word=None, word_length=None, dictionary=None, candidate_pool=None
+    ):
+        """
+        Starts over with every word of the pool possible again
+        Args:
+            word: ignored, the answer is never picked up front
+            word_length: ignored, the length is the pool's
+            dictionary: Optional replacement collection of valid words
+            candidate_pool: Optional replacement pool of possible answers
+        """
+        del word, word_length
+        pool = candidate_pool or self._answers.pool
+        # Resets the current answers, which are replaced below when the pool changes
+        super().new_game(None, pool.word_length, dictionary)
+        if candidate_pool is not None:
+            self._answers = candidate_pool.new_set()
+            self._candidates = self._answers
+        if len(self._codes) < len(pool):
+            self._codes = np.empty(len(pool), dtype=np.int64)
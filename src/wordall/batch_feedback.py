@@ -0,0 +1,211 @@
+"""
+Vectorized scoring of whole word lists against each other.  Produces the same base 3 feedback
+codes as ``feedback.TargetWord.score`` for every (guess, answer) pair, a block at a time, so that
+analytics over millions of pairs never go through per-word Python code
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from .feedback import POSITION_WEIGHTS  # type: ignore
+from .word_store import WordStore  # type: ignore
+
+# Upper bound on the number of (guess, answer) pairs scored at once.  Each pair needs a few bytes
+# per letter of scratch space, so this keeps peak memory in the tens of megabytes
+DEFAULT_BLOCK_PAIRS = 1 << 18
+
+
+def encode_words(words: Iterable[str]) -> np.ndarray:
+    """
+    Converts words into letter indexes (A = 0 ... Z = 25)
+    Args:
+        words: upper-case words which all share the same length
+
+    Returns:
+        uint8 array of shape (number of words, word length)
+    """
+    words = list(words)
+    word_length = len(words[0]) if words else 0
+    packed = "".join(words).encode("ascii")
+    letters = np.frombuffer(packed, dtype=np.uint8) - ord("A")
+    return letters.reshape(len(words), word_length)
+
+
+def store_letters(store: WordStore) -> np.ndarray:
+    """
+    Converts a compiled word store into letter indexes without decoding any words
+    Args:
+        store: memory-mapped word store
+
+    Returns:
+        uint8 array of shape (number of words, word length)
+    """
+    raw = np.frombuffer(store.buffer, dtype=np.uint8)
+    return (raw - ord("A")).reshape(len(store), store.word_length)
+
+
+def feedback_dtype(word_length: int) -> np.dtype:
+    """
+    Finds the smallest unsigned type able to hold every feedback code for a word length
+    Args:
+        word_length: number of letters in the words
+
+    Returns:
+        uint8 for words of up to five letters, uint16 up to ten letters, uint32 otherwise
+    """
+    largest_code = 3**word_length - 1
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if largest_code <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError(f"Words of {word_length} letters are too long to score")
+
+
+def letter_counts(words: np.ndarray) -> np.ndarray:
+    """
+    Counts how many times each letter appears in each word
+    Args:
+        words: uint8 letter array of shape (N, L)
+
+    Returns:
+        uint8 array of shape (26, N) holding the count of each letter in each word
+    """
+    alphabet = np.arange(26, dtype=np.uint8)
+    counts = (words[:, :, None] == alphabet).sum(axis=1, dtype=np.uint8)
+    return np.ascontiguousarray(counts.T)
+
+
+def score_block(
+    guesses: np.ndarray, answers: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Scores every guess against every answer in one vectorized pass.  A guess letter which does
+    not match in place is a "word member" hint when the answer holds more copies of the letter
+    than are claimed by exact matches plus earlier copies in the guess, which gives the same
+    duplicate letter treatment as ``feedback.TargetWord.score``.
+    Args:
+        guesses: uint8 letter array of shape (G, L)
+        answers: uint8 letter array of shape (A, L)
+        out: optional (G, A) array to write the codes into
+
+    Returns:
+        (G, A) array of base 3 feedback codes
+    """
+    word_length = guesses.shape[1]
+    if out is None:
+        out = np.empty((len(guesses), len(answers)), feedback_dtype(word_length))
+    code_type = np.promote_types(out.dtype, np.uint16)
+    answer_counts = letter_counts(answers)
+    matched = guesses[:, None, :] == answers[None, :, :]
+    codes = np.zeros(out.shape, code_type)
+    claimed = np.empty(out.shape, np.uint8)
+    for position in range(word_length):
+        same_letter = guesses == guesses[:, position, None]
+        # Copies claimed before this one: every earlier copy in the guess, plus later copies
+        # which match in place
+        claimed[...] = same_letter[:, :position].sum(axis=1, dtype=np.uint8)[:, None]
+        for later in range(position + 1, word_length):
+            claimed += same_letter[:, later, None] & matched[:, :, later]
+        hinted = answer_counts[guesses[:, position]] > claimed
+        codes += np.where(
+            matched[:, :, position],
+            code_type.type(2 * POSITION_WEIGHTS[position]),
+            hinted * code_type.type(POSITION_WEIGHTS[position]),
+        )
+    out[...] = codes
+    return out
+
+
+def score_against(
+    guess: np.ndarray,
+    answers: np.ndarray,
+    answer_counts: np.ndarray | None = None,
+    *,
+    guess_counts: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Scores a single guess against many answers, e.g. the boards of a multi-board game or the
+    candidates of an adversarial game.  Which guess letters repeat only depends on the guess,
+    so it is worked out in Python and the answers go through a fixed handful of array
+    operations, plus a couple per repeated letter.
+    Args:
+        guess: uint8 letter array of shape (L,)
+        answers: uint8 letter array of shape (A, L)
+        answer_counts: optional ``letter_counts(answers)``, for callers scoring many guesses
+            against the same answers
+        guess_counts: optional (L, A) count of the letter at each position of the guess in
+            each answer, which is all of ``answer_counts`` that is used
+        out: optional (A,) int64 array to write the codes to
+
+    Returns:
+        (A,) int64 array of base 3 feedback codes
+    """
+    if guess_counts is None:
+        if answer_counts is None:
+            answer_counts = letter_counts(answers)
+        guess_counts = answer_counts[guess]
+    letters = guess.tolist()
+    word_length = len(letters)
+    # Copies of a letter are claimed by the answer's copies in guess order, except that copies
+    # matching in place claim theirs first: position p loses its hint to the copies before it
+    # and to the later copies which match
+    earlier = [letters[:p].count(letter) for p, letter in enumerate(letters)]
+    matched = answers == guess
+    hinted = guess_counts.T > np.array(earlier, dtype=np.uint8)
+    for position, letter in enumerate(letters):
+        later = [
+            other
+            for other in range(position + 1, word_length)
+            if letters[other] == letter
+        ]
+        if later:
+            claimed = matched[:, later].sum(axis=1, dtype=np.uint8)
+            claimed += earlier[position]
+            hinted[:, position] = guess_counts[position] > claimed
+    digits = np.add(matched, matched, dtype=np.uint8)
+    # A matched position is never also a member hint
+    digits += hinted > matched
+    return np.matmul(
+        digits, np.array(POSITION_WEIGHTS[:word_length], dtype=np.int64), out=out
+    )
+
+
+def score_matrix(
+    guesses: np.ndarray,
+    answers: np.ndarray,
+    out: np.ndarray,
+    block_pairs: int = DEFAULT_BLOCK_PAIRS,
+) -> np.ndarray:
+    """
+    Fills a caller supplied matrix with the feedback code of every (guess, answer) pair,
+    working through it in blocks of at most ``block_pairs`` pairs to bound peak memory
+    Args:
+        guesses: uint8 letter array of shape (G, L)
+        answers: uint8 letter array of shape (A, L)
+        out: (G, A) uint8 / uint16 array (or memory map) which receives the codes
+        block_pairs: maximum number of pairs scored at once
+
+    Returns:
+        The filled ``out`` matrix
+    """
+    if out.shape != (len(guesses), len(answers)):
+        raise ValueError(
+            f"Output of shape {out.shape} cannot hold {len(guesses)} x {len(answers)} codes"
+        )
+    if np.iinfo(out.dtype).max < 3 ** guesses.shape[1] - 1:
+        raise ValueError(
+            f"{out.dtype} is too small for {guesses.shape[1]} letter codes"
+        )
+    answer_step = min(len(answers), block_pairs) or 1
+    guess_step = max(1, block_pairs // answer_step)
+    for guess_start in range(0, len(guesses), guess_step):
+        guess_end = guess_start + guess_step
+        for answer_start in range(0, len(answers), answer_step):
+            answer_end = answer_start + answer_step
+            score_block(
+                guesses[guess_start:guess_end],
+                answers[answer_start:answer_end],
+                out[guess_start:guess_end, answer_start:answer_end],
+            )
+    return out
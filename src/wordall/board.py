@@ -0,0 +1,180 @@
+"""
+Incremental renderer for the game board.  Each line of the board is rendered to terminal output
+once and cached: a guess line once the guess is final, a keyboard row per combination of letter
+statuses.  Redrawing after a guess then only rewrites the screen lines which changed, instead of
+clearing the screen and re-parsing the markup of the whole board
+"""
+
+from rich.console import Console, JustifyMethod
+from rich.control import Control
+from rich.segment import ControlType
+from rich.text import Text
+
+from .instrumentation import timed  # type: ignore
+from .utilities import (  # type: ignore
+    HEADER,
+    QWERTY_BOTTOM,
+    QWERTY_MIDDLE,
+    QWERTY_TOP,
+    keyboard_character_format,
+    show_results_footer,
+    style_feedback,
+)
+
+KEYBOARD_ROWS = (QWERTY_TOP, QWERTY_MIDDLE, QWERTY_BOTTOM)
+ERASE_LINE = str(Control((ControlType.ERASE_IN_LINE, 0)))
+ERASE_BELOW = "\x1b[J"
+
+
+class BoardRenderer:  # pylint: disable=R0902
+    """
+    Draws the board of a game on a console, keeping what was drawn last so the next draw only
+    rewrites changed lines.  One renderer is meant to serve every game played on the console.
+    """
+
+    def __init__(self, console: Console, definitions=None):
+        """
+        Prepares an empty cache for the console
+        Args:
+            console: Rich Console the board is drawn on
+            definitions: Optional ``BackgroundDefinitions`` to show the definition of the word
+                from once a game is over
+        """
+        self.console = console
+        self.definitions = definitions
+        self._header: list[str] | None = None
+        self._guess_lines: dict[tuple[str, int], list[str]] = {}
+        self._blank_lines: dict[int, list[str]] = {}
+        self._status_lines: dict[bool, list[str]] = {}
+        self._keys: dict[tuple[str, int], str] = {}
+        self._keyboard_rows: dict[tuple[str, tuple], list[str]] = {}
+        self._frame: list[str] | None = None
+        self.bytes_written = 0
+
+    def _render(
+        self, renderable, justify: JustifyMethod | None = "center"
+    ) -> list[str]:
+        """Renders to the console's output, one string per screen line"""
+        with self.console.capture() as capture:
+            self.console.print(renderable, justify=justify)
+        return capture.get().splitlines()
+
+    def _guess_line(self, guess: str, code: int) -> list[str]:
+        """A final guess never changes, so it is rendered once"""
+        key = (guess, code)
+        if key not in self._guess_lines:
+            self._guess_lines[key] = self._render(
+                Text.from_markup(style_feedback(guess, code))
+            )
+        return self._guess_lines[key]
+
+    def _blank_line(self, word_size: int) -> list[str]:
+        """Placeholder for a guess which has not been made yet"""
+        if word_size not in self._blank_lines:
+            self._blank_lines[word_size] = self._render(
+                Text.from_markup(f"[dim]{'_' * word_size}[/]")
+            )
+        return self._blank_lines[word_size]
+
+    def _key(self, char: str, status: int) -> str:
+        """Styled output of one keyboard letter, cached by its status"""
+        key = (char, status)
+        if key not in self._keys:
+            used_letters = {char: status} if status else {}
+            with self.console.capture() as capture:
+                self.console.print(
+                    Text.from_markup(keyboard_character_format(char, used_letters)),
+                    end="",
+                )
+            self._keys[key] = capture.get()
+        return self._keys[key]
+
+    def _keyboard_row(self, row: str, used_letters: dict) -> list[str]:
+        """
+        Keyboard rows are cached by the status of each of their letters and assembled from the
+        cached letters, centred the same way as ``show_keyboard`` does
+        """
+        statuses = tuple(used_letters.get(char, 0) for char in row)
+        key = (row, statuses)
+        if key not in self._keyboard_rows:
+            keys = " ".join(map(self._key, row, statuses))
+            margin = self.console.width - (2 * len(row) - 1)
+            left = margin // 2
+            self._keyboard_rows[key] = [f"{' ' * left}{keys}{' ' * (margin - left)}"]
+        return self._keyboard_rows[key]
+
+    def frame(self, game) -> list[str]:
+        """
+        Renders the board of a game, mostly out of the cache
+        Args:
+            game: the running game (``GameTracker`` or ``GameState``)
+
+        Returns:
+            the terminal output of each screen line of the board
+        """
+        if self._header is None:
+            with self.console.capture() as capture:
+                self.console.rule(Text.from_markup(HEADER, emoji=False))
+            self._header = capture.get().splitlines()
+        lines = list(self._header)
+        solved = game.is_solved
+        if solved not in self._status_lines:
+            # Kept as an empty line once solved, so the lines below do not move
+            self._status_lines[solved] = self._render(
+                "" if solved else "[center] Try again [/]", None
+            )
+        lines += self._status_lines[solved]
+        guesses = game.guesses
+        feedback = game.feedback
+        for idx in range(game.max_guesses):
+            if idx < len(guesses):
+                lines += self._guess_line(guesses[idx], feedback[idx])
+            else:
+                lines += self._blank_line(game.word_size)
+        used_letters = game.char_tracker
+        for row in KEYBOARD_ROWS:
+            lines += self._keyboard_row(row, used_letters)
+        with self.console.capture() as capture:
+            show_results_footer(game, self.console, self.definitions)
+        return lines + capture.get().splitlines()
+
+    @timed("draw_board")
+    def draw(self, game):
+        """
+        Brings the screen up to date with the game.  On a terminal only the lines which differ
+        from the last draw are rewritten, and anything printed below the board since (prompts,
+        errors, hints) is erased.  Elsewhere the whole board is written out.
+        Args:
+            game: the running game (``GameTracker`` or ``GameState``)
+        """
+        frame = self.frame(game)
+        if not self.console.is_terminal:
+            self._write("\n".join(frame) + "\n")
+            return
+        if self._frame is None:
+            self._write(f"{Control.clear()}{Control.home()}")
+            previous: list[str] = []
+        else:
+            previous = self._frame
+        output = []
+        for row, line in enumerate(frame):
+            if row >= len(previous) or previous[row] != line:
+                output.append(f"{Control.move_to(0, row)}{line}{ERASE_LINE}")
+        output.append(f"{Control.move_to(0, len(frame))}{ERASE_BELOW}")
+        self._write("".join(output))
+        self._frame = frame
+
+    def reset(self):
+        """
+        Forgets what is on screen and the lines of the finished game, so the next draw starts
+        from a cleared screen
+        """
+        self._frame = None
+        self._guess_lines.clear()
+        self._keyboard_rows.clear()
+
+    def _write(self, output: str):
+        """Writes raw terminal output"""
+        self.bytes_written += len(output.encode("utf-8"))
+        self.console.file.write(output)
+        self.console.file.flush()
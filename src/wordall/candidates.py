@@ -0,0 +1,227 @@
+"""
+Tracks which answers are still consistent with every guess of a game, so that the number of
+remaining words and hints are available after each guess.  Each guess only filters the words
+which survived the guesses before it
+"""
+
+import random
+from functools import lru_cache
+
+import numpy as np
+
+from .batch_feedback import letter_counts, score_against, store_letters  # type: ignore
+from .feedback import feedback_digits  # type: ignore
+from .word_store import WordStore, load_word_store  # type: ignore
+
+
+class CandidatePool:
+    """
+    Read-only, encoded view of an answer list which is shared by every game of the same word
+    length.  Holds the letters of every word, plus the letter at each position and the letter
+    counts laid out so that one row covers all words.
+    """
+
+    __slots__ = ("store", "letters", "positions", "counts", "indices")
+
+    def __init__(self, store: WordStore):
+        """
+        Encodes the answer list
+        Args:
+            store: word store holding the possible answers
+        """
+        self.store = store
+        self.letters = store_letters(store)
+        # (L, N) and (26, N) so that each filter step walks one contiguous row
+        self.positions = np.ascontiguousarray(self.letters.T)
+        self.counts = letter_counts(self.letters)
+        self.indices = np.arange(len(store), dtype=np.int32)
+        for array in (self.letters, self.positions, self.counts, self.indices):
+            array.flags.writeable = False
+
+    @property
+    def word_length(self) -> int:
+        """
+        Accessor for the number of letters in each word of the pool
+        Returns:
+            The word length
+        """
+        return self.store.word_length
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def new_set(self) -> "CandidateSet":
+        """
+        Creates the per-game candidate set over this pool
+        Returns:
+            A candidate set holding every word of the pool
+        """
+        return CandidateSet(self)
+
+
+class CandidateSet:
+    """
+    The answers of a pool which are still possible in one game.  Survivors are kept compacted
+    in a buffer of pool indexes, which is only allocated by the first guess: until then the
+    pool's own index array stands in for it, so idle games cost next to nothing.  The buffer
+    is kept across resets, so later games of the same set do not allocate it again.
+    """
+
+    __slots__ = ("pool", "_buffer", "_survivors", "_count")
+
+    def __init__(self, pool: CandidatePool):
+        """
+        Starts with every word of the pool
+        Args:
+            pool: shared pool of possible answers
+        """
+        self.pool = pool
+        self._buffer: np.ndarray | None = None
+        self._survivors = pool.indices
+        self._count = len(pool)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        Accessor for the pool indexes of the surviving words
+        Returns:
+            view over the survivors, in pool order
+        """
+        return self._survivors[: self._count]
+
+    def reset(self):
+        """
+        Makes every word of the pool possible again, refilling the survivor buffer in place
+        """
+        if self._buffer is not None:
+            self._buffer[:] = self.pool.indices
+            self._survivors = self._buffer
+        self._count = len(self.pool)
+
+    def update(self, guess: str, code: int) -> int:
+        """
+        Drops the survivors which would not have produced the given feedback for the guess.  A
+        word produces the same feedback exactly when it has the matched letters in place, lacks
+        the other guessed letters in their positions, and holds at least as many of each guessed
+        letter as were matched or hinted (exactly as many when a copy scored no match).
+        Args:
+            guess: upper-case guess
+            code: base 3 feedback code the guess received
+
+        Returns:
+            number of words which remain possible
+        """
+        keep = np.ones(self._count, dtype=bool)
+        found: dict[int, int] = {}
+        exhausted = set()
+        for position, (letter, digit) in enumerate(
+            zip(guess.upper(), feedback_digits(code, len(guess)))
+        ):
+            letter_index = ord(letter) - ord("A")
+            letters = self._survivor_values(self.pool.positions[position])
+            if digit == 2:
+                keep &= letters == letter_index
+            else:
+                keep &= letters != letter_index
+            if digit:
+                found[letter_index] = found.get(letter_index, 0) + 1
+            else:
+                exhausted.add(letter_index)
+                found.setdefault(letter_index, 0)
+
+        for letter_index, minimum in found.items():
+            counts = self._survivor_values(self.pool.counts[letter_index])
+            if letter_index in exhausted:
+                keep &= counts == minimum
+            else:
+                keep &= counts >= minimum
+
+        return self._keep(keep)
+
+    def dodge(self, guess: str, codes: np.ndarray) -> int:
+        """
+        Answers a guess the way an adversary would: the survivors are partitioned by the
+        feedback the guess would get from each of them and only the largest part is kept, ties
+        going to the lowest code (the least revealing feedback).  The codes are counted with
+        one ``bincount`` rather than grouped into per-code containers.
+        Args:
+            guess: upper-case guess
+            codes: int64 scratch array holding at least one code per word of the pool, reused
+                from guess to guess
+
+        Returns:
+            the feedback code of the part kept
+        """
+        letters = np.frombuffer(guess.encode("ascii"), dtype=np.uint8) - ord("A")
+        # Only the counts of the guessed letters are needed, one (L, N) row gather
+        guess_counts = self.pool.counts[letters]
+        answers = self.pool.letters
+        if self._count != len(self.pool):
+            answers = answers[self.indices]
+            guess_counts = guess_counts[:, self.indices]
+        survivor_codes = codes[: self._count]
+        score_against(letters, answers, guess_counts=guess_counts, out=survivor_codes)
+        buckets = np.bincount(survivor_codes, minlength=3 ** len(guess))
+        code = int(buckets.argmax())
+        self._keep(survivor_codes == code)
+        return code
+
+    def _keep(self, keep: np.ndarray) -> int:
+        """Compacts the survivors flagged in ``keep``, returning how many there are"""
+        if self._buffer is None:
+            self._buffer = np.empty_like(self.pool.indices)
+        count = int(np.count_nonzero(keep))
+        np.compress(keep, self.indices, out=self._buffer[:count])
+        self._survivors = self._buffer
+        self._count = count
+        return count
+
+    def _survivor_values(self, row: np.ndarray) -> np.ndarray:
+        """
+        Picks the entries of a pool row (one value per word) which belong to survivors.  Until
+        the first guess every word survives, so the shared row is used as is.
+        """
+        return row if self._count == len(self.pool) else row[self.indices]
+
+    def words(self, limit: int | None = None) -> list[str]:
+        """
+        Decodes the surviving words
+        Args:
+            limit: optional maximum number of words to return
+
+        Returns:
+            list of the surviving words in pool order
+        """
+        store = self.pool.store
+        return [store[int(index)] for index in self.indices[:limit]]
+
+    def hint(self, rng: random.Random | None = None) -> str | None:
+        """
+        Picks one of the surviving words
+        Args:
+            rng: Optional random generator to use instead of the module level one
+
+        Returns:
+            a word which is still possible, or None when no word is left
+        """
+        if not self._count:
+            return None
+        return self.pool.store[
+            int(self.indices[(rng or random).randrange(self._count)])
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_candidate_pool(word_length: int) -> CandidatePool:
+    """
+    Process wide accessor for the pool of the shipped word list of a given length
+    Args:
+        word_length: Number of letters in each word of the list
+
+    Returns:
+        The shared pool for the word length
+    """
+    return CandidatePool(load_word_store(word_length))
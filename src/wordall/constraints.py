@@ -0,0 +1,126 @@
+"""
+Hard mode rules.  What the feedback so far has revealed is kept as one bitmask of allowed letters
+per position plus minimum and maximum counts per letter, updated once per guess, so checking a
+guess costs a few integer operations per letter instead of replaying every earlier guess.
+
+In hard mode a guess must keep every green letter in place and contain every revealed letter at
+least as often as it has been revealed.  Strict mode also rejects letters in positions where
+they are known not to be, and more copies of a letter than the word holds (including any copy of
+a gray letter).
+"""
+
+NORMAL, HARD, STRICT = "normal", "hard", "strict"
+MODES = (NORMAL, HARD, STRICT)
+ALL_LETTERS = (1 << 26) - 1
+ORDINALS = ("1st", "2nd", "3rd") + tuple(f"{position}th" for position in range(4, 33))
+
+
+class LetterConstraints:
+    """
+    Incrementally maintained constraints of one game in hard or strict mode
+    """
+
+    __slots__ = ("word_length", "strict", "_masks", "_min_counts", "_max_counts")
+
+    def __init__(self, word_length: int, strict: bool = False):
+        """
+        Creates constraints which allow any guess
+        Args:
+            word_length: number of letters in the word
+            strict: whether to also enforce what is known not to be in the word
+        """
+        self.word_length = word_length
+        self.strict = strict
+        # Bit ``n`` of the mask of a position is set while letter ``n`` (A = 0) may be played
+        # there
+        self._masks = [ALL_LETTERS] * word_length
+        # Letters with a known minimum or maximum count, as {letter index: count}
+        self._min_counts: dict[int, int] = {}
+        self._max_counts: dict[int, int] = {}
+
+    def reset(self):
+        """
+        Forgets everything revealed, for a new game of the same length
+        """
+        self._masks = [ALL_LETTERS] * self.word_length
+        self._min_counts.clear()
+        self._max_counts.clear()
+
+    def update(self, guess: str, code: int):
+        """
+        Narrows the constraints with the feedback of a guess
+        Args:
+            guess: the upper-case guess
+            code: its base 3 feedback code
+        """
+        revealed: dict[int, int] = {}
+        grays = []
+        masks = self._masks
+        for position, char in enumerate(guess):
+            code, digit = divmod(code, 3)
+            letter = ord(char) - 65
+            if digit == 2:
+                masks[position] = 1 << letter
+            elif digit == 1 and self.strict:
+                masks[position] &= ~(1 << letter)
+            if digit:
+                revealed[letter] = revealed.get(letter, 0) + 1
+            else:
+                grays.append((position, letter))
+        for letter, count in revealed.items():
+            if count > self._min_counts.get(letter, 0):
+                self._min_counts[letter] = count
+        if not self.strict:
+            return
+        for position, letter in grays:
+            # A gray copy means the word holds exactly as many as were revealed alongside it
+            count = revealed.get(letter, 0)
+            self._max_counts[letter] = count
+            if count:
+                masks[position] &= ~(1 << letter)
+            else:
+                for other, mask in enumerate(masks):
+                    masks[other] = mask & ~(1 << letter)
+
+    def violation(self, guess: str) -> str | None:
+        """
+        Finds the first rule of the mode which a guess breaks
+        Args:
+            guess: the upper-case guess, already validated as letters of the right length
+
+        Returns:
+            message describing the broken rule, or None when the guess may be played
+        """
+        for position, char in enumerate(guess):
+            letter = ord(char) - 65
+            mask = self._masks[position]
+            if not mask >> letter & 1:
+                if mask & (mask - 1) == 0:
+                    green = chr(64 + mask.bit_length())
+                    return f"{ORDINALS[position]} letter must be {green}"
+                if self._max_counts.get(letter) == 0:
+                    return f"{char} is not in the word"
+                return f"{char} is not the {ORDINALS[position]} letter"
+        for letter, count in self._min_counts.items():
+            if guess.count(chr(65 + letter)) < count:
+                copies = f"{count} copies of " if count > 1 else ""
+                return f"Guess must contain {copies}{chr(65 + letter)}"
+        for letter, count in self._max_counts.items():
+            if count and guess.count(chr(65 + letter)) > count:
+                return f"The word holds only {count} {chr(65 + letter)}"
+        return None
+
+
+def constraints_for(mode: str, word_length: int) -> LetterConstraints | None:
+    """
+    Creates the constraints a mode needs
+    Args:
+        mode: one of ``MODES``
+        word_length: number of letters in the word
+
+    Returns:
+        the constraints, or None in normal mode
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    return None if mode == NORMAL else LetterConstraints(word_length, mode == STRICT)
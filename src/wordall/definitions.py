@@ -0,0 +1,313 @@
+"""
+Looks up the definition of answers on the Free Dictionary API so it can be shown once a game
+ends.  Lookups share one connection-pooled ``httpx.AsyncClient``, concurrent lookups of the same
+word share one request, and results are kept in a bounded in-memory LRU backed by a per-word
+file cache on disk which expires after a time to live.  ``BackgroundDefinitions`` runs the
+service on its own thread so the game loop only ever reads what has already arrived.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Iterable
+
+import httpx
+
+from .word_store import CACHE_DIR  # type: ignore
+
+DEFAULT_API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/"
+DEFAULT_TTL = 7 * 24 * 3600.0
+DEFINITIONS_DIR = CACHE_DIR / "definitions"
+# Marks a word the API has no definition for, so it is not asked again until it expires
+NOT_FOUND = ""
+
+
+def parse_definition(payload) -> str | None:
+    """
+    Picks the first definition out of an API response
+    Args:
+        payload: decoded JSON body of an entries response
+
+    Returns:
+        the definition prefixed by its part of speech, or None when the response holds none
+    """
+    for entry in payload if isinstance(payload, list) else []:
+        for meaning in entry.get("meanings", []):
+            for definition in meaning.get("definitions", []):
+                if definition.get("definition"):
+                    part = meaning.get("partOfSpeech")
+                    prefix = f"({part}) " if part else ""
+                    return f"{prefix}{definition['definition']}"
+    return None
+
+
+class DefinitionCache:
+    """
+    Bounded LRU of definitions in front of a directory holding one small JSON file per word.
+    Safe to read from one thread while another thread fills it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = DEFINITIONS_DIR,
+        max_entries: int = 1024,
+        ttl: float = DEFAULT_TTL,
+    ):
+        """
+        Creates the cache
+        Args:
+            cache_dir: directory of the on-disk cache, or None to only cache in memory
+            max_entries: number of words kept in memory
+            ttl: seconds after which a stored definition is looked up again
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, word: str) -> Path:
+        """File caching a word; words are validated as plain letters before getting here"""
+        # Memory-only caches never get here
+        assert self.cache_dir is not None
+        return self.cache_dir / f"{word}.json"
+
+    def get(self, word: str, disk: bool = True) -> str | None:
+        """
+        Finds a definition which has not expired
+        Args:
+            word: upper-case word
+            disk: whether to fall back to the on-disk cache
+
+        Returns:
+            the definition, ``NOT_FOUND`` when the API had none, or None when nothing is cached
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(word)
+            if entry is not None:
+                if now - entry[1] < self.ttl:
+                    self._memory.move_to_end(word)
+                    return entry[0]
+                del self._memory[word]
+        if not disk or self.cache_dir is None:
+            return None
+        try:
+            stored = json.loads(self._path(word).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if now - stored["fetched"] >= self.ttl:
+            return None
+        self._remember(word, stored["definition"], stored["fetched"])
+        return stored["definition"]
+
+    def put(self, word: str, definition: str):
+        """
+        Stores a definition in memory and on disk
+        Args:
+            word: upper-case word
+            definition: the definition, or ``NOT_FOUND``
+        """
+        fetched = time.time()
+        self._remember(word, definition, fetched)
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(word)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(
+            json.dumps({"definition": definition, "fetched": fetched}), encoding="utf-8"
+        )
+        os.replace(temp_path, path)
+
+    def _remember(self, word: str, definition: str, fetched: float):
+        """Adds to the in-memory LRU, dropping the least recently used beyond the bound"""
+        with self._lock:
+            self._memory[word] = (definition, fetched)
+            self._memory.move_to_end(word)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+class DefinitionService:
+    """
+    Asynchronous definition lookups.  Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        cache: DefinitionCache | None = None,
+        base_url: str = DEFAULT_API_URL,
+        max_connections: int = 8,
+        timeout: float = 5.0,
+    ):
+        """
+        Creates the service; the HTTP client is created on first use
+        Args:
+            cache: definition cache, defaults to one over the shared cache directory
+            base_url: URL the word is appended to
+            max_connections: size of the connection pool
+            timeout: seconds before a request is abandoned
+        """
+        self.cache = cache or DefinitionCache()
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.requests = 0
+        self._client: httpx.AsyncClient | None = None
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Accessor for the shared, connection-pooled client
+        Returns:
+            the client
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def lookup(self, word: str) -> str | None:
+        """
+        Finds the definition of a word, from the cache when possible.  Concurrent lookups of the
+        same word wait for a single request.
+        Args:
+            word: the word to define
+
+        Returns:
+            the definition, or None when the API has none or could not be reached
+        """
+        word = word.upper()
+        if not word.isascii() or not word.isalpha():
+            return None
+        definition = self.cache.get(word)
+        if definition is None:
+            pending = self._in_flight.get(word)
+            if pending is None:
+                pending = asyncio.ensure_future(self._fetch(word))
+                self._in_flight[word] = pending
+                pending.add_done_callback(lambda _: self._in_flight.pop(word, None))
+            definition = await asyncio.shield(pending)
+        return definition or None
+
+    async def _fetch(self, word: str) -> str | None:
+        """Requests a definition, caching answers but not failures"""
+        self.requests += 1
+        try:
+            response = await self.client.get(f"{self.base_url}{word.lower()}")
+        except httpx.HTTPError:
+            return None
+        if response.status_code == 404:
+            definition = NOT_FOUND
+        elif response.is_success:
+            try:
+                definition = parse_definition(response.json()) or NOT_FOUND
+            except ValueError:
+                return None
+        else:
+            return None
+        self.cache.put(word, definition)
+        return definition
+
+    async def prewarm(self, words: Iterable[str], concurrency: int = 8) -> int:
+        """
+        Fills the cache for upcoming answers
+        Args:
+            words: the words to look up
+            concurrency: maximum number of lookups at once
+
+        Returns:
+            number of words which now have a definition
+        """
+        limit = asyncio.Semaphore(concurrency)
+
+        async def bounded(word):
+            async with limit:
+                return await self.lookup(word)
+
+        found = await asyncio.gather(*(bounded(word) for word in words))
+        return sum(definition is not None for definition in found)
+
+    async def aclose(self):
+        """
+        Closes the pooled connections
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class BackgroundDefinitions:
+    """
+    Runs a ``DefinitionService`` on an event loop in a daemon thread, so that synchronous code
+    (the console game) can ask for definitions ahead of time and read them without waiting
+    """
+
+    def __init__(self, service: DefinitionService | None = None):
+        """
+        Starts the background thread
+        Args:
+            service: the service to run, defaults to one over the shared cache
+        """
+        self.service = service or DefinitionService()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="definitions", daemon=True
+        )
+        self._thread.start()
+
+    def request(self, word: str) -> Future:
+        """
+        Starts looking a word up, typically as soon as it becomes the answer
+        Args:
+            word: the word to define
+
+        Returns:
+            future of the definition, which callers are free to ignore
+        """
+        return asyncio.run_coroutine_threadsafe(self.service.lookup(word), self._loop)
+
+    def prewarm(self, words: Iterable[str]) -> Future:
+        """
+        Starts filling the cache for upcoming answers
+        Args:
+            words: the words to look up
+
+        Returns:
+            future of the number of words defined
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.service.prewarm(list(words)), self._loop
+        )
+
+    def get(self, word: str) -> str | None:
+        """
+        Reads a definition which has already arrived, never waiting on the network or disk
+        Args:
+            word: the word to define
+
+        Returns:
+            the definition, or None when it is unknown or still on its way
+        """
+        return self.service.cache.get(word.upper(), disk=False) or None
+
+    def close(self):
+        """
+        Closes the client and stops the background thread
+        """
+        asyncio.run_coroutine_threadsafe(self.service.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,68 @@
+"""
+Houses the dictionary index used to decide whether a guess is a real word.  One index is built
+per word length, lazily, and shared by every game running in the process
+"""
+
+from functools import lru_cache
+from typing import Iterable
+
+from .instrumentation import timed  # type: ignore
+from .word_store import WordStore, load_word_store  # type: ignore
+
+
+class WordIndex:
+    """
+    Constant time membership index over the words of a single length.  Any container of
+    upper-case words may be handed to a ``GameTracker`` in its place.
+    """
+
+    __slots__ = ("word_length", "_words")
+
+    def __init__(self, words: Iterable[str], word_length: int):
+        """
+        Builds the index
+        Args:
+            words: The words which count as valid guesses
+            word_length: Number of letters in every word of the index
+        """
+        self.word_length = word_length
+        self._words = frozenset(word.upper() for word in words)
+
+    @classmethod
+    @timed("index_words")
+    def from_store(cls, store: WordStore) -> "WordIndex":
+        """
+        Builds an index from a compiled word store, slicing the packed words directly rather
+        than decoding them one at a time
+        Args:
+            store: memory-mapped word store to index
+
+        Returns:
+            Index holding every word in the store
+        """
+        packed = store.buffer.tobytes().decode("ascii")
+        length = store.word_length
+        bounds = zip(
+            range(0, len(packed), length), range(length, len(packed) + 1, length)
+        )
+        return cls((packed[start:end] for start, end in bounds), length)
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and word.upper() in self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+
+@lru_cache(maxsize=None)
+def get_word_index(word_length: int) -> WordIndex:
+    """
+    Process wide accessor for the index of a given word length.  Nothing is loaded until the
+    first call for that length, so a five letter game never pays for the six letter list.
+    Args:
+        word_length: Number of letters in the words of the index
+
+    Returns:
+        The shared index for the word length
+    """
+    return WordIndex.from_store(load_word_store(word_length))
@@ -0,0 +1,396 @@
+"""
+Durable record of game sessions.  Every session event (new game, guess, end) is appended to the
+current segment file as a fixed size binary record and fsync is batched over many records.
+Snapshots hold every live session as of the start of a segment, so recovery loads the latest
+snapshot and only replays the segments written after it.
+"""
+
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Container, Iterable, NamedTuple
+
+import numpy as np
+
+from .game_state import GameState  # type: ignore
+from .word_store import WordStore, load_word_store  # type: ignore
+
+LOG_MAGIC = b"WLOG"
+LOG_VERSION = 1
+# magic, format version, record size
+SEGMENT_HEADER = struct.Struct("<4sHH")
+# session id, guess as 5 bit letters, answer index, feedback code, word length, kind, turn
+RECORD_BODY = struct.Struct("<QQIIBBBx")
+CHECKSUM = struct.Struct("<I")
+RECORD_SIZE = RECORD_BODY.size + CHECKSUM.size
+RECORD_TYPE = np.dtype(
+    [
+        ("session", "<u8"),
+        ("guess", "<u8"),
+        ("answer", "<u4"),
+        ("code", "<u4"),
+        ("word_length", "u1"),
+        ("kind", "u1"),
+        ("turn", "u1"),
+        ("pad", "u1"),
+        ("checksum", "<u4"),
+    ]
+)
+KIND_NEW, KIND_GUESS, KIND_END = 0, 1, 2
+SNAPSHOT_TURNS = 8
+SNAPSHOT_TYPE = np.dtype(
+    [
+        ("session", "<u8"),
+        ("answer", "<u4"),
+        ("word_length", "u1"),
+        ("turns", "u1"),
+        ("guesses", "<u8", (SNAPSHOT_TURNS,)),
+        ("codes", "<u4", (SNAPSHOT_TURNS,)),
+    ]
+)
+DEFAULT_SEGMENT_BYTES = 64 << 20
+MAX_PACKED_LETTERS = 12
+LETTER_SHIFTS = np.arange(0, 5 * MAX_PACKED_LETTERS, 5, dtype=np.uint64)
+
+
+def pack_letters(word: str) -> int:
+    """
+    Packs a word of up to 12 letters into an integer, 5 bits per letter with A as 1
+    Args:
+        word: the word
+
+    Returns:
+        the packed word, 0 for an empty word
+    """
+    packed = 0
+    for char in reversed(word.upper()):
+        packed = packed << 5 | (ord(char) - 64)
+    return packed
+
+
+def unpack_letters(packed: int) -> str:
+    """
+    Reverses ``pack_letters``
+    Args:
+        packed: the packed word
+
+    Returns:
+        the upper-case word
+    """
+    chars = []
+    while packed:
+        chars.append(chr(64 + (packed & 31)))
+        packed >>= 5
+    return "".join(chars)
+
+
+def unpack_column(packed: np.ndarray) -> np.ndarray:
+    """
+    Reverses ``pack_letters`` for a whole array of packed words at once
+    Args:
+        packed: array of packed words, of any shape
+
+    Returns:
+        array of upper-case words of the same shape
+    """
+    letters = (packed[..., None] >> LETTER_SHIFTS) & np.uint64(31)
+    letters = np.where(letters != 0, letters + np.uint64(64), letters).astype(np.uint8)
+    return (
+        np.ascontiguousarray(letters).view(f"S{MAX_PACKED_LETTERS}")[..., 0].astype(str)
+    )
+
+
+class SessionHistory(NamedTuple):
+    """
+    Everything needed to rebuild a session: its answer (by index into the word list of its
+    length) and the guesses made with their feedback
+    """
+
+    answer: int
+    word_length: int
+    guesses: list[str]
+    feedback: list[int]
+
+
+def _segment_path(directory: Path, sequence: int) -> Path:
+    """Path of the segment with the given sequence number"""
+    return directory / f"segment_{sequence:08d}.log"
+
+
+def _snapshot_path(directory: Path, sequence: int) -> Path:
+    """Path of the snapshot taken at the start of the given segment"""
+    return directory / f"snapshot_{sequence:08d}.npy"
+
+
+def _sequences(directory: Path, prefix: str) -> list[int]:
+    """Sequence numbers of the segments or snapshots in a directory, in order"""
+    return sorted(
+        int(path.stem.split("_")[1])
+        for path in directory.glob(f"{prefix}_*")
+        if not path.name.endswith(".tmp")
+    )
+
+
+class EventLog:  # pylint: disable=R0902
+    """
+    Appends session events to segment files.  A new segment is started whenever the log is
+    opened, so a segment whose tail was torn by a crash is never written to again.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        sync_every: int = 256,
+        sync_interval: float = 0.05,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ):
+        """
+        Opens the log for appending
+        Args:
+            directory: directory holding the segments and snapshots
+            sync_every: number of records after which they are written and fsynced
+            sync_interval: seconds after which pending records are written and fsynced by the
+                next append (or ``sync_if_due``)
+            segment_bytes: size at which a new segment is started
+        """
+        self.directory = directory
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.segment_bytes = segment_bytes
+        directory.mkdir(parents=True, exist_ok=True)
+        existing = _sequences(directory, "segment") + _sequences(directory, "snapshot")
+        self.sequence = max(existing, default=-1)
+        self._file = None
+        self._written = 0
+        self._buffer = bytearray()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self.records_since_snapshot = 0
+        self._roll()
+
+    def _roll(self):
+        """Starts the next segment"""
+        if self._file is not None:
+            self._file.close()
+        self.sequence += 1
+        self._file = _segment_path(self.directory, self.sequence).open("xb")
+        self._file.write(SEGMENT_HEADER.pack(LOG_MAGIC, LOG_VERSION, RECORD_SIZE))
+        self._written = SEGMENT_HEADER.size
+
+    def append(  # pylint: disable=R0913,R0917
+        self,
+        session: int,
+        kind: int,
+        word_length: int,
+        answer: int,
+        guess: str = "",
+        code: int = 0,
+        turn: int = 0,
+    ):
+        """
+        Adds one event.  It is durable once the batch it belongs to has been synced.
+        Args:
+            session: session id
+            kind: ``KIND_NEW``, ``KIND_GUESS`` or ``KIND_END``
+            word_length: number of letters in the answer
+            answer: index of the answer in the word list of its length
+            guess: the guess, for guess events
+            code: the guess' feedback code
+            turn: the guess' position in the game, starting at 0
+        """
+        body = RECORD_BODY.pack(
+            session, pack_letters(guess), answer, code, word_length, kind, turn
+        )
+        self._buffer += body
+        self._buffer += CHECKSUM.pack(zlib.crc32(body))
+        self._pending += 1
+        self.records_since_snapshot += 1
+        if self._pending >= self.sync_every:
+            self.sync()
+        else:
+            self.sync_if_due()
+
+    def sync_if_due(self):
+        """
+        Syncs pending records once they have waited for the sync interval
+        """
+        if self._pending and time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self):
+        """
+        Writes and fsyncs every pending record
+        """
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._written += len(self._buffer)
+            self._buffer.clear()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        if self._written >= self.segment_bytes:
+            self._roll()
+
+    def snapshot(self, sessions: Iterable[tuple[int, SessionHistory]]) -> Path:
+        """
+        Records the state of every live session, then drops the segments and snapshots which it
+        makes redundant.  The sessions must reflect every event appended so far.
+        Args:
+            sessions: pairs of session id and history
+
+        Returns:
+            Path of the snapshot
+        """
+        self.sync()
+        self._roll()
+        entries = list(sessions)
+        table = np.zeros(len(entries), dtype=SNAPSHOT_TYPE)
+        table["session"] = [session for session, _ in entries]
+        table["answer"] = [history.answer for _, history in entries]
+        table["word_length"] = [history.word_length for _, history in entries]
+        turns = np.array(
+            [len(history.guesses) for _, history in entries], dtype=np.intp
+        )
+        table["turns"] = turns
+        # Row and turn of every guess, so each column is filled by one assignment
+        rows = np.repeat(np.arange(len(entries)), turns)
+        columns = np.arange(len(rows)) - np.repeat(np.cumsum(turns) - turns, turns)
+        table["guesses"][rows, columns] = [
+            pack_letters(guess) for _, history in entries for guess in history.guesses
+        ]
+        table["codes"][rows, columns] = [
+            code for _, history in entries for code in history.feedback
+        ]
+        path = _snapshot_path(self.directory, self.sequence)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temp_path.open("wb") as snapshot_file:
+            np.save(snapshot_file, table)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temp_path, path)
+        for sequence in _sequences(self.directory, "segment"):
+            if sequence < self.sequence:
+                _segment_path(self.directory, sequence).unlink(missing_ok=True)
+        for sequence in _sequences(self.directory, "snapshot"):
+            if sequence < self.sequence:
+                _snapshot_path(self.directory, sequence).unlink(missing_ok=True)
+        self.records_since_snapshot = 0
+        return path
+
+    def close(self):
+        """
+        Syncs and closes the current segment
+        """
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+
+def read_segment(path: Path) -> np.ndarray:
+    """
+    Reads the records of a segment, stopping at the first damaged one (a tail torn by a crash)
+    Args:
+        path: the segment file
+
+    Returns:
+        array of ``RECORD_TYPE`` records
+    """
+    raw = path.read_bytes()
+    if len(raw) < SEGMENT_HEADER.size:
+        return np.zeros(0, dtype=RECORD_TYPE)
+    magic, version, record_size = SEGMENT_HEADER.unpack_from(raw)
+    if magic != LOG_MAGIC or version != LOG_VERSION or record_size != RECORD_SIZE:
+        raise ValueError(
+            f"{path.name} is not a version {LOG_VERSION} event log segment"
+        )
+    count = (len(raw) - SEGMENT_HEADER.size) // RECORD_SIZE
+    view = memoryview(raw)
+    for index in range(count):
+        start = SEGMENT_HEADER.size + index * RECORD_SIZE
+        body_end = start + RECORD_BODY.size
+        if zlib.crc32(view[start:body_end]) != CHECKSUM.unpack_from(raw, body_end)[0]:
+            count = index
+            break
+    return np.frombuffer(raw, RECORD_TYPE, count, SEGMENT_HEADER.size)
+
+
+def load_histories(directory: Path) -> dict[int, SessionHistory]:
+    """
+    Recovers every live session from the latest snapshot and the segments after it
+    Args:
+        directory: directory holding the segments and snapshots
+
+    Returns:
+        histories by session id
+    """
+    histories: dict[int, SessionHistory] = {}
+    snapshots = _sequences(directory, "snapshot")
+    first_segment = snapshots[-1] if snapshots else 0
+    if snapshots:
+        table = np.load(_snapshot_path(directory, first_segment))
+        for session, answer, word_length, turns, guesses, codes in zip(
+            table["session"].tolist(),
+            table["answer"].tolist(),
+            table["word_length"].tolist(),
+            table["turns"].tolist(),
+            unpack_column(table["guesses"]).tolist(),
+            table["codes"].tolist(),
+        ):
+            histories[session] = SessionHistory(
+                answer, word_length, guesses[:turns], codes[:turns]
+            )
+    for sequence in _sequences(directory, "segment"):
+        if sequence < first_segment:
+            continue
+        _replay(histories, read_segment(_segment_path(directory, sequence)))
+    return histories
+
+
+def _replay(histories: dict[int, SessionHistory], records: np.ndarray):
+    """Applies the records of a segment to the session histories"""
+    for session, guess, answer, code, word_length, kind in zip(
+        records["session"].tolist(),
+        unpack_column(records["guess"]).tolist(),
+        records["answer"].tolist(),
+        records["code"].tolist(),
+        records["word_length"].tolist(),
+        records["kind"].tolist(),
+    ):
+        if kind == KIND_NEW:
+            histories[session] = SessionHistory(answer, word_length, [], [])
+        elif kind == KIND_GUESS and session in histories:
+            histories[session].guesses.append(guess)
+            histories[session].feedback.append(code)
+        elif kind == KIND_END:
+            histories.pop(session, None)
+
+
+def load_sessions(
+    directory: Path,
+    stores: Callable[[int], WordStore] = load_word_store,
+    dictionaries: Callable[[int], Container[str]] | None = None,
+) -> dict[int, GameState]:
+    """
+    Rebuilds the games of every live session in bulk
+    Args:
+        directory: directory holding the segments and snapshots
+        stores: gives the word list of a word length, which answer indexes refer to
+        dictionaries: optionally gives the collection of valid guesses of a word length
+
+    Returns:
+        games by session id
+    """
+    return {
+        session: GameState.from_history(
+            stores(history.word_length)[history.answer],
+            history.word_length,
+            history.guesses,
+            history.feedback,
+            dictionary=dictionaries(history.word_length) if dictionaries else None,
+        )
+        for session, history in load_histories(directory).items()
+    }
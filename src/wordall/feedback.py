@@ -0,0 +1,147 @@
+"""
+Houses the single scoring core which turns a guess into per-letter feedback.  Both the game
+tracker and the display consume the compact feedback code produced here so that they can never
+disagree on how duplicate letters are treated
+"""
+
+from enum import IntEnum
+from functools import lru_cache
+
+
+class GuessStatus(IntEnum):
+    """
+    Enum to support matching guesses to selected words
+    """
+
+    NO_MATCH = 1
+    WORD_MEMBER = 2
+    MATCH = 3
+
+
+# Status for each base 3 feedback digit: 0 (no match), 1 (word member), 2 (match)
+DIGIT_STATUSES = (GuessStatus.NO_MATCH, GuessStatus.WORD_MEMBER, GuessStatus.MATCH)
+MAX_WORD_LENGTH = 32
+POSITION_WEIGHTS = tuple(3**position for position in range(MAX_WORD_LENGTH))
+
+
+class TargetWord:  # pylint: disable=R0903
+    """
+    A target word with its letter counts computed once, so that each guess against it is scored
+    by walking the guess without rescanning the target or allocating per letter.  Words are
+    expected to be ASCII.
+    """
+
+    __slots__ = ("word", "_counts", "_remaining")
+
+    def __init__(self, word: str):
+        """
+        Precomputes the letter counts for the target
+        Args:
+            word: The word which guesses will be scored against
+        """
+        self.word = word
+        self._counts = bytearray(128)
+        for letter in word:
+            self._counts[ord(letter)] += 1
+        # Scratch copy of the counts, reused by every call to score
+        self._remaining = bytearray(128)
+
+    def score(self, guess: str) -> int:
+        """
+        Scores a guess against the target.  Exact matches claim their letter first, then the
+        remaining occurrences of each letter are handed out as "word member" hints from left to
+        right, which is how duplicate letters are treated in the original game.
+        Args:
+            guess: guess of the same length as the target
+
+        Returns:
+            base 3 feedback code where the digit for position ``i`` (weight ``3 ** i``) is 2 for a
+                match, 1 for a letter found elsewhere in the word and 0 otherwise
+        """
+        remaining = self._remaining
+        remaining[:] = self._counts
+        code = 0
+        unmatched = 0
+        for position, (gletter, wletter) in enumerate(zip(guess, self.word)):
+            if gletter == wletter:
+                code += 2 * POSITION_WEIGHTS[position]
+                remaining[ord(gletter)] -= 1
+            else:
+                unmatched |= 1 << position
+        position = 0
+        while unmatched:
+            if unmatched & 1:
+                letter = ord(guess[position])
+                if remaining[letter]:
+                    remaining[letter] -= 1
+                    code += POSITION_WEIGHTS[position]
+            unmatched >>= 1
+            position += 1
+        return code
+
+
+@lru_cache(maxsize=1024)
+def target_word(word: str) -> TargetWord:
+    """
+    Shared, cached ``TargetWord`` for callers which only have the plain word
+    Args:
+        word: The target word
+
+    Returns:
+        The precomputed target
+    """
+    return TargetWord(word)
+
+
+def score_guess(guess: str, word: str) -> int:
+    """
+    Scores a guess against a target word
+    Args:
+        guess: The guess made by the user
+        word: The word the user is trying to find
+
+    Returns:
+        base 3 feedback code as described in ``TargetWord.score``
+    """
+    return target_word(word).score(guess)
+
+
+def solved_code(word_length: int) -> int:
+    """
+    Feedback code of a guess which matches the target in every position
+    Args:
+        word_length: number of letters in the word
+
+    Returns:
+        the all-match feedback code
+    """
+    return 3**word_length - 1
+
+
+def feedback_digits(code: int, word_length: int) -> bytes:
+    """
+    Splits a feedback code back into one digit per position
+    Args:
+        code: base 3 feedback code
+        word_length: number of letters in the word
+
+    Returns:
+        bytes with the 0 / 1 / 2 digit of each position
+    """
+    digits = bytearray(word_length)
+    for position in range(word_length):
+        code, digits[position] = divmod(code, 3)
+    return bytes(digits)
+
+
+def feedback_statuses(code: int, word_length: int) -> tuple[GuessStatus, ...]:
+    """
+    Converts a feedback code into the status of each letter of the guess
+    Args:
+        code: base 3 feedback code
+        word_length: number of letters in the word
+
+    Returns:
+        tuple holding the ``GuessStatus`` of every position
+    """
+    return tuple(DIGIT_STATUSES[digit] for digit in feedback_digits(code, word_length))
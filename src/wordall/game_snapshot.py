@@ -0,0 +1,67 @@
+"""
+Serialization boundary for game sessions.  Games are held as slotted ``GameState`` objects and
+only turned into a pydantic model when they are saved, sent or restored
+"""
+
+from typing import Container
+
+from pydantic import BaseModel
+
+from .constraints import NORMAL  # type: ignore
+from .game_state import GameState  # type: ignore
+
+
+class GameSnapshot(BaseModel):
+    """
+    Serializable record of a game: enough to replay it into a fresh ``GameState``
+    """
+
+    word: str
+    word_size: int = 5
+    max_guesses: int = 6
+    guesses: list[str] = []
+    mode: str = NORMAL
+
+    @classmethod
+    def from_state(cls, state) -> "GameSnapshot":
+        """
+        Captures a game
+        Args:
+            state: a ``GameState`` (or anything offering the same interface, e.g. a
+                ``GameTracker``)
+
+        Returns:
+            the snapshot
+        """
+        return cls(
+            word=state.word,
+            word_size=state.word_size,
+            max_guesses=state.max_guesses,
+            guesses=state.guesses,
+            mode=state.mode,
+        )
+
+    def to_state(
+        self, dictionary: Container[str] | None = None, candidate_pool=None
+    ) -> GameState:
+        """
+        Restores the game by replaying its guesses, so that restored feedback and candidates
+        can not disagree with the rules
+        Args:
+            dictionary: Optional collection of valid words
+            candidate_pool: Optional shared ``CandidatePool`` of possible answers
+
+        Returns:
+            the restored game
+        """
+        state = GameState(
+            self.word,
+            self.word_size,
+            dictionary=dictionary,
+            candidate_pool=candidate_pool,
+            max_guesses=self.max_guesses,
+            mode=self.mode,
+        )
+        for guess in self.guesses:
+            state.make_guess(guess)
+        return state
@@ -0,0 +1,359 @@
+"""
+Compact, slotted representation of a running Wordall game for callers which hold many games at
+once (servers, simulations).  It offers the same interface as ``GameTracker`` without pydantic:
+guesses are packed into one byte string, feedback codes into an ``array`` and the best status of
+each letter into a 26 byte table.  Conversion to and from a serializable model lives in
+``game_snapshot``
+"""
+
+import string
+from array import array
+from typing import Container
+
+from .constraints import (  # type: ignore
+    HARD,
+    NORMAL,
+    STRICT,
+    LetterConstraints,
+    constraints_for,
+)
+from .feedback import DIGIT_STATUSES, GuessStatus, solved_code, target_word  # type: ignore
+from .instrumentation import timed  # type: ignore
+
+ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
+class InvalidEntryError(ValueError):
+    """
+    Representation of an error condition when the input which the user has made is invalid with
+    respect to the rules of the game.
+    """
+
+
+def validate_guess(
+    guess: str,
+    word_size: int,
+    dictionary: Container[str] | None,
+    constraints: LetterConstraints | None = None,
+):
+    """
+    Checks a guess against the rules of the game, before it is scored
+    Args:
+        guess: the guess which the user has made
+        word_size: number of letters in the target word
+        dictionary: optional collection of valid words
+        constraints: optional hard mode constraints revealed so far
+
+    Raises:
+        InvalidEntryError: when the guess may not be played
+    """
+    if not ASCII_LETTERS.issuperset(guess):
+        raise InvalidEntryError(
+            "your guess can only contain values from the english alphabet. Try again."
+        )
+    if len(guess) != word_size:
+        raise InvalidEntryError(
+            f"Your guess can be no more or less than {word_size} characters. Try again."
+        )
+    if dictionary is not None and guess not in dictionary:
+        raise InvalidEntryError(f"{guess} is not in the word list. Try again.")
+    violation = constraints.violation(guess.upper()) if constraints else None
+    if violation:
+        raise InvalidEntryError(f"{violation}. Try again.")
+
+
+class GameState:  # pylint: disable=R0902
+    """
+    Session state of one game.  Roughly 350 bytes per game, plus the shared target, dictionary
+    and candidate pool.
+    """
+
+    __slots__ = (
+        "max_guesses",
+        "_word",
+        "_word_length",
+        "_dictionary",
+        "_candidates",
+        "_guesses",
+        "_feedback",
+        "_letters",
+        "_constraints",
+    )
+
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        word: str | None,
+        word_length: int = 5,
+        dictionary: Container[str] | None = None,
+        candidate_pool=None,
+        max_guesses: int = 6,
+        mode: str = NORMAL,
+    ):
+        """
+        Starts a game
+        Args:
+            word: Word against which the game will run against
+            word_length: number of letters in the word
+            dictionary: Optional collection of valid words.  When given, guesses which are not
+                members are rejected
+            candidate_pool: Optional shared ``CandidatePool`` of possible answers.  When given,
+                the answers still consistent with every guess are tracked
+            max_guesses: number of guesses allowed
+            mode: ``"normal"``, ``"hard"`` (revealed letters must be reused) or ``"strict"``
+                (known absent letters are rejected as well)
+        """
+        self.max_guesses = max_guesses
+        self._word = word
+        self._word_length = word_length
+        self._dictionary = dictionary
+        self._candidates = candidate_pool.new_set() if candidate_pool else None
+        # Guesses back to back, ``word_length`` bytes each
+        self._guesses = bytearray()
+        self._feedback = array("I")
+        # Best ``GuessStatus`` seen so far for each letter A-Z, 0 while unused
+        self._letters = bytearray(26)
+        self._constraints = constraints_for(mode, word_length)
+
+    @classmethod
+    def from_history(  # pylint: disable=R0913
+        cls,
+        word: str,
+        word_length: int,
+        guesses: list[str],
+        feedback: list[int],
+        *,
+        dictionary: Container[str] | None = None,
+        candidate_pool=None,
+        mode: str = NORMAL,
+    ) -> "GameState":
+        """
+        Rebuilds a game from guesses which were already validated and scored, e.g. read back
+        from the event log, without validating or scoring them again
+        Args:
+            word: the answer
+            word_length: number of letters in the word
+            guesses: the guesses made, oldest first
+            feedback: the feedback code of each guess
+            dictionary: Optional collection of valid words for further guesses
+            candidate_pool: Optional shared ``CandidatePool`` of possible answers
+            mode: ``"normal"``, ``"hard"`` or ``"strict"``
+
+        Returns:
+            the game, ready for its next guess
+        """
+        state = cls(word, word_length, dictionary, candidate_pool, mode=mode)
+        for guess, code in zip(guesses, feedback):
+            state.apply_feedback(guess, code)
+        return state
+
+    @property
+    def word(self) -> str:
+        """
+        Accessor for the defined word to be used for the game
+        Returns:
+            Value of the word with which the given game session has been initialized
+        """
+        return self._word if self._word else ""
+
+    @property
+    def word_size(self) -> int:
+        """
+        Accessor for the configured size of the target word for the game
+        Returns:
+            Int value of size of the word with which the given game session has been initialized
+        """
+        return self._word_length
+
+    @property
+    def guess_count(self) -> int:
+        """
+        Number of guesses made so far, without decoding them
+        Returns:
+            the count
+        """
+        return len(self._feedback)
+
+    @property
+    def guesses(self) -> list[str]:
+        """
+        Decodes the guesses made so far
+        Returns:
+            list of the guesses, oldest first
+        """
+        size = self._word_length
+        packed = self._guesses.decode("ascii")
+        guesses = []
+        for start in range(0, len(packed), size):
+            end = start + size
+            guesses.append(packed[start:end])
+        return guesses
+
+    @property
+    def feedback(self) -> list[int]:
+        """
+        Accessor for the feedback codes of the guesses made so far
+        Returns:
+            list of base 3 feedback codes, oldest first
+        """
+        return self._feedback.tolist()
+
+    @property
+    def remaining_guesses(self) -> int:
+        """
+        Number of guesses which may still be made
+        Returns:
+            integer between 0 and max_guesses
+        """
+        return 0 if self.is_solved else self.max_guesses - len(self._feedback)
+
+    @property
+    def is_solved(self) -> bool:
+        """
+        Determines if the user guesses have successfully found the word.
+        Returns:
+            bool if the most recent guess matches to the target word.
+        """
+        return bool(self._feedback) and self._feedback[-1] == solved_code(
+            self._word_length
+        )
+
+    @timed("make_guess")
+    def make_guess(self, guess: str):
+        """
+        Validates, scores and records a guess
+        Args:
+            guess: the guess which the user has made currently
+        """
+        validate_guess(guess, self._word_length, self._dictionary, self._constraints)
+        if self.remaining_guesses < 1:
+            raise UserWarning("Unable to make any more guesses")
+
+        # Targets are shared between games of the same word rather than held by each game
+        # Without a word (after ``reset``), guesses score against the empty word
+        self.apply_feedback(guess, target_word(self.word).score(guess))
+
+    def apply_feedback(self, guess: str, code: int):
+        """
+        Records a guess which has already been validated and scored elsewhere, e.g. once for
+        many boards at a time or when replaying a log
+        Args:
+            guess: the guess
+            code: its base 3 feedback code against this game's word
+        """
+        self._record(guess, code)
+        if self._candidates is not None:
+            self._candidates.update(guess, code)
+
+    def _record(self, guess: str, code: int):
+        """Records a guess and its feedback, along with everything derived from them"""
+        self._guesses += guess.encode("ascii")
+        self._feedback.append(code)
+        letters = self._letters
+        for char in guess.upper():
+            remaining, digit = divmod(code, 3)
+            status = DIGIT_STATUSES[digit]
+            letter = ord(char) - 65
+            if status > letters[letter]:
+                letters[letter] = status
+            code = remaining
+        if self._constraints is not None:
+            self._constraints.update(guess.upper(), self._feedback[-1])
+
+    @property
+    def constraints(self) -> LetterConstraints | None:
+        """
+        Accessor for the letter rules revealed so far
+        Returns:
+            the constraints, or None in normal mode
+        """
+        return self._constraints
+
+    @property
+    def mode(self) -> str:
+        """
+        Accessor for the rules guesses are held to
+        Returns:
+            ``"normal"``, ``"hard"`` or ``"strict"``
+        """
+        if self._constraints is None:
+            return NORMAL
+        return STRICT if self._constraints.strict else HARD
+
+    @property
+    def char_tracker(self) -> dict[str, GuessStatus]:
+        """
+        Builds the map of the letters used so far to the best status each has earned
+        Returns:
+            dict keyed by upper-case letter
+        """
+        return {
+            chr(65 + letter): GuessStatus(status)
+            for letter, status in enumerate(self._letters)
+            if status
+        }
+
+    @property
+    def used_letters(self) -> dict[str, GuessStatus]:
+        """
+        Finds the unique list of letters used in all of the guesses
+        Returns:
+            map of the letters used so far to their best status
+        """
+        return self.char_tracker
+
+    def reset(self):
+        """
+        Wipes out the prior guesses and target word to be ready for a new game
+        """
+        self._word = None
+        self._guesses.clear()
+        del self._feedback[:]
+        self._letters[:] = bytes(26)
+        if self._constraints is not None:
+            self._constraints.reset()
+        if self._candidates is not None:
+            self._candidates.reset()
+
+    def new_game(self, word, word_length=None, dictionary=None, candidate_pool=None):
+        """
+        Re-initializes the current instance to accept new guesses against a new word.
+        Args:
+            word: The word that the user is trying to guess.
+            word_length: Optional new word length
+            dictionary: Optional replacement collection of valid words
+            candidate_pool: Optional replacement pool of possible answers
+        """
+        self.reset()
+        self._word = word
+        self._word_length = word_length or self._word_length
+        self._constraints = constraints_for(self.mode, self._word_length)
+        if dictionary is not None:
+            self._dictionary = dictionary
+        if candidate_pool is not None:
+            self._candidates = candidate_pool.new_set()
+
+    @property
+    def candidates(self):
+        """
+        Accessor for the answers still consistent with every guess so far
+        Returns:
+            the game's ``CandidateSet``, or None when the game is not tracking candidates
+        """
+        return self._candidates
+
+    @property
+    def remaining_candidates(self) -> int | None:
+        """
+        Number of answers still consistent with every guess so far
+        Returns:
+            count of possible answers, or None when the game is not tracking candidates
+        """
+        return None if self._candidates is None else len(self._candidates)
+
+    def hint(self) -> str | None:
+        """
+        Suggests a word which is still a possible answer
+        Returns:
+            a possible answer, or None when the game is not tracking candidates
+        """
+        return None if self._candidates is None else self._candidates.hint()
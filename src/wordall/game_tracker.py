@@ -1,28 +1,16 @@
 """Houses the class definition and logic for tracking and supporting a running Wordall game"""
 
-import string
 from collections import defaultdict
-from enum import IntEnum
-from typing import Any
+from typing import Any, Container
 
 from pydantic import BaseModel
 
+from .constraints import HARD, NORMAL, STRICT, constraints_for  # type: ignore
+from .feedback import DIGIT_STATUSES, GuessStatus, TargetWord  # type: ignore
+from .game_state import InvalidEntryError, validate_guess  # type: ignore
+from .instrumentation import timed  # type: ignore
 
-class GuessStatus(IntEnum):
-    """
-    Enum to support matching guesses to selected words
-    """
-
-    NO_MATCH = 1
-    WORD_MEMBER = 2
-    MATCH = 3
-
-
-class InvalidEntryError(ValueError):
-    """
-    Representation of an error condition when the input which the user has made is invalid with
-    respect to the rules of the game.
-    """
+__all__ = ["GameTracker", "GuessStatus", "InvalidEntryError"]
 
 
 class GameTracker(BaseModel):
@@ -33,19 +21,38 @@ class GameTracker(BaseModel):
 
     max_guesses: int = 6
     guesses: list = []
+    feedback: list = []
     char_tracker: dict = defaultdict()
 
-    def __init__(self, word, word_length=5, **data: Any):
+    def __init__(
+        self,
+        word,
+        word_length=5,
+        dictionary: Container[str] | None = None,
+        candidate_pool=None,
+        mode: str = NORMAL,
+        **data: Any,
+    ):
         """
         Constructor for the Wordle clone game
 
         Args:
             word: Word against which the game will run against
+            dictionary: Optional collection of valid words (e.g. a shared ``WordIndex``).  When
+                given, guesses which are not members are rejected
+            candidate_pool: Optional shared ``CandidatePool`` of possible answers.  When given,
+                the answers still consistent with every guess are tracked
+            mode: ``"normal"``, ``"hard"`` (revealed letters must be reused) or ``"strict"``
+                (known absent letters are rejected as well)
             **data:
         """
         super().__init__(**data)
         self._word = word
         self._word_length = word_length
+        self._dictionary = dictionary
+        self._target = TargetWord(word) if word else None
+        self._candidates = candidate_pool.new_set() if candidate_pool else None
+        self._constraints = constraints_for(mode, word_length)
 
     @property
     def word(self):
@@ -79,6 +86,7 @@ class GameTracker(BaseModel):
             else self.max_guesses - len(self.guesses)
         )
 
+    @timed("make_guess")
     def make_guess(self, guess: str):
         """
         Encapsulates the logic to update all relevant entities when a user makes a guess (i.e.
@@ -86,31 +94,36 @@ class GameTracker(BaseModel):
         Args:
             guess: the guess which the user has made currently
         """
-        if not all(alpha in string.ascii_letters for alpha in guess):
-            raise InvalidEntryError(
-                "your guess can only contain values from the english alphabet. "
-                "Try again."
-            )
-        if len(guess) != self.word_size:
-            raise InvalidEntryError(
-                f"Your guess can be no more or less than {self.word_size} "
-                f"characters. Try again."
-            )
+        validate_guess(guess, self.word_size, self._dictionary, self._constraints)
         if self.remaining_guesses < 1:
             raise UserWarning("Unable to make any more guesses")
 
+        # Without a word (after ``reset``), guesses score against the empty word
+        code = (self._target or TargetWord(self.word)).score(guess)
         self.guesses.append(guess)
-        for char, match in zip(guess, self.word):
-            if char == match:
-                self.char_tracker[char] = GuessStatus.MATCH
-            elif char in self.word:
-                if (
-                    char not in self.char_tracker.keys()
-                    or self.char_tracker[char] < GuessStatus.MATCH
-                ):
-                    self.char_tracker[char] = GuessStatus.WORD_MEMBER
-            else:
-                self.char_tracker[char] = GuessStatus.NO_MATCH
+        self.feedback.append(code)
+        # A letter keeps the best status it has earned in any guess so far.  Surplus copies of
+        # a letter score as no match, but always alongside a better scored copy in the guess
+        for char in guess:
+            code, digit = divmod(code, 3)
+            status = DIGIT_STATUSES[digit]
+            if status > self.char_tracker.get(char, 0):
+                self.char_tracker[char] = status
+        if self._candidates is not None:
+            self._candidates.update(guess, self.feedback[-1])
+        if self._constraints is not None:
+            self._constraints.update(guess.upper(), self.feedback[-1])
+
+    @property
+    def mode(self) -> str:
+        """
+        Accessor for the rules guesses are held to
+        Returns:
+            ``"normal"``, ``"hard"`` or ``"strict"``
+        """
+        if self._constraints is None:
+            return NORMAL
+        return STRICT if self._constraints.strict else HARD
 
     def reset(self):
         """
@@ -119,23 +132,40 @@ class GameTracker(BaseModel):
 
         """
         self._word = None
+        self._target = None
         self.guesses.clear()
+        self.feedback.clear()
         self.char_tracker.clear()
+        if self._candidates is not None:
+            self._candidates.reset()
+        if self._constraints is not None:
+            self._constraints.reset()
 
-    def new_game(self, word, word_length=None):
+    def new_game(self, word, word_length=None, dictionary=None, candidate_pool=None):
         """
         re-initializes the current instance to accept new guesses against a new word.
         Args:
             word_length:
             word: The word that the user is trying to guess.
+            dictionary: Optional replacement collection of valid words, e.g. when the word
+                length changes
+            candidate_pool: Optional replacement pool of possible answers, e.g. when the word
+                length changes
 
         Returns:
 
         """
         self.reset()
         self._word = word
+        self._target = TargetWord(word)
         if word_length:
             self._word_length = word_length
+        if dictionary is not None:
+            self._dictionary = dictionary
+        if candidate_pool is not None:
+            self._candidates = candidate_pool.new_set()
+        # Rebuilt for the (possibly new) word length, keeping the mode
+        self._constraints = constraints_for(self.mode, self._word_length)
 
     @property
     def is_solved(self) -> bool:
@@ -156,3 +186,29 @@ class GameTracker(BaseModel):
             set of all letters used so far
         """
         return self.char_tracker
+
+    @property
+    def candidates(self):
+        """
+        Accessor for the answers still consistent with every guess so far
+        Returns:
+            the game's ``CandidateSet``, or None when the game is not tracking candidates
+        """
+        return self._candidates
+
+    @property
+    def remaining_candidates(self) -> int | None:
+        """
+        Number of answers still consistent with every guess so far
+        Returns:
+            count of possible answers, or None when the game is not tracking candidates
+        """
+        return None if self._candidates is None else len(self._candidates)
+
+    def hint(self) -> str | None:
+        """
+        Suggests a word which is still a possible answer
+        Returns:
+            a possible answer, or None when the game is not tracking candidates
+        """
+        return None if self._candidates is None else self._candidates.hint()
@@ -0,0 +1,426 @@
+"""
+Timers, counters and latency histograms for the stages of a turn, plus opt-in profiling of one
+session.  Everything is off by default: an instrumented function then only pays for a wrapper
+call and one attribute check.  Metrics are turned on with ``WORDALL_METRICS`` (the file the
+Prometheus text dump is written to) and exported every ``WORDALL_METRICS_INTERVAL`` seconds,
+both to that file and as one structured loguru record per stage.  ``WORDALL_PROFILE`` names a
+file to profile the session into, with ``cProfile`` or, when ``WORDALL_PROFILER=sample``, a
+sampling profiler writing collapsed stacks for flame graph tools.
+
+loguru and cProfile are only imported once they are used, so none of this slows down startup.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+# Upper bounds of the histogram buckets in seconds: 1 us to ~16 s, doubling
+BUCKET_BOUNDS = tuple(1e-6 * 2**power for power in range(25))
+DEFAULT_EXPORT_INTERVAL = 10.0
+SAMPLE_INTERVAL = 0.005
+
+
+class Histogram:
+    """
+    Latency distribution over fixed, exponentially growing buckets, so recording a value costs
+    one binary search and quantiles are read back to within a factor of two
+    """
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        # One count per bound plus one for values above the last bound
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def clear(self):
+        """
+        Forgets every value recorded
+        """
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        """
+        Records a value
+        Args:
+            seconds: the value to record
+        """
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimates a quantile as the upper bound of the bucket it falls in
+        Args:
+            fraction: quantile between 0 and 1
+
+        Returns:
+            the estimate in seconds, 0 when nothing has been recorded
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class Metrics:
+    """
+    Process wide registry of counters and stage histograms.  Recording takes no lock, as one
+    would cost more than the value being recorded; the exporting thread only reads, and under
+    the GIL a lost update is the worst a race can do.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.counters: Counter[str] = Counter()
+        self.histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._exporter: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def enable(self):
+        """
+        Starts recording
+        """
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stops recording, keeping what was recorded so far
+        """
+        self.enabled = False
+
+    def reset(self):
+        """
+        Forgets everything recorded.  Histograms are cleared rather than dropped, since timed
+        functions hold on to theirs
+        """
+        with self._lock:
+            self.counters.clear()
+            for histogram in self.histograms.values():
+                histogram.clear()
+
+    def count(self, name: str, amount: int = 1):
+        """
+        Adds to a counter while enabled
+        Args:
+            name: the counter
+            amount: what to add
+        """
+        if self.enabled:
+            self.counters[name] += amount
+
+    def histogram(self, stage: str) -> Histogram:
+        """
+        Finds the histogram of a stage, creating it the first time
+        Args:
+            stage: name of the stage
+
+        Returns:
+            the histogram
+        """
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(stage, Histogram())
+        return histogram
+
+    def observe(self, stage: str, seconds: float):
+        """
+        Records the duration of a stage
+        Args:
+            stage: name of the stage
+            seconds: how long it took
+        """
+        self.histogram(stage).observe(seconds)
+
+    @contextmanager
+    def timer(self, stage: str):
+        """
+        Times the block it wraps while enabled
+        Args:
+            stage: name of the stage
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str):
+        """
+        Decorator timing every call of a function while enabled.  Calls which raise are timed
+        too and counted as ``<stage>_errors``
+        Args:
+            stage: name of the stage
+
+        Returns:
+            the decorator
+        """
+
+        def decorator(function):
+            # Looked up once, so the stage shows up in exports before its first call
+            histogram = self.histogram(stage)
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                except Exception:
+                    self.count(f"{stage}_errors")
+                    raise
+                finally:
+                    histogram.observe(time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    def prometheus_text(self) -> str:
+        """
+        Renders everything recorded in the Prometheus text exposition format
+        Returns:
+            the text
+        """
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(
+                (stage, list(histogram.counts), histogram.total, histogram.count)
+                for stage, histogram in self.histograms.items()
+                if histogram.count
+            )
+        lines = []
+        for name, value in counters:
+            lines += [
+                f"# TYPE wordall_{name}_total counter",
+                f"wordall_{name}_total {value}",
+            ]
+        if histograms:
+            lines.append("# TYPE wordall_stage_seconds histogram")
+        for stage, counts, total, count in histograms:
+            cumulative = 0
+            for bound, bucket in zip(BUCKET_BOUNDS + (float("inf"),), counts):
+                cumulative += bucket
+                upper = "+Inf" if bound == float("inf") else f"{bound:.6g}"
+                lines.append(
+                    f'wordall_stage_seconds_bucket{{stage="{stage}",le="{upper}"}} {cumulative}'
+                )
+            lines.append(f'wordall_stage_seconds_sum{{stage="{stage}"}} {total:.9g}')
+            lines.append(f'wordall_stage_seconds_count{{stage="{stage}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Path):
+        """
+        Writes the Prometheus text dump, replacing the previous one in one step
+        Args:
+            path: file to write
+        """
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp.write_text(self.prometheus_text(), encoding="utf-8")
+        os.replace(temp, path)
+
+    def log_records(self):
+        """
+        Emits one structured loguru record per stage, with its count and quantiles in
+        microseconds bound as extra fields
+        """
+        from loguru import logger  # pylint: disable=C0415
+
+        with self._lock:
+            stages = sorted(self.histograms.items())
+            counters = dict(self.counters)
+        for stage, histogram in stages:
+            if not histogram.count:
+                continue
+            logger.bind(
+                stage=stage,
+                count=histogram.count,
+                mean_us=round(histogram.total / histogram.count * 1e6, 1),
+                p50_us=round(histogram.quantile(0.5) * 1e6, 1),
+                p99_us=round(histogram.quantile(0.99) * 1e6, 1),
+                errors=counters.get(f"{stage}_errors", 0),
+            ).info("stage timings")
+
+    def export(self, path: Path | None = None):
+        """
+        Exports everything recorded so far
+        Args:
+            path: Optional file for the Prometheus text dump
+        """
+        if path is not None:
+            self.dump(path)
+        self.log_records()
+
+    def start_exporter(
+        self, path: Path | None = None, interval: float = DEFAULT_EXPORT_INTERVAL
+    ):
+        """
+        Exports in a background thread every ``interval`` seconds until ``stop_exporter``
+        Args:
+            path: Optional file for the Prometheus text dump
+            interval: seconds between exports
+        """
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                self.export(path)
+
+        self._exporter = threading.Thread(target=run, name="metrics", daemon=True)
+        self._exporter.start()
+
+    def stop_exporter(self):
+        """
+        Stops the background exports
+        """
+        if self._exporter is not None:
+            self._stop.set()
+            self._exporter.join()
+            self._exporter = None
+
+
+metrics = Metrics()
+timed = metrics.timed
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread at a fixed interval from a background thread.  Unlike
+    ``cProfile`` the profiled code runs at full speed, so timings keep their proportions.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, thread_id: int | None = None):
+        """
+        Prepares a profiler
+        Args:
+            interval: seconds between samples
+            thread_id: thread to sample, defaults to the calling thread
+        """
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    def _sample(self):
+        """Records the current stack of the profiled thread"""
+        frame = sys._current_frames().get(self.thread_id)  # pylint: disable=W0212
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{Path(code.co_filename).stem}:{code.co_qualname}")
+            frame = frame.f_back
+        if names:
+            self.stacks[";".join(reversed(names))] += 1
+
+    def start(self):
+        """
+        Starts sampling
+        """
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(self.interval):
+                self._sample()
+
+        self._sampler = threading.Thread(target=run, name="sampler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        """
+        Stops sampling
+        """
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+
+    def write(self, path: Path):
+        """
+        Writes the samples as collapsed stacks, one ``frame;frame;frame count`` line per stack
+        Args:
+            path: file to write
+        """
+        with path.open("w", encoding="utf-8") as output:
+            for stack, count in self.stacks.most_common():
+                output.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profile_session(path: Path, sampling: bool = False):
+    """
+    Profiles the block it wraps into a file
+    Args:
+        path: file for the ``pstats`` data, or the collapsed stacks when sampling
+        sampling: whether to use the sampling profiler rather than ``cProfile``
+    """
+    if sampling:
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            profiler.write(path)
+        return
+    import cProfile  # pylint: disable=C0415
+
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        profile.dump_stats(path)
+
+
+@contextmanager
+def instrument_from_env(environ=None):
+    """
+    Turns on the metrics and profiling asked for by the ``WORDALL_*`` environment variables
+    for the block it wraps, exporting once more at the end
+    Args:
+        environ: Optional mapping to read instead of ``os.environ``
+    """
+    environ = os.environ if environ is None else environ
+    metrics_path = environ.get("WORDALL_METRICS")
+    profile_path = environ.get("WORDALL_PROFILE")
+    if metrics_path:
+        metrics.enable()
+        interval = float(
+            environ.get("WORDALL_METRICS_INTERVAL", DEFAULT_EXPORT_INTERVAL)
+        )
+        metrics.start_exporter(Path(metrics_path), interval)
+    try:
+        if profile_path:
+            sampling = environ.get("WORDALL_PROFILER") == "sample"
+            with profile_session(Path(profile_path), sampling):
+                yield
+        else:
+            yield
+    finally:
+        if metrics_path:
+            metrics.stop_exporter()
+            metrics.export(Path(metrics_path))
+            metrics.disable()
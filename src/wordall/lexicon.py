@@ -0,0 +1,136 @@
+"""
+Splits a large source lexicon into one word list per length.  The source is read one line at a
+time and each accepted word is written straight to the list of its length, so only the distinct
+words seen so far (to drop duplicates) are held in memory, never the file.  The lists land in
+``LEXICON_DIR``, where ``word_store.word_source_path`` finds them, and each is compiled and
+loaded only when a game of its length asks for it.
+
+Run with ``python -m src.wordall.lexicon SOURCE``
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from .word_store import LEXICON_DIR  # type: ignore
+
+SHORTEST_WORD = 4
+LONGEST_WORD = 12
+
+
+class IngestSummary(NamedTuple):
+    """
+    Outcome of ingesting a lexicon
+    """
+
+    words: dict[int, int]
+    duplicates: int
+    rejected: int
+
+    @property
+    def total(self) -> int:
+        """
+        Number of words written over every length
+        Returns:
+            the count
+        """
+        return sum(self.words.values())
+
+
+def normalize(line: bytes) -> bytes | None:
+    """
+    Turns a line of a lexicon into a word
+    Args:
+        line: raw line, with or without its line ending
+
+    Returns:
+        the upper-case word, or None when the line is blank or not a single ASCII word
+    """
+    word = line.strip()
+    if not word.isalpha() or not word.isascii():
+        return None
+    return word.upper()
+
+
+def ingest_lexicon(
+    source: Path,
+    target_dir: Path = LEXICON_DIR,
+    min_length: int = SHORTEST_WORD,
+    max_length: int = LONGEST_WORD,
+) -> IngestSummary:
+    """
+    Streams a lexicon into ``words_<length>.txt`` lists, one per length.  A list is only
+    replaced once the whole source has been read, so readers never see a partial one.
+    Args:
+        source: text file with one word per line
+        target_dir: directory for the word lists
+        min_length: shortest word kept
+        max_length: longest word kept
+
+    Returns:
+        the words written per length and the lines dropped
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    seen: dict[int, set[bytes]] = {}
+    outputs = {}
+    duplicates = rejected = 0
+    try:
+        with source.open("rb") as lexicon:
+            for line in lexicon:
+                word = normalize(line)
+                if word is None or not min_length <= len(word) <= max_length:
+                    # Blank lines are layout, not rejected words
+                    rejected += bool(line.strip())
+                    continue
+                words = seen.setdefault(len(word), set())
+                if word in words:
+                    duplicates += 1
+                    continue
+                words.add(word)
+                if len(word) not in outputs:
+                    temp = target_dir / f"words_{len(word)}.txt.{os.getpid()}.tmp"
+                    outputs[len(word)] = temp.open("wb")
+                outputs[len(word)].write(word + b"\n")
+    except BaseException:
+        for output in outputs.values():
+            output.close()
+            Path(output.name).unlink()
+        raise
+    for length, output in outputs.items():
+        output.close()
+        os.replace(output.name, target_dir / f"words_{length}.txt")
+    return IngestSummary(
+        {length: len(seen[length]) for length in sorted(seen)}, duplicates, rejected
+    )
+
+
+def main(arguments: list[str] | None = None) -> IngestSummary:
+    """
+    Command line entry point
+    Args:
+        arguments: command line arguments, defaults to ``sys.argv``
+
+    Returns:
+        summary of the ingest
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("source", type=Path, help="lexicon, one word per line")
+    parser.add_argument("--target", type=Path, default=LEXICON_DIR)
+    parser.add_argument("--min-length", type=int, default=SHORTEST_WORD)
+    parser.add_argument("--max-length", type=int, default=LONGEST_WORD)
+    options = parser.parse_args(arguments)
+
+    summary = ingest_lexicon(
+        options.source, options.target, options.min_length, options.max_length
+    )
+    for length, count in summary.words.items():
+        print(f"{length:>2} letters  {count}")
+    print(f"duplicates  {summary.duplicates}")
+    print(f"rejected    {summary.rejected}")
+    return summary
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
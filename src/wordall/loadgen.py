@@ -0,0 +1,222 @@
+"""
+Load generator for the game server.  Opens a number of concurrent connections which each play
+games to completion with random dictionary words, and reports guess latency percentiles plus
+session throughput.  Without ``--host`` a server is started in the same process on a free port,
+so nothing outside this repository is needed.
+
+Run with ``python -m src.wordall.loadgen --help``
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from .server import GameServer, SessionStore  # type: ignore
+from .word_store import load_word_store  # type: ignore
+
+
+class LoadReport(NamedTuple):
+    """
+    Outcome of a load run
+    """
+
+    sessions: int
+    guesses: int
+    errors: int
+    seconds: float
+    cpu_seconds: float
+    latencies: np.ndarray
+
+    def percentile(self, share: float) -> float:
+        """
+        Guess latency at a percentile
+        Args:
+            share: the percentile, between 0 and 100
+
+        Returns:
+            latency in seconds, 0 when no guess was timed
+        """
+        return float(np.percentile(self.latencies, share)) if self.guesses else 0.0
+
+    @property
+    def sessions_per_second(self) -> float:
+        """
+        Games played to completion per second of wall clock time
+        Returns:
+            the rate
+        """
+        return self.sessions / self.seconds if self.seconds else 0.0
+
+    @property
+    def sessions_per_cpu_second(self) -> float:
+        """
+        Games played per second of CPU time used by this process, i.e. per core.  Covers the
+        server and the clients when both run in this process
+        Returns:
+            the rate
+        """
+        return self.sessions / self.cpu_seconds if self.cpu_seconds else 0.0
+
+
+async def play_connection(  # pylint: disable=R0913,R0914,R0917
+    host: str,
+    port: int,
+    games: int,
+    word_length: int,
+    rng: random.Random,
+    latencies: list[float],
+) -> tuple[int, int]:
+    """
+    Plays games one after the other over a single connection
+    Args:
+        host: server address
+        port: server port
+        games: number of games to play
+        word_length: letters per word
+        rng: picks the guesses
+        latencies: receives the round trip time, in seconds, of every guess
+
+    Returns:
+        tuple of the number of games completed and the number of error responses
+    """
+    words = load_word_store(word_length)
+    reader, writer = await asyncio.open_connection(host, port)
+    completed = errors = 0
+    try:
+        for _ in range(games):
+            writer.write(f"NEW {word_length}\n".encode())
+            response = (await reader.readline()).split()
+            if response[0] != b"OK":
+                errors += 1
+                continue
+            session_id = response[1].decode()
+            status = b"PLAYING"
+            while status == b"PLAYING":
+                start = time.perf_counter()
+                writer.write(f"GUESS {session_id} {words.choice(rng)}\n".encode())
+                response = (await reader.readline()).split()
+                latencies.append(time.perf_counter() - start)
+                if response[0] != b"OK":
+                    errors += 1
+                    break
+                status = response[3]
+            writer.write(f"END {session_id}\n".encode())
+            await reader.readline()
+            completed += 1
+        writer.write(b"QUIT\n")
+        await writer.drain()
+    finally:
+        writer.close()
+    return completed, errors
+
+
+async def run_load(  # pylint: disable=R0913
+    host: str,
+    port: int,
+    *,
+    connections: int = 100,
+    games: int = 10,
+    word_length: int = 5,
+    seed: int | None = None,
+) -> LoadReport:
+    """
+    Runs concurrent connections against a server
+    Args:
+        host: server address
+        port: server port
+        connections: number of concurrent connections
+        games: games played per connection
+        word_length: letters per word
+        seed: seed for the guesses
+
+    Returns:
+        the report
+    """
+    latencies: list[float] = []
+    start, cpu_start = time.perf_counter(), time.process_time()
+    results = await asyncio.gather(
+        *(
+            play_connection(
+                host,
+                port,
+                games,
+                word_length,
+                random.Random(None if seed is None else seed + connection),
+                latencies,
+            )
+            for connection in range(connections)
+        )
+    )
+    return LoadReport(
+        sum(completed for completed, _ in results),
+        len(latencies),
+        sum(errors for _, errors in results),
+        time.perf_counter() - start,
+        time.process_time() - cpu_start,
+        np.array(latencies),
+    )
+
+
+async def run_local(**options) -> LoadReport:
+    """
+    Starts a server in this process on a free port and runs the load against it
+    Args:
+        **options: keyword arguments of ``run_load``
+
+    Returns:
+        the report
+    """
+    game_server = GameServer(SessionStore())
+    server = await game_server.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with server:
+            return await run_load("127.0.0.1", port, **options)
+    finally:
+        game_server.stop_sweeping()
+
+
+def main(arguments: list[str] | None = None) -> LoadReport:
+    """
+    Command line entry point
+    Args:
+        arguments: command line arguments, defaults to ``sys.argv``
+
+    Returns:
+        the report
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--host", help="server address (default: in-process server)")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--games", type=int, default=10, help="games per connection")
+    parser.add_argument("--length", type=int, default=5, help="letters per word")
+    parser.add_argument("--seed", type=int)
+    options = parser.parse_args(arguments)
+    load = {
+        "connections": options.connections,
+        "games": options.games,
+        "word_length": options.length,
+        "seed": options.seed,
+    }
+    if options.host:
+        report = asyncio.run(run_load(options.host, options.port, **load))
+    else:
+        report = asyncio.run(run_local(**load))
+
+    print(f"sessions           {report.sessions} ({report.errors} errors)")
+    print(f"guesses            {report.guesses}")
+    print(f"p50 guess latency  {report.percentile(50) * 1e3:.3f} ms")
+    print(f"p99 guess latency  {report.percentile(99) * 1e3:.3f} ms")
+    print(f"sessions/second    {report.sessions_per_second:.0f}")
+    print(f"sessions/cpu-sec   {report.sessions_per_cpu_second:.0f}")
+    return report
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,214 @@
+"""
+Multi-board games (Dordle, Quordle and beyond): every guess is played on all of the boards not
+solved yet.  The answers are packed into one letter array with their letter counts computed
+once, so a guess is scored against every open board in one vectorized call and each board's
+``GameState`` only records the code it was given.
+
+Each array operation has a fixed cost of a few microseconds, so with only a few boards open a
+guess is scored one board at a time instead: ``BATCH_BOARDS`` is roughly where the batch starts
+to win (see ``benchmarks/bench_multi_board.py``).
+"""
+
+from typing import Container
+
+import numpy as np
+
+from .batch_feedback import encode_words, letter_counts, score_against  # type: ignore
+from .constraints import NORMAL  # type: ignore
+from .feedback import GuessStatus, solved_code, target_word  # type: ignore
+from .game_state import GameState, InvalidEntryError, validate_guess  # type: ignore
+
+BATCH_BOARDS = 12
+
+
+def default_max_guesses(boards: int) -> int:
+    """
+    Guesses allowed for a number of boards, following Dordle (7) and Quordle (9)
+    Args:
+        boards: number of boards
+
+    Returns:
+        the number of guesses
+    """
+    return 6 if boards == 1 else boards + 5
+
+
+class MultiBoardGame:
+    """
+    Several boards sharing every guess.  Offers the parts of the ``GameState`` interface which
+    make sense across boards.
+    """
+
+    __slots__ = (
+        "boards",
+        "max_guesses",
+        "_word_length",
+        "_dictionary",
+        "_open",
+        "_open_answers",
+        "_open_counts",
+    )
+
+    def __init__(
+        self,
+        words: list[str],
+        dictionary: Container[str] | None = None,
+        max_guesses: int | None = None,
+        mode: str = NORMAL,
+    ):
+        """
+        Starts a game
+        Args:
+            words: the answer of each board, all of the same length
+            dictionary: Optional collection of valid words
+            max_guesses: number of guesses allowed, defaults to ``default_max_guesses``
+            mode: ``"normal"``, ``"hard"`` or ``"strict"``.  Each board tracks the letters it
+                revealed, and a guess has to respect those of every board still open
+        """
+        if not words or len({len(word) for word in words}) != 1:
+            raise ValueError("boards need answers of one and the same length")
+        self._word_length = len(words[0])
+        self.max_guesses = max_guesses or default_max_guesses(len(words))
+        self._dictionary = dictionary
+        self.boards = [
+            GameState(word, self._word_length, max_guesses=self.max_guesses, mode=mode)
+            for word in words
+        ]
+        # Indexes, letters and letter counts of the boards still open, compacted on each solve
+        self._open = np.arange(len(words))
+        self._open_answers = encode_words(words)
+        self._open_counts = letter_counts(self._open_answers)
+
+    @property
+    def words(self) -> list[str]:
+        """
+        Accessor for the answers
+        Returns:
+            the answer of each board
+        """
+        return [board.word for board in self.boards]
+
+    @property
+    def word_size(self) -> int:
+        """
+        Accessor for the number of letters of the answers
+        Returns:
+            the word length
+        """
+        return self._word_length
+
+    @property
+    def mode(self) -> str:
+        """
+        Accessor for the rules guesses are held to
+        Returns:
+            ``"normal"``, ``"hard"`` or ``"strict"``
+        """
+        return self.boards[0].mode
+
+    @property
+    def guesses(self) -> list[str]:
+        """
+        Decodes the guesses made so far, which the unsolved boards all hold
+        Returns:
+            list of the guesses, oldest first
+        """
+        longest = max(self.boards, key=lambda board: board.guess_count)
+        return longest.guesses
+
+    @property
+    def guess_count(self) -> int:
+        """
+        Number of guesses made so far
+        Returns:
+            the count
+        """
+        return max(board.guess_count for board in self.boards)
+
+    @property
+    def solved_count(self) -> int:
+        """
+        Number of boards solved so far
+        Returns:
+            the count
+        """
+        return len(self.boards) - len(self._open)
+
+    @property
+    def is_solved(self) -> bool:
+        """
+        Determines if every board has been solved
+        Returns:
+            bool
+        """
+        return self._open.size == 0
+
+    @property
+    def remaining_guesses(self) -> int:
+        """
+        Number of guesses which may still be made
+        Returns:
+            integer between 0 and max_guesses
+        """
+        return 0 if self.is_solved else self.max_guesses - self.guess_count
+
+    def make_guess(self, guess: str):
+        """
+        Validates a guess once, scores it against every open board in one batch and records
+        the codes on the boards
+        Args:
+            guess: the guess which the user has made currently
+        """
+        validate_guess(guess, self._word_length, self._dictionary)
+        if self.remaining_guesses < 1:
+            raise UserWarning("Unable to make any more guesses")
+        guess = guess.upper()
+        boards = self.boards
+        open_boards = self._open.tolist()
+        for board in open_boards:
+            constraints = boards[board].constraints
+            violation = constraints.violation(guess) if constraints else None
+            if violation:
+                raise InvalidEntryError(f"Board {board + 1}: {violation}. Try again.")
+        if len(open_boards) >= BATCH_BOARDS:
+            letters = encode_words([guess])[0]
+            codes = score_against(
+                letters, self._open_answers, self._open_counts
+            ).tolist()
+        else:
+            codes = [
+                target_word(boards[board].word).score(guess) for board in open_boards
+            ]
+        for board, code in zip(open_boards, codes):
+            boards[board].apply_feedback(guess, code)
+        solved = solved_code(self._word_length)
+        if solved in codes:
+            still_open = np.array(codes) != solved
+            self._open = self._open[still_open]
+            self._open_answers = self._open_answers[still_open]
+            self._open_counts = self._open_counts[:, still_open]
+
+    @property
+    def used_letters(self) -> dict[str, GuessStatus]:
+        """
+        Best status each letter has earned on any board still open, which is what matters for
+        the next guess
+        Returns:
+            map of the letters used so far to their status
+        """
+        used: dict[str, GuessStatus] = {}
+        boards = [self.boards[board] for board in self._open.tolist()] or self.boards
+        for board in boards:
+            for letter, status in board.used_letters.items():
+                if status > used.get(letter, 0):
+                    used[letter] = status
+        return used
+
+    @property
+    def char_tracker(self) -> dict[str, GuessStatus]:
+        """
+        Same as ``used_letters``, for the display functions
+        Returns:
+            map of the letters used so far to their status
+        """
+        return self.used_letters
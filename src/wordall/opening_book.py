@@ -0,0 +1,264 @@
+"""
+Precomputes the solver's first moves.  The opener, and the best guess after each feedback the
+opener can receive, only depend on the word list, so they are worked out once, stored per word
+length as a compact binary tree in the cache directory and looked up at hint time.
+
+Build a book with ``python -m src.wordall.opening_book <word length> [depth] [workers]``
+"""
+
+import os
+import struct
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .batch_feedback import score_block  # type: ignore
+from .candidates import CandidatePool, get_candidate_pool  # type: ignore
+from .feedback import solved_code  # type: ignore
+from .pattern_matrix import load_pattern_matrix  # type: ignore
+from .solver import best_guess_index  # type: ignore
+from .word_store import CACHE_DIR, WordStore, load_word_store  # type: ignore
+
+BOOK_MAGIC = b"WBOK"
+BOOK_VERSION = 1
+DEFAULT_DEPTH = 2
+# magic, format version, word length, depth, node count, edge count, word list sha256 digest
+BOOK_HEADER = struct.Struct("<4sHHHII32s")
+# Each node is a guess plus the slice of the edge table holding its children, each edge is a
+# feedback code and the node played after receiving it.  Edges of a node are sorted by code
+NODE_TYPE = np.dtype([("guess", "<u4"), ("first_edge", "<u4"), ("edge_count", "<u4")])
+EDGE_TYPE = np.dtype([("code", "<u4"), ("node", "<u4")])
+
+
+def opening_book_path(
+    word_length: int, digest: bytes, cache_dir: Path = CACHE_DIR
+) -> Path:
+    """
+    Determines where the book for a given word list lives
+    Args:
+        word_length: number of letters in the words of the list
+        digest: content hash of the word list (``WordStore.digest``)
+        cache_dir: directory holding the cached books
+
+    Returns:
+        Path of the book file
+    """
+    return cache_dir / f"book_{word_length}_{digest.hex()[:16]}.bin"
+
+
+class OpeningBook:
+    """
+    Read-only decision tree of the solver's first moves
+    """
+
+    __slots__ = ("store", "depth", "nodes", "edges")
+
+    def __init__(
+        self, store: WordStore, depth: int, nodes: np.ndarray, edges: np.ndarray
+    ):
+        """
+        Wraps the node and edge tables of a book
+        Args:
+            store: word store the guess indexes refer to
+            depth: number of moves the book covers
+            nodes: table of ``NODE_TYPE`` entries, the root first
+            edges: table of ``EDGE_TYPE`` entries
+        """
+        self.store = store
+        self.depth = depth
+        self.nodes = nodes
+        self.edges = edges
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def lookup(self, guesses: list[str], feedback: list[int]) -> str | None:
+        """
+        Finds the book move after the given game history
+        Args:
+            guesses: the guesses made so far
+            feedback: the feedback code each guess received
+
+        Returns:
+            the next guess, or None when the game has left the book (a guess other than the
+                book's was played, or the book is not deep enough)
+        """
+        node = 0
+        for guess, code in zip(guesses, feedback):
+            if self.store[int(self.nodes[node]["guess"])] != guess:
+                return None
+            first = int(self.nodes[node]["first_edge"])
+            last = first + int(self.nodes[node]["edge_count"])
+            children = self.edges[first:last]
+            position = int(np.searchsorted(children["code"], code))
+            if position == len(children) or children[position]["code"] != code:
+                return None
+            node = int(children[position]["node"])
+        return self.store[int(self.nodes[node]["guess"])]
+
+    def save(self, path: Path):
+        """
+        Writes the book to disk, atomically replacing any existing file
+        Args:
+            path: where to write the book
+        """
+        header = BOOK_HEADER.pack(
+            BOOK_MAGIC,
+            BOOK_VERSION,
+            self.store.word_length,
+            self.depth,
+            len(self.nodes),
+            len(self.edges),
+            self.store.digest,
+        )
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temp_path.open("wb") as book_file:
+            book_file.write(header)
+            book_file.write(self.nodes.tobytes())
+            book_file.write(self.edges.tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, store: WordStore) -> "OpeningBook":
+        """
+        Reads a book back from disk
+        Args:
+            path: location of the book
+            store: word store the book was built from
+
+        Returns:
+            the book
+        """
+        raw = path.read_bytes()
+        magic, version, word_length, depth, node_count, edge_count, digest = (
+            BOOK_HEADER.unpack_from(raw)
+        )
+        if magic != BOOK_MAGIC or version != BOOK_VERSION:
+            raise ValueError(
+                f"{path.name} is not a version {BOOK_VERSION} opening book"
+            )
+        if word_length != store.word_length or digest != store.digest:
+            raise ValueError(f"{path.name} was built from a different word list")
+        nodes = np.frombuffer(raw, NODE_TYPE, node_count, BOOK_HEADER.size)
+        edges = np.frombuffer(
+            raw, EDGE_TYPE, edge_count, BOOK_HEADER.size + nodes.nbytes
+        )
+        return cls(store, depth, nodes, edges)
+
+
+def build_opening_book(
+    pool: CandidatePool,
+    depth: int = DEFAULT_DEPTH,
+    workers: int = 1,
+    matrix: np.ndarray | None = None,
+) -> OpeningBook:
+    """
+    Works out the solver's moves for the first ``depth`` turns of every possible game
+    Args:
+        pool: the word list, used both as the guesses and as the possible answers
+        depth: number of moves to precompute.  1 only stores the opener
+        workers: number of worker processes the solver ranks with
+        matrix: optional feedback matrix of the word list to read the codes from instead of
+            scoring (see ``pattern_matrix``)
+
+    Returns:
+        the book
+    """
+    nodes: list[tuple[int, int, int]] = []
+    edges: list[tuple[int, int]] = []
+    solved = solved_code(pool.word_length)
+    # Breadth first, so that the children of every node are added next to each other
+    queue = [(pool.indices, 1)]
+    while queue:
+        next_queue = []
+        for candidate_indices, level in queue:
+            guess = best_guess_index(
+                pool.letters, candidate_indices, workers=workers, matrix=matrix
+            )
+            if guess is None:
+                # Every node but the root holds at least one candidate
+                raise ValueError("Cannot build an opening book over an empty word list")
+            nodes.append((guess, 0, 0))
+            if level == depth or len(candidate_indices) <= 1:
+                continue
+            if matrix is None:
+                codes = score_block(
+                    pool.letters[guess, None], pool.letters[candidate_indices]
+                )[0]
+            else:
+                codes = matrix[guess, candidate_indices]
+            first_edge = len(edges)
+            for code in np.unique(codes):
+                if code != solved:
+                    # Every node but the root hangs off exactly one edge and nodes are added
+                    # in the same order as edges, so the child of edge ``e`` is node ``e + 1``
+                    edges.append((int(code), len(edges) + 1))
+                    next_queue.append((candidate_indices[codes == code], level + 1))
+            nodes[-1] = (guess, first_edge, len(edges) - first_edge)
+        queue = next_queue
+    return OpeningBook(
+        pool.store,
+        depth,
+        np.array(nodes, dtype=NODE_TYPE),
+        np.array(edges, dtype=EDGE_TYPE),
+    )
+
+
+def open_opening_book(
+    store: WordStore, cache_dir: Path = CACHE_DIR
+) -> OpeningBook | None:
+    """
+    Loads the book built for the current version of a word list, if there is one.  Books built
+    for older versions of the list are ignored.
+    Args:
+        store: word store holding the word list
+        cache_dir: directory holding the cached books
+
+    Returns:
+        the book, or None when none has been built for this word list
+    """
+    path = opening_book_path(store.word_length, store.digest, cache_dir)
+    if not path.exists():
+        return None
+    return OpeningBook.load(path, store)
+
+
+@lru_cache(maxsize=None)
+def get_opening_book(word_length: int) -> OpeningBook | None:
+    """
+    Process wide accessor for the book of the shipped word list of a given length.  Nothing is
+    read until the first hint of a game of that length asks for it.
+    Args:
+        word_length: Number of letters in each word of the list
+
+    Returns:
+        the book, or None when none has been built for the current word list
+    """
+    return open_opening_book(load_word_store(word_length))
+
+
+def main(arguments: list[str]):
+    """
+    Builds the book for a shipped word list and stores it in the cache directory, removing
+    books of older versions of the list
+    Args:
+        arguments: word length, then optionally the depth and the number of workers
+    """
+    word_length = int(arguments[0])
+    depth = int(arguments[1]) if len(arguments) > 1 else DEFAULT_DEPTH
+    workers = int(arguments[2]) if len(arguments) > 2 else os.cpu_count() or 1
+    pool = get_candidate_pool(word_length)
+    book = build_opening_book(pool, depth, workers, load_pattern_matrix(word_length))
+    path = opening_book_path(word_length, pool.store.digest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    book.save(path)
+    for stale_path in path.parent.glob(f"book_{word_length}_*.bin"):
+        if stale_path != path:
+            stale_path.unlink(missing_ok=True)
+    print(f"Wrote {len(book)} moves to {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
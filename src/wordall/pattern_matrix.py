@@ -0,0 +1,258 @@
+"""
+Builds, caches and memory-maps the full guess x answer feedback matrix for a word list.  The
+matrix lives in the cache directory next to ``src/data`` under a name holding the content hash of
+the word list, so every process sharing the same list maps the same read-only file.
+
+Build a matrix, removing those of older versions of the list, with
+``python -m src.wordall.pattern_matrix <word length>``
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .batch_feedback import (  # type: ignore
+    DEFAULT_BLOCK_PAIRS,
+    feedback_dtype,
+    score_matrix,
+    store_letters,
+)
+from .word_store import CACHE_DIR, WordStore, load_word_store  # type: ignore
+
+DIGEST_CHARS = 16
+
+
+def pattern_matrix_path(
+    word_length: int, digest: bytes, cache_dir: Path = CACHE_DIR
+) -> Path:
+    """
+    Determines where the matrix for a given word list lives
+    Args:
+        word_length: number of letters in the words of the list
+        digest: content hash of the word list (``WordStore.digest``)
+        cache_dir: directory holding the cached matrices
+
+    Returns:
+        Path of the matrix file
+    """
+    return cache_dir / f"patterns_{word_length}_{digest.hex()[:DIGEST_CHARS]}.npy"
+
+
+def _words_path(matrix_path: Path) -> Path:
+    """Path of the snapshot of the words a matrix was built from"""
+    return matrix_path.with_suffix(".words.npy")
+
+
+def _builds(word_length: int, cache_dir: Path) -> list[Path]:
+    """Matrices built for any version of the word list of a given length"""
+    return [
+        path
+        for path in cache_dir.glob(f"patterns_{word_length}_*.npy")
+        if not path.name.endswith(".words.npy")
+    ]
+
+
+def _previous_build(store: WordStore, current: Path, cache_dir: Path):
+    """
+    Finds the most recent matrix built for an older version of the word list.  Builds made
+    since the list last changed belong to a newer version (or a process catching up on an
+    older one) and are left alone.
+    Returns:
+        Tuple of the matrix path and its word snapshot, or None if there is no usable build
+    """
+    candidates = []
+    for path in _builds(store.word_length, cache_dir):
+        try:
+            built_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Removed as stale since the directory was listed
+            continue
+        if path != current and built_ns < store.source_mtime_ns:
+            candidates.append((built_ns, path))
+    for _, path in sorted(candidates, reverse=True):
+        if _words_path(path).exists():
+            return path, _words_path(path)
+    return None
+
+
+def _copy_known_pairs(out, previous, known_new, known_old, block_pairs):
+    """
+    Copies the codes of the (guess, answer) pairs whose words were both in the previous build
+    """
+    row_step = max(1, block_pairs // max(1, len(known_new)))
+    for start in range(0, len(known_new), row_step):
+        end = start + row_step
+        out[np.ix_(known_new[start:end], known_new)] = previous[
+            np.ix_(known_old[start:end], known_old)
+        ]
+
+
+def _score_into(out, rows, cols, words, block_pairs):
+    """
+    Scores the given guess rows against the given answer columns of the word list and scatters
+    the codes into the (possibly non-contiguous) cells of ``out``
+    """
+    if rows.size == 0 or cols.size == 0:
+        return
+    row_step = max(1, block_pairs // len(cols))
+    buffer = np.empty((min(row_step, len(rows)), len(cols)), out.dtype)
+    for start in range(0, len(rows), row_step):
+        end = start + row_step
+        chunk = rows[start:end]
+        chunk_size = len(chunk)
+        codes = buffer[:chunk_size]
+        score_matrix(words[chunk], words[cols], codes, block_pairs)
+        out[np.ix_(chunk, cols)] = codes
+
+
+def _extend_previous_build(out, words, previous_build, block_pairs):
+    """
+    Fills ``out`` from an older build, only scoring the rows and columns of words which the
+    older build did not have
+    """
+    previous_words = np.load(previous_build[1])
+    previous_index = {
+        word.tobytes(): index for index, word in enumerate(previous_words)
+    }
+    old_positions = np.array(
+        [previous_index.get(word.tobytes(), -1) for word in words], dtype=np.int64
+    )
+    known_new = np.flatnonzero(old_positions >= 0)
+    added = np.flatnonzero(old_positions < 0)
+    previous = np.load(previous_build[0], mmap_mode="r")
+    _copy_known_pairs(out, previous, known_new, old_positions[known_new], block_pairs)
+    # New words as guesses against everything, then old guesses against the new words
+    _score_into(out, added, np.arange(len(words)), words, block_pairs)
+    _score_into(out, known_new, added, words, block_pairs)
+
+
+def build_pattern_matrix(
+    store: WordStore,
+    cache_dir: Path = CACHE_DIR,
+    block_pairs: int = DEFAULT_BLOCK_PAIRS,
+) -> Path:
+    """
+    Makes sure the matrix for the word list exists on disk.  When a matrix exists for an older
+    version of the list, only the rows and columns of words which were added are scored and
+    everything else is copied over.  Older builds are kept, since other processes may still be
+    on that version of the list: ``main`` removes them.
+    Args:
+        store: word store holding the (current) word list
+        cache_dir: directory holding the cached matrices
+        block_pairs: maximum number of pairs scored at once
+
+    Returns:
+        Path of the matrix file
+    """
+    target = pattern_matrix_path(store.word_length, store.digest, cache_dir)
+    if target.exists():
+        return target
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    words = store_letters(store)
+    temp_target = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    out = np.lib.format.open_memmap(
+        temp_target,
+        mode="w+",
+        dtype=feedback_dtype(store.word_length),
+        shape=(len(words), len(words)),
+    )
+
+    previous_build = _previous_build(store, target, cache_dir)
+    try:
+        if previous_build is None:
+            score_matrix(words, words, out, block_pairs)
+        else:
+            _extend_previous_build(out, words, previous_build, block_pairs)
+    except FileNotFoundError:
+        # The previous build was removed as stale before it could be read
+        score_matrix(words, words, out, block_pairs)
+
+    out.flush()
+    del out
+    temp_words = _words_path(target).with_name(
+        f"{_words_path(target).name}.{os.getpid()}.tmp"
+    )
+    with temp_words.open("wb") as words_file:
+        np.save(words_file, words)
+    # The word snapshot goes first, so a matrix is never visible without it
+    os.replace(temp_words, _words_path(target))
+    os.replace(temp_target, target)
+    return target
+
+
+def open_pattern_matrix(store: WordStore, cache_dir: Path = CACHE_DIR) -> np.ndarray:
+    """
+    Maps the matrix for a word list read-only, building it first if needed
+    Args:
+        store: word store holding the word list
+        cache_dir: directory holding the cached matrices
+
+    Returns:
+        (N, N) read-only memory-mapped array where ``[guess, answer]`` is the feedback code
+    """
+    path = build_pattern_matrix(store, cache_dir)
+    try:
+        return np.load(path, mmap_mode="r")
+    except FileNotFoundError:
+        # Removed as stale by ``main``, for a newer version of the list
+        return np.load(build_pattern_matrix(store, cache_dir), mmap_mode="r")
+
+
+def find_pattern_matrix(
+    store: WordStore, cache_dir: Path = CACHE_DIR
+) -> np.ndarray | None:
+    """
+    Maps the matrix for a word list read-only if it has been built, without building it
+    Args:
+        store: word store holding the word list
+        cache_dir: directory holding the cached matrices
+
+    Returns:
+        (N, N) read-only memory-mapped array where ``[guess, answer]`` is the feedback code, or
+        None when no matrix has been built for this version of the list
+    """
+    try:
+        return np.load(
+            pattern_matrix_path(store.word_length, store.digest, cache_dir),
+            mmap_mode="r",
+        )
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def load_pattern_matrix(word_length: int) -> np.ndarray:
+    """
+    Process wide accessor for the matrix of the shipped word list of a given length
+    Args:
+        word_length: Number of letters in each word of the list
+
+    Returns:
+        (N, N) read-only memory-mapped array where ``[guess, answer]`` is the feedback code
+    """
+    return open_pattern_matrix(load_word_store(word_length))
+
+
+def main(arguments: list[str]):
+    """
+    Builds the matrix for a shipped word list and removes the matrices of older versions of
+    the list.  Processes still mapping them keep their view until they let go of it.
+    Args:
+        arguments: word length
+    """
+    word_length = int(arguments[0])
+    store = load_word_store(word_length)
+    path = build_pattern_matrix(store, CACHE_DIR)
+    for stale_path in _builds(word_length, path.parent):
+        if stale_path != path:
+            _words_path(stale_path).unlink(missing_ok=True)
+            stale_path.unlink(missing_ok=True)
+    print(f"Wrote the {len(store)} x {len(store)} feedback matrix to {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,274 @@
+"""
+Pattern and letter constraint queries over a word list, e.g. ``S?A?E``, ``+RT -E`` or ``O=2``.
+The words are indexed once per length as bitsets held in Python integers, bit ``n`` standing for
+the ``n``-th word in alphabetical order: one per position and letter, and one per letter and
+minimum count.  A query is answered by intersecting a few of them, and matches are decoded
+lazily, in alphabetical order, as the caller iterates.  The sorted words double as an implicit
+trie: the words under any prefix are one contiguous run, found by binary search, so a prefix
+term is a range mask rather than a walk over the words.
+
+Query terms, separated by spaces, must all hold:
+    ``S?A?E``     one symbol per letter: a letter, ``?`` for any letter, ``[ABC]`` for one of
+                  a set of letters or ``[^ABC]`` for any letter but those
+    ``ST*``       starts with the letters
+    ``+RT``       contains each of the letters
+    ``-E``        contains none of the letters
+    ``O=2``       holds exactly (``=``), at least (``>=``) or at most (``<=``) that many of a
+                  letter
+
+Run with ``python -m src.wordall.query [--length 5] [--limit 50] [--] QUERY``, the ``--`` being
+needed when the query starts with a ``-`` term
+"""
+
+import argparse
+import re
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Iterator
+
+import numpy as np
+
+from .batch_feedback import encode_words  # type: ignore
+from .word_store import WordStore, load_word_store  # type: ignore
+
+COUNT_TERM = re.compile(r"([A-Z])(=|>=|<=)(\d+)")
+PATTERN_SYMBOL = re.compile(r"\[(\^?)([A-Z]+)\]|[A-Z?.]")
+
+
+class QuerySyntaxError(ValueError):
+    """
+    Representation of a query which cannot be parsed
+    """
+
+
+def _bitset(mask: np.ndarray) -> int:
+    """Packs a boolean array into an integer, element ``n`` becoming bit ``n``"""
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+class WordQueryIndex:
+    """
+    Bitset index over the words of one length
+    """
+
+    __slots__ = ("word_length", "words", "everything", "_positions", "_at_least")
+
+    def __init__(self, words: list[str]):
+        """
+        Builds the index
+        Args:
+            words: upper-case words which all share the same length
+        """
+        self.words = sorted(words)
+        self.word_length = len(self.words[0]) if self.words else 0
+        self.everything = (1 << len(self.words)) - 1
+        letters = encode_words(self.words)
+        # _positions[p][l]: the words with letter l at position p
+        self._positions = [
+            [_bitset(column == letter) for letter in range(26)] for column in letters.T
+        ]
+        # _at_least[l][k]: the words holding letter l at least k times, from k = 0 (every word)
+        # to word_length + 1 (none)
+        self._at_least = []
+        for letter in range(26):
+            counts = (letters == letter).sum(axis=1)
+            self._at_least.append(
+                [self.everything]
+                + [_bitset(counts >= count) for count in range(1, self.word_length + 1)]
+                + [0]
+            )
+
+    @classmethod
+    def from_store(cls, store: WordStore) -> "WordQueryIndex":
+        """
+        Builds an index over a compiled word store
+        Args:
+            store: memory-mapped word store to index
+
+        Returns:
+            the index
+        """
+        return cls(list(store))
+
+    def prefix(self, prefix: str) -> int:
+        """
+        Finds the words starting with a prefix, as a node of the implicit trie
+        Args:
+            prefix: upper-case letters
+
+        Returns:
+            bitset of the words
+        """
+        start = bisect_left(self.words, prefix)
+        # "[" sorts right after "Z", so this is the first word past the prefix's run
+        end = bisect_left(self.words, prefix + "[", start)
+        return ((1 << end) - 1) ^ ((1 << start) - 1)
+
+    def _letter_set(self, position: int, letters: str) -> int:
+        """Words with one of the letters at a position"""
+        bits = 0
+        for letter in letters:
+            bits |= self._positions[position][ord(letter) - 65]
+        return bits
+
+    def _count(self, letter: str, operator: str, count: int) -> int:
+        """Words holding a letter exactly, at least or at most ``count`` times"""
+        at_least = self._at_least[ord(letter) - 65]
+        if count > self.word_length:
+            return self.everything if operator == "<=" else 0
+        if operator == ">=":
+            return at_least[count]
+        at_most = self.everything & ~at_least[count + 1]
+        return at_most if operator == "<=" else at_least[count] & at_most
+
+    def _pattern(self, pattern: str) -> int:
+        """Words matching one symbol per position"""
+        symbols = list(PATTERN_SYMBOL.finditer(pattern))
+        if (
+            len(symbols) != self.word_length
+            or "".join(symbol.group(0) for symbol in symbols) != pattern
+        ):
+            raise QuerySyntaxError(
+                f"{pattern!r} is not a pattern of {self.word_length} letters"
+            )
+        bits = self.everything
+        for position, symbol in enumerate(symbols):
+            text = symbol.group(0)
+            if text in "?.":
+                continue
+            if symbol.group(2):
+                chosen = self._letter_set(position, symbol.group(2))
+                bits &= ~chosen if symbol.group(1) else chosen
+            else:
+                bits &= self._positions[position][ord(text) - 65]
+        return bits
+
+    def _term(self, term: str) -> int:
+        """Words satisfying one query term"""
+        if term[0] in "+-":
+            letters = term[1:]
+            if not letters.isalpha():
+                raise QuerySyntaxError(f"{term!r} must list letters after {term[0]}")
+            bits = self.everything
+            for letter in letters:
+                contains = self._at_least[ord(letter) - 65][1]
+                bits &= contains if term[0] == "+" else ~contains
+            return bits
+        if term.endswith("*"):
+            if not term[:-1].isalpha():
+                raise QuerySyntaxError(f"{term!r} must be letters followed by *")
+            return self.prefix(term[:-1])
+        count = COUNT_TERM.fullmatch(term)
+        if count:
+            return self._count(count.group(1), count.group(2), int(count.group(3)))
+        return self._pattern(term)
+
+    def bits(self, query: str) -> int:
+        """
+        Answers a query
+        Args:
+            query: terms separated by spaces, see the module documentation
+
+        Returns:
+            bitset of the matching words
+        """
+        bits = self.everything
+        for term in query.upper().split():
+            if not term.isascii():
+                raise QuerySyntaxError(f"{term!r} is not ASCII")
+            bits &= self._term(term)
+        return bits & self.everything
+
+    def count(self, query: str) -> int:
+        """
+        Counts the words matching a query without decoding them
+        Args:
+            query: terms separated by spaces, see the module documentation
+
+        Returns:
+            the number of matches
+        """
+        return self.bits(query).bit_count()
+
+    def iter_bits(self, bits: int) -> Iterator[str]:
+        """
+        Decodes a bitset of words one word at a time, in alphabetical order
+        Args:
+            bits: bitset as returned by ``bits``
+
+        Returns:
+            iterator over the words
+        """
+        words = self.words
+        # Peeling bits off one big integer copies all of it each time, so it is split into
+        # 64 bit chunks once, and only the chunks holding matches are peeled
+        chunks = np.frombuffer(
+            bits.to_bytes(-(-bits.bit_length() // 64) * 8, "little"), "<u8"
+        )
+        for chunk_index in np.flatnonzero(chunks).tolist():
+            chunk = int(chunks[chunk_index])
+            base = chunk_index * 64 - 1
+            while chunk:
+                lowest = chunk & -chunk
+                yield words[base + lowest.bit_length()]
+                chunk ^= lowest
+
+    def search(self, query: str, limit: int | None = None) -> Iterator[str]:
+        """
+        Streams the words matching a query
+        Args:
+            query: terms separated by spaces, see the module documentation
+            limit: Optional maximum number of words
+
+        Returns:
+            iterator over the matches in alphabetical order
+        """
+        matches = self.iter_bits(self.bits(query))
+        if limit is None:
+            return matches
+        return (word for _, word in zip(range(limit), matches))
+
+
+@lru_cache(maxsize=None)
+def get_query_index(word_length: int) -> WordQueryIndex:
+    """
+    Process wide accessor for the query index of a given word length, built on first use
+    Args:
+        word_length: Number of letters in the words of the index
+
+    Returns:
+        The shared index for the word length
+    """
+    return WordQueryIndex.from_store(load_word_store(word_length))
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Command line entry point, printing the matches one per line
+    Args:
+        arguments: command line arguments, defaults to ``sys.argv``
+
+    Returns:
+        the number of matches
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("query", nargs="+", help="query terms")
+    parser.add_argument("--length", type=int, default=5, help="letters per word")
+    parser.add_argument("--limit", type=int, default=50, help="words to print")
+    options = parser.parse_args(arguments)
+
+    index = get_query_index(options.length)
+    query = " ".join(options.query)
+    try:
+        total = index.count(query)
+    except QuerySyntaxError as error:
+        parser.error(str(error))
+    for word in index.search(query, options.limit):
+        print(word)
+    print(f"{total} words match")
+    return total
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,127 @@
+"""
+Deterministic answer schedule.  Game numbers are mapped to answer indexes through a keyed
+permutation of the word list (a Feistel network over the smallest even number of bits covering
+the list, cycle-walking past values outside it), so every answer comes up once before any
+repeats, any game's answer is computed on its own in constant time and memory, and every node
+using the same seed and word list agrees on it without coordination.  Each pass through the
+list is shuffled with its own keys.
+"""
+
+import datetime
+import hashlib
+from functools import lru_cache
+
+MASK_64 = (1 << 64) - 1
+DEFAULT_ROUNDS = 4
+DEFAULT_SEED = "wordall"
+EPOCH = datetime.date(2021, 6, 19)
+
+
+def _mix(value: int) -> int:
+    """SplitMix64 finalizer, a fast bijective scrambling of 64 bit integers"""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & MASK_64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & MASK_64
+    return value ^ (value >> 31)
+
+
+@lru_cache(maxsize=64)
+def _round_keys(seed: str, size: int, cycle: int, rounds: int) -> tuple[int, ...]:
+    """Keys of each Feistel round for one pass through a list of ``size`` words"""
+    digest = hashlib.sha256(f"{seed}:{size}:{cycle}".encode()).digest()
+    while len(digest) < 8 * rounds:
+        digest += hashlib.sha256(digest).digest()
+    keys = []
+    for start in range(0, 8 * rounds, 8):
+        end = start + 8
+        keys.append(int.from_bytes(digest[start:end], "little"))
+    return tuple(keys)
+
+
+class AnswerScheduler:
+    """
+    Keyed permutation of the positions of a word list, repeated with fresh keys once exhausted
+    """
+
+    __slots__ = ("size", "seed", "rounds", "_half_bits", "_half_mask")
+
+    def __init__(self, size: int, seed: int | str, rounds: int = DEFAULT_ROUNDS):
+        """
+        Creates the schedule
+        Args:
+            size: number of words in the list answers are drawn from
+            seed: key of the schedule, shared by every node which should agree on it
+            rounds: number of Feistel rounds
+        """
+        if size < 1:
+            raise ValueError("the word list is empty")
+        self.size = size
+        self.seed = str(seed)
+        self.rounds = rounds
+        # Both halves get the same number of bits, at least one
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+
+    def _permute(self, value: int, keys: tuple[int, ...]) -> int:
+        """Applies the Feistel network to a value of ``2 * half_bits`` bits"""
+        bits, mask = self._half_bits, self._half_mask
+        left, right = value >> bits, value & mask
+        for key in keys:
+            left, right = right, left ^ (_mix(right ^ key) & mask)
+        return left << bits | right
+
+    def _unpermute(self, value: int, keys: tuple[int, ...]) -> int:
+        """Inverse of ``_permute``"""
+        bits, mask = self._half_bits, self._half_mask
+        left, right = value >> bits, value & mask
+        for key in reversed(keys):
+            left, right = right ^ (_mix(left ^ key) & mask), left
+        return left << bits | right
+
+    def __getitem__(self, game: int) -> int:
+        """
+        Answer of a game
+        Args:
+            game: game number, from 0
+
+        Returns:
+            index of the answer in the word list
+        """
+        if game < 0:
+            raise IndexError("game numbers start at 0")
+        cycle, value = divmod(game, self.size)
+        keys = _round_keys(self.seed, self.size, cycle, self.rounds)
+        # The network permutes a domain of less than 4 times the list, so on average fewer
+        # than 4 steps lead back into the list
+        value = self._permute(value, keys)
+        while value >= self.size:
+            value = self._permute(value, keys)
+        return value
+
+    def game_of(self, index: int, cycle: int = 0) -> int:
+        """
+        Finds the game in a pass through the list whose answer is the given word
+        Args:
+            index: index of the answer in the word list
+            cycle: pass through the list, from 0
+
+        Returns:
+            the game number
+        """
+        if not 0 <= index < self.size:
+            raise IndexError("answer index out of range")
+        keys = _round_keys(self.seed, self.size, cycle, self.rounds)
+        value = self._unpermute(index, keys)
+        while value >= self.size:
+            value = self._unpermute(value, keys)
+        return cycle * self.size + value
+
+    def for_day(self, day: datetime.date) -> int:
+        """
+        Answer of the daily game, numbering days from ``EPOCH``
+        Args:
+            day: the date
+
+        Returns:
+            index of the answer in the word list
+        """
+        return self[(day - EPOCH).days]
@@ -0,0 +1,505 @@
+"""
+Asyncio game server hosting many concurrent sessions in one event loop over a plain TCP line
+protocol.  Sessions outlive connections and are looked up by id, so a player may reconnect.
+Commands (one per line, responses likewise):
+
+    NEW [length]          -> OK <session id> <length>
+    GUESS <id> <word>     -> OK <feedback digits> <remaining guesses> PLAYING|SOLVED|LOST <word>
+    SHOW <id>             -> OK <guesses so far, comma separated> <remaining guesses>
+    END <id>              -> OK
+    QUIT                  -> closes the connection
+
+Any failure is answered with ``ERR <message>``.  With ``--log-dir`` every session event is
+recorded in an ``EventLog`` and the sessions are recovered from it on startup.  With
+``--workers`` several processes accept connections from one listening socket and share their
+sessions through a ``SharedSessionStore``.  Run with ``python -m src.wordall.server``
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import secrets
+import socket
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterator
+
+from .dictionary import get_word_index  # type: ignore
+from .event_log import (  # type: ignore
+    KIND_END,
+    KIND_GUESS,
+    KIND_NEW,
+    EventLog,
+    SessionHistory,
+    load_histories,
+)
+from .feedback import feedback_digits  # type: ignore
+from .game_state import GameState, InvalidEntryError  # type: ignore
+from .instrumentation import instrument_from_env  # type: ignore
+from .shared_sessions import SharedSessionStore, random_game  # type: ignore
+from .word_store import load_word_store  # type: ignore
+
+DEFAULT_PORT = 7777
+MAX_LINE_BYTES = 256
+# Bytes a client may leave unread before its writes wait for it to catch up
+WRITE_HIGH_WATER = 64 * 1024
+# Logged events after which the sweeper snapshots the sessions, bounding recovery time
+SNAPSHOT_EVERY = 1_000_000
+
+
+class SessionStore:
+    """
+    Games by session id, kept in least recently used order so that idle sessions can be
+    evicted from the front without scanning the rest
+    """
+
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        idle_timeout: float = 600.0,
+        max_sessions: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+        event_log: EventLog | None = None,
+    ):
+        """
+        Creates an empty store
+        Args:
+            idle_timeout: seconds after its last use at which a session is evicted
+            max_sessions: number of sessions above which the least recently used are evicted
+            clock: source of the current time in seconds
+            rng: Optional random generator picking the answers
+            event_log: Optional log recording every session event
+        """
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.clock = clock
+        self.rng = rng
+        self.event_log = event_log
+        self.evicted = 0
+        # Game, time of last use and index of the answer in the word list of its length
+        self._sessions: OrderedDict[str, tuple[GameState, float, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, word_length: int) -> tuple[str, GameState]:
+        """
+        Starts a game with a random answer
+        Args:
+            word_length: one of the ``word_store.available_lengths()``
+
+        Returns:
+            tuple of the new session id and its game
+        """
+        answer, game = random_game(word_length, self.rng)
+        session_id = secrets.token_hex(8)
+        self._sessions[session_id] = (game, self.clock(), answer)
+        if self.event_log is not None:
+            self.event_log.append(int(session_id, 16), KIND_NEW, word_length, answer)
+        while len(self._sessions) > self.max_sessions:
+            self._drop(*self._sessions.popitem(last=False))
+            self.evicted += 1
+        return session_id, game
+
+    def get(self, session_id: str) -> GameState:
+        """
+        Looks up a session, marking it as used
+        Args:
+            session_id: id handed out by ``create``
+
+        Returns:
+            the session's game
+        """
+        return self._touch(session_id)[0]
+
+    def _touch(self, session_id: str) -> tuple[GameState, float, int]:
+        """Marks a session as used, returning its entry"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            raise InvalidEntryError(f"unknown session {session_id}")
+        entry = (entry[0], self.clock(), entry[2])
+        self._sessions[session_id] = entry
+        self._sessions.move_to_end(session_id)
+        return entry
+
+    def play(self, session_id: str, guess: str) -> GameState:
+        """
+        Makes a guess in a session, recording it in the event log
+        Args:
+            session_id: id handed out by ``create``
+            guess: the guess
+
+        Returns:
+            the session's game
+        """
+        game, _, answer = self._touch(session_id)
+        game.make_guess(guess)
+        if self.event_log is not None:
+            self.event_log.append(
+                int(session_id, 16),
+                KIND_GUESS,
+                game.word_size,
+                answer,
+                guess,
+                game.feedback[-1],
+                game.guess_count - 1,
+            )
+        return game
+
+    def _drop(self, session_id: str, entry: tuple[GameState, float, int]):
+        """Records the end of a session which has been taken out of the store"""
+        if self.event_log is not None:
+            self.event_log.append(
+                int(session_id, 16), KIND_END, entry[0].word_size, entry[2]
+            )
+
+    def remove(self, session_id: str):
+        """
+        Ends a session
+        Args:
+            session_id: id handed out by ``create``
+        """
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            raise InvalidEntryError(f"unknown session {session_id}")
+        self._drop(session_id, entry)
+
+    def evict_idle(self) -> int:
+        """
+        Drops the sessions which have not been used within the idle timeout
+        Returns:
+            number of sessions evicted
+        """
+        cutoff = self.clock() - self.idle_timeout
+        evicted = 0
+        while self._sessions:
+            _, (_, last_used, _) = next(iter(self._sessions.items()))
+            if last_used > cutoff:
+                break
+            self._drop(*self._sessions.popitem(last=False))
+            evicted += 1
+        self.evicted += evicted
+        return evicted
+
+    def histories(self) -> Iterator[tuple[int, SessionHistory]]:
+        """
+        Describes every session for an event log snapshot
+        Returns:
+            iterator of pairs of numeric session id and history
+        """
+        for session_id, (game, _, answer) in self._sessions.items():
+            yield int(session_id, 16), SessionHistory(
+                answer, game.word_size, game.guesses, game.feedback
+            )
+
+    def restore(self, histories: dict[int, SessionHistory]) -> int:
+        """
+        Adds sessions recovered from an event log, as if they had just been used
+        Args:
+            histories: histories by numeric session id, as given by ``load_histories``
+
+        Returns:
+            number of sessions restored
+        """
+        now = self.clock()
+        for session, history in histories.items():
+            word_length = history.word_length
+            game = GameState.from_history(
+                load_word_store(word_length)[history.answer],
+                word_length,
+                history.guesses,
+                history.feedback,
+                dictionary=get_word_index(word_length),
+            )
+            self._sessions[format(session, "016x")] = (game, now, history.answer)
+        return len(histories)
+
+    def checkpoint(self, snapshot_every: int = SNAPSHOT_EVERY):
+        """
+        Syncs the event log if its batch is due, and snapshots the sessions once enough events
+        have been logged since the last snapshot
+        Args:
+            snapshot_every: number of events which triggers a snapshot
+        """
+        if self.event_log is None:
+            return
+        if self.event_log.records_since_snapshot >= snapshot_every:
+            self.event_log.snapshot(self.histories())
+        else:
+            self.event_log.sync_if_due()
+
+
+class GameServer:
+    """
+    Speaks the line protocol for the sessions of a store
+    """
+
+    def __init__(
+        self,
+        sessions: SessionStore | SharedSessionStore,
+        write_timeout: float = 10.0,
+    ):
+        """
+        Wraps a session store
+        Args:
+            sessions: the store holding every game, possibly shared with other processes
+            write_timeout: seconds a client may take to read its responses before it is
+                disconnected
+        """
+        self.sessions = sessions
+        self.write_timeout = write_timeout
+        self.connections = 0
+        self._sweeper: asyncio.Task | None = None
+
+    def respond(self, line: str) -> str:
+        """
+        Executes one command
+        Args:
+            line: the command line, without its line ending
+
+        Returns:
+            the response line, without its line ending
+        """
+        command, *arguments = line.split() or [""]
+        command = command.upper()
+        try:
+            if command == "NEW":
+                word_length = int(arguments[0]) if arguments else 5
+                session_id, game = self.sessions.create(word_length)
+                return f"OK {session_id} {game.word_size}"
+            if command == "GUESS" and len(arguments) == 2:
+                return self._guess(*arguments)
+            if command == "SHOW" and len(arguments) == 1:
+                game = self.sessions.get(arguments[0])
+                return f"OK {','.join(game.guesses) or '-'} {game.remaining_guesses}"
+            if command == "END" and len(arguments) == 1:
+                self.sessions.remove(arguments[0])
+                return "OK"
+        except (ValueError, UserWarning) as error:
+            # InvalidEntryError is a ValueError, as are malformed word lengths
+            return f"ERR {error}"
+        return f"ERR unknown command {line.strip()!r}"
+
+    def _guess(self, session_id: str, guess: str) -> str:
+        """Plays a guess of a session"""
+        game = self.sessions.play(session_id, guess.upper())
+        digits = feedback_digits(game.feedback[-1], game.word_size)
+        if game.is_solved:
+            status = "SOLVED"
+        elif game.remaining_guesses == 0:
+            status = f"LOST {game.word}"
+        else:
+            status = "PLAYING"
+        return f"OK {''.join(map(str, digits))} {game.remaining_guesses} {status}"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Serves one connection until the client quits, disconnects or stops reading
+        Args:
+            reader: incoming stream of the connection
+            writer: outgoing stream of the connection
+        """
+        self.connections += 1
+        writer.transport.set_write_buffer_limits(high=WRITE_HIGH_WATER)
+        # asyncio only disables Nagle's algorithm itself on the sockets it created, not on
+        # those accepted from a listening socket handed to it by ``serve_workers``
+        connection = writer.get_extra_info("socket")
+        if connection is not None and connection.family in (
+            socket.AF_INET,
+            socket.AF_INET6,
+        ):
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than MAX_LINE_BYTES, the stream can not be resynchronised
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not line or line.strip().upper() == b"QUIT":
+                    break
+                writer.write(self.respond(line.decode("ascii", "replace")).encode())
+                writer.write(b"\n")
+                # Waits only while the client leaves more than the high water mark unread,
+                # and drops clients which stay that far behind
+                await asyncio.wait_for(writer.drain(), self.write_timeout)
+        except (ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def evict_forever(self, interval: float, sync_interval: float = 0.05):
+        """
+        Evicts idle sessions every ``interval`` seconds.  In between, pending event log
+        records are synced so a quiet server does not leave the last events of a burst unsynced
+        Args:
+            interval: seconds between sweeps
+            sync_interval: seconds between event log checkpoints
+        """
+        last_sweep = time.monotonic()
+        while True:
+            await asyncio.sleep(
+                interval if self.sessions.event_log is None else sync_interval
+            )
+            if time.monotonic() - last_sweep >= interval:
+                self.sessions.evict_idle()
+                last_sweep = time.monotonic()
+            self.sessions.checkpoint()
+
+    async def start(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        sock: socket.socket | None = None,
+    ):
+        """
+        Starts listening, plus the idle session sweeper
+        Args:
+            host: interface to listen on
+            port: port to listen on, 0 for any free port
+            sock: Optional socket already listening, used instead of ``host`` and ``port``
+
+        Returns:
+            the listening ``asyncio.Server``
+        """
+        address = {"sock": sock} if sock is not None else {"host": host, "port": port}
+        server = await asyncio.start_server(
+            self.handle, limit=MAX_LINE_BYTES, **address
+        )
+        self._sweeper = asyncio.create_task(
+            self.evict_forever(max(1.0, self.sessions.idle_timeout / 10))
+        )
+        return server
+
+    def stop_sweeping(self):
+        """
+        Stops the idle session sweeper started by ``start``
+        """
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+
+async def serve(
+    host: str,
+    port: int,
+    sessions: SessionStore | SharedSessionStore,
+    sock: socket.socket | None = None,
+):
+    """
+    Runs a server until cancelled
+    Args:
+        host: interface to listen on
+        port: port to listen on
+        sessions: the store holding every game
+        sock: Optional socket already listening, used instead of ``host`` and ``port``
+    """
+    game_server = GameServer(sessions)
+    server = await game_server.start(host, port, sock)
+    print(f"Serving on {', '.join(str(sock.getsockname()) for sock in server.sockets)}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        game_server.stop_sweeping()
+
+
+def _worker(sock: socket.socket, sessions: SharedSessionStore):
+    """Serves connections from a listening socket in a worker process"""
+    try:
+        asyncio.run(serve("", 0, sessions, sock))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sessions.close()
+
+
+def serve_workers(host: str, port: int, sessions: SharedSessionStore, workers: int):
+    """
+    Runs one server per worker process until interrupted.  They all accept connections from
+    one listening socket and share every session
+    Args:
+        host: interface to listen on
+        port: port to listen on
+        sessions: the store holding every game, freed once the workers are done
+        workers: number of worker processes
+    """
+    sock = socket.create_server((host, port))
+    context = multiprocessing.get_context()
+    processes = [
+        context.Process(target=_worker, args=(sock, sessions), name=f"worker-{number}")
+        for number in range(workers)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.pid is not None:
+                # Stops any worker which an interrupt of this process did not reach
+                process.terminate()
+                process.join()
+        sock.close()
+        sessions.close()
+        sessions.unlink()
+
+
+def main(arguments: list[str] | None = None):
+    """
+    Command line entry point
+    Args:
+        arguments: command line arguments, defaults to ``sys.argv``
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--idle-timeout", type=float, default=600.0)
+    parser.add_argument("--max-sessions", type=int, default=100_000)
+    parser.add_argument(
+        "--log-dir", type=Path, help="directory of the session event log"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="processes sharing the sessions"
+    )
+    options = parser.parse_args(arguments)
+    if options.workers > 1:
+        if options.log_dir:
+            parser.error("--log-dir needs a single worker")
+        try:
+            serve_workers(
+                options.host,
+                options.port,
+                SharedSessionStore(options.idle_timeout, options.max_sessions),
+                options.workers,
+            )
+        except KeyboardInterrupt:
+            pass
+        return
+    event_log = None
+    sessions = SessionStore(options.idle_timeout, options.max_sessions)
+    if options.log_dir:
+        restored = sessions.restore(load_histories(options.log_dir))
+        print(f"Recovered {restored} sessions from {options.log_dir}")
+        event_log = EventLog(options.log_dir)
+        sessions.event_log = event_log
+        # Starts the new log from a snapshot of the recovered sessions
+        event_log.snapshot(sessions.histories())
+    try:
+        asyncio.run(serve(options.host, options.port, sessions))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if event_log is not None:
+            event_log.close()
+
+
+if __name__ == "__main__":
+    with instrument_from_env():
+        main(sys.argv[1:])
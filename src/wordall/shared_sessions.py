@@ -0,0 +1,458 @@
+"""
+Session store shared by the worker processes of one server, so that a player's requests may
+land on any of them.  Every session lives in a fixed size slot of one ``SharedMemory`` block:
+the index of its answer in the word list of its length, its guesses packed 5 bits a letter with
+their feedback codes, the 26 byte letter status table behind ``char_tracker`` and a version
+counter.  The slots are also the session id index: an id hashes to a home slot and is found by
+probing the slots after it (open addressing), so no worker holds any session of its own.  To
+save replaying the guesses, each worker caches the games it rebuilt along with the version they
+were rebuilt from, and only trusts them while that is still the slot's version.
+
+Reads take no lock.  A slot's version is a sequence lock: its writer makes it odd, writes the
+slot and makes it even again, and readers retry until they copied the slot between two equal,
+even versions.  Writers of a slot are serialized by one of ``STRIPES`` locks picked by the slot,
+and adding or removing sessions, which changes the probe chains, by one more lock.  This relies
+on the stores of a writer becoming visible to other cores in order, as they do on x86-64.
+"""
+
+import multiprocessing
+import os
+import secrets
+import struct
+import sys
+import time
+from collections import OrderedDict
+from multiprocessing import resource_tracker
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable
+
+import numpy as np
+
+from .dictionary import get_word_index  # type: ignore
+from .event_log import pack_letters, unpack_letters  # type: ignore
+from .feedback import DIGIT_STATUSES, GuessStatus  # type: ignore
+from .game_state import GameState, InvalidEntryError  # type: ignore
+from .word_store import available_lengths, load_word_store  # type: ignore
+
+SLOT_TURNS = 8
+STRIPES = 64
+# Session ids of the slots never used and of the slots whose session was removed
+EMPTY, REMOVED = 0, 1
+# Times a read is retried while its slot is being written before waiting on the writer's lock
+SPIN_READS = 100
+# Games each process keeps rebuilt, most recently used last
+CACHED_GAMES = 10_000
+# The live session count, padded to a cache line
+HEADER_BYTES = 64
+# A slot as the workers read and write it: its version, then the rest (its body)
+VERSION = struct.Struct("<Q")
+SLOT_BODY = struct.Struct(f"<Qd{SLOT_TURNS}Q{SLOT_TURNS}IIBB26s")
+# Positions in an unpacked body: session id, last use, guesses, codes, answer, word length,
+# turns and letters
+GUESSES = 2
+CODES = GUESSES + SLOT_TURNS
+ANSWER = CODES + SLOT_TURNS
+WORD_LENGTH, TURNS, LETTERS = ANSWER + 1, ANSWER + 2, ANSWER + 3
+SLOT_BODY_FIELDS = LETTERS + 1
+# The same slot as columns, for scans over every session
+SLOT_TYPE = np.dtype(
+    [
+        ("version", "<u8"),
+        ("session", "<u8"),
+        ("last_used", "<f8"),
+        ("guesses", "<u8", (SLOT_TURNS,)),
+        ("codes", "<u4", (SLOT_TURNS,)),
+        ("answer", "<u4"),
+        ("word_length", "u1"),
+        ("turns", "u1"),
+        ("letters", "u1", (26,)),
+    ],
+    align=True,
+)
+
+
+def _attach(name: str) -> SharedMemory:
+    """Maps an existing block, leaving its removal to the process which created it"""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    memory = SharedMemory(name)
+    # Before 3.13 every process mapping a block would otherwise remove it when exiting.  Only
+    # POSIX blocks are tracked, under their name with the leading slash
+    if os.name == "posix":
+        resource_tracker.unregister(f"/{memory.name}", "shared_memory")
+    return memory
+
+
+def _session_key(session_id: str) -> int:
+    """Numeric form of a session id, failing like an unknown session when malformed"""
+    if len(session_id) == 16:
+        try:
+            key = int(session_id, 16)
+        except ValueError:
+            key = EMPTY
+        if key > REMOVED:
+            return key
+    raise InvalidEntryError(f"unknown session {session_id}")
+
+
+def random_game(word_length: int, rng=None) -> tuple[int, GameState]:
+    """
+    Starts a game with a random answer, as the session stores do
+    Args:
+        word_length: one of the ``word_store.available_lengths()``
+        rng: Optional random generator picking the answer
+
+    Returns:
+        tuple of the index of the answer in the word list of its length and the game
+    """
+    lengths = available_lengths()
+    if word_length not in lengths:
+        raise InvalidEntryError(f"word length must be one of {lengths}")
+    store = load_word_store(word_length)
+    answer = store.random_index(rng)
+    return answer, GameState(
+        store[answer], word_length, dictionary=get_word_index(word_length)
+    )
+
+
+def _game(body: tuple | list) -> GameState:
+    """Rebuilds the game held by an unpacked slot body"""
+    word_length = body[WORD_LENGTH]
+    turns = body[TURNS]
+    guesses_end = GUESSES + turns
+    codes_end = CODES + turns
+    return GameState.from_history(
+        load_word_store(word_length)[body[ANSWER]],
+        word_length,
+        [unpack_letters(packed) for packed in body[GUESSES:guesses_end]],
+        list(body[CODES:codes_end]),
+        dictionary=get_word_index(word_length),
+    )
+
+
+class SharedSessionStore:  # pylint: disable=R0902
+    """
+    Games by session id in shared memory, with the interface of ``server.SessionStore``.  Each
+    worker process uses the store it inherited, or received as a ``Process`` argument.  A full
+    store refuses new sessions rather than evicting the least recently used one, which would
+    mean scanning every slot.
+    """
+
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        idle_timeout: float = 600.0,
+        max_sessions: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+        rng=None,
+        context: BaseContext | None = None,
+    ):
+        """
+        Creates an empty store in a new shared memory block
+        Args:
+            idle_timeout: seconds after its last use at which a session is evicted
+            max_sessions: number of sessions above which new ones are refused
+            clock: source of the current time in seconds, the same in every process
+            rng: Optional random generator picking the answers
+            context: Optional ``multiprocessing`` context the workers are started with,
+                defaults to the default start method's
+        """
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.clock = clock
+        self.rng = rng
+        # Sessions are not logged, as several processes can not share one event log
+        self.event_log = None
+        # Evicted by this process
+        self.evicted = 0
+        # At least twice as many slots as sessions keeps the probe chains short
+        self.capacity = 1 << (2 * max_sessions - 1).bit_length()
+        # Version each game was rebuilt from, by numeric session id
+        self._games: OrderedDict[int, tuple[int, GameState]] = OrderedDict()
+        # Fresh blocks are zero filled: every slot EMPTY at version 0
+        self._memory = SharedMemory(
+            create=True, size=HEADER_BYTES + self.capacity * SLOT_TYPE.itemsize
+        )
+        context = context or multiprocessing.get_context()
+        self._structure_lock = context.Lock()
+        self._stripes = [context.Lock() for _ in range(STRIPES)]
+        self._map()
+
+    def _map(self):
+        """Lays the header and slot arrays over the block"""
+        self._buffer = self._memory.buf
+        self._header = np.ndarray(1, "<u8", self._memory.buf)
+        self._slots = np.ndarray(
+            self.capacity, SLOT_TYPE, self._memory.buf, offset=HEADER_BYTES
+        )
+        self._versions = self._slots["version"]
+        self._ids = self._slots["session"]
+        self._last_used = self._slots["last_used"]
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        for name in ("_buffer", "_header", "_slots", "_versions", "_ids", "_last_used"):
+            del state[name]
+        state["_memory"] = self._memory.name
+        state["_games"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._memory = _attach(state["_memory"])
+        self._map()
+
+    def __len__(self) -> int:
+        return int(self._header[0])
+
+    @staticmethod
+    def _offset(slot: int) -> int:
+        """Position of a slot in the block"""
+        return HEADER_BYTES + slot * SLOT_TYPE.itemsize
+
+    def _find(self, key: int) -> int:
+        """Probes for the slot of a session, -1 when it is not in the store"""
+        ids = self._ids
+        mask = self.capacity - 1
+        slot = key & mask
+        for _ in range(self.capacity):
+            found = ids.item(slot)
+            if found == key:
+                return slot
+            if found == EMPTY:
+                break
+            slot = (slot + 1) & mask
+        return -1
+
+    def _locate(self, session_id: str) -> tuple[int, int]:
+        """Finds the numeric id and slot of a session, failing when it is not in the store"""
+        key = _session_key(session_id)
+        slot = self._find(key)
+        if slot < 0:
+            raise InvalidEntryError(f"unknown session {session_id}")
+        return key, slot
+
+    def _read(self, session_id: str) -> tuple[int, int, tuple]:
+        """Copies the slot of a session as of one version, returning its slot and version"""
+        key, slot = self._locate(session_id)
+        buffer = self._buffer
+        offset = self._offset(slot)
+        for _ in range(SPIN_READS):
+            (version,) = VERSION.unpack_from(buffer, offset)
+            if version & 1:
+                continue
+            body = SLOT_BODY.unpack_from(buffer, offset + VERSION.size)
+            if VERSION.unpack_from(buffer, offset)[0] == version:
+                break
+        else:
+            # Still being written: wait for the writer to be done
+            with self._stripes[slot % STRIPES]:
+                (version,) = VERSION.unpack_from(buffer, offset)
+                body = SLOT_BODY.unpack_from(buffer, offset + VERSION.size)
+        if body[0] != key:
+            # Removed, and maybe reused, since it was found
+            raise InvalidEntryError(f"unknown session {session_id}")
+        return slot, version, body
+
+    def _write(self, slot: int, body: tuple | list) -> int:
+        """Replaces the body of a slot, holding its stripe lock, and returns its new version"""
+        buffer = self._buffer
+        offset = self._offset(slot)
+        (version,) = VERSION.unpack_from(buffer, offset)
+        VERSION.pack_into(buffer, offset, version + 1)
+        SLOT_BODY.pack_into(buffer, offset + VERSION.size, *body)
+        VERSION.pack_into(buffer, offset, version + 2)
+        return version + 2
+
+    def _cached(self, key: int, version: int, body: tuple | list) -> GameState:
+        """The game of a slot body, rebuilt unless this process has it as of the version"""
+        cached = self._games.get(key)
+        if cached is not None and cached[0] == version:
+            self._games.move_to_end(key)
+            return cached[1]
+        game = _game(body)
+        self._cache(key, version, game)
+        return game
+
+    def _cache(self, key: int, version: int, game: GameState):
+        """Keeps a game as of a version, forgetting the least recently used over the limit"""
+        self._games[key] = (version, game)
+        self._games.move_to_end(key)
+        if len(self._games) > CACHED_GAMES:
+            self._games.popitem(last=False)
+
+    def create(self, word_length: int) -> tuple[str, GameState]:
+        """
+        Starts a game with a random answer
+        Args:
+            word_length: one of the ``word_store.available_lengths()``
+
+        Returns:
+            tuple of the new session id and its game
+        """
+        answer, game = random_game(word_length, self.rng)
+        mask = self.capacity - 1
+        with self._structure_lock:
+            if len(self) >= self.max_sessions:
+                raise InvalidEntryError("too many sessions, try again later")
+            key = secrets.randbits(64)
+            while key <= REMOVED or self._find(key) >= 0:
+                key = secrets.randbits(64)
+            # The first free slot of the id's chain
+            slot = key & mask
+            while self._ids.item(slot) > REMOVED:
+                slot = (slot + 1) & mask
+            body: list[Any] = [0] * SLOT_BODY_FIELDS
+            body[0], body[1], body[ANSWER] = key, self.clock(), answer
+            body[WORD_LENGTH], body[LETTERS] = word_length, bytes(26)
+            with self._stripes[slot % STRIPES]:
+                version = self._write(slot, body)
+            self._header[0] += 1
+        self._cache(key, version, game)
+        return format(key, "016x"), game
+
+    def get(self, session_id: str) -> GameState:
+        """
+        Looks up a session, marking it as used
+        Args:
+            session_id: id handed out by ``create``
+
+        Returns:
+            the session's game as of its latest guess, kept by this process until it changes
+        """
+        slot, version, body = self._read(session_id)
+        # One aligned store which every racing writer makes with a recent time, so no lock
+        self._last_used[slot] = self.clock()
+        return self._cached(body[0], version, body)
+
+    def version(self, session_id: str) -> int:
+        """
+        Reads the version counter of a session, which grows by 2 with every change
+        Args:
+            session_id: id handed out by ``create``
+
+        Returns:
+            the version
+        """
+        return self._read(session_id)[1]
+
+    def char_tracker(self, session_id: str) -> dict[str, GuessStatus]:
+        """
+        Reads the best status of each letter used in a session, without rebuilding its game
+        Args:
+            session_id: id handed out by ``create``
+
+        Returns:
+            dict keyed by upper-case letter, as ``GameState.char_tracker``
+        """
+        letters = self._read(session_id)[2][LETTERS]
+        return {
+            chr(65 + letter): GuessStatus(status)
+            for letter, status in enumerate(letters)
+            if status
+        }
+
+    def play(self, session_id: str, guess: str) -> GameState:
+        """
+        Makes a guess in a session
+        Args:
+            session_id: id handed out by ``create``
+            guess: the guess
+
+        Returns:
+            the session's game, including the guess
+        """
+        key, slot = self._locate(session_id)
+        offset = self._offset(slot)
+        with self._stripes[slot % STRIPES]:
+            # No other writer while the lock is held, so the slot is read as it is
+            (version,) = VERSION.unpack_from(self._buffer, offset)
+            body = list(SLOT_BODY.unpack_from(self._buffer, offset + VERSION.size))
+            if body[0] != key:
+                raise InvalidEntryError(f"unknown session {session_id}")
+            game = self._cached(key, version, body)
+            # Validated before anything is recorded, so the cached game is intact on failure
+            game.make_guess(guess)
+            turn = game.guess_count - 1
+            code = game.feedback[-1]
+            body[1] = self.clock()
+            body[GUESSES + turn] = pack_letters(guess)
+            body[CODES + turn] = code
+            body[TURNS] = turn + 1
+            # Raised by the new guess the way ``char_tracker`` is, rather than rebuilt from it
+            letters = bytearray(body[LETTERS])
+            for char in guess.upper():
+                code, digit = divmod(code, 3)
+                letter = ord(char) - 65
+                letters[letter] = max(letters[letter], DIGIT_STATUSES[digit])
+            body[LETTERS] = bytes(letters)
+            self._cache(key, self._write(slot, body), game)
+        return game
+
+    def _release(self, slot: int):
+        """Removes the session of a slot, holding the structure lock"""
+        self._games.pop(self._ids.item(slot), None)
+        with self._stripes[slot % STRIPES]:
+            self._versions[slot] += 1
+            self._ids[slot] = REMOVED
+            self._versions[slot] += 1
+        self._header[0] -= 1
+        # No chain runs past an EMPTY slot, so the removed slots right before one end no chain
+        # and become EMPTY again, keeping the probes for unknown ids short
+        mask = self.capacity - 1
+        if self._ids.item((slot + 1) & mask) == EMPTY:
+            while self._ids.item(slot) == REMOVED:
+                self._ids[slot] = EMPTY
+                slot = (slot - 1) & mask
+
+    def remove(self, session_id: str):
+        """
+        Ends a session
+        Args:
+            session_id: id handed out by ``create``
+        """
+        key = _session_key(session_id)
+        with self._structure_lock:
+            slot = self._find(key)
+            if slot < 0:
+                raise InvalidEntryError(f"unknown session {session_id}")
+            self._release(slot)
+
+    def evict_idle(self) -> int:
+        """
+        Drops the sessions which have not been used within the idle timeout
+        Returns:
+            number of sessions evicted
+        """
+        cutoff = self.clock() - self.idle_timeout
+        evicted = 0
+        with self._structure_lock:
+            idle = (self._ids > REMOVED) & (self._last_used <= cutoff)
+            for slot in np.flatnonzero(idle).tolist():
+                # Used again since the scan
+                if self._last_used[slot] > cutoff:
+                    continue
+                self._release(slot)
+                evicted += 1
+        self.evicted += evicted
+        return evicted
+
+    def checkpoint(self):
+        """
+        Does nothing, as shared sessions have no event log to sync
+        """
+
+    def close(self):
+        """
+        Unmaps the block from this process
+        """
+        self._header = self._slots = self._versions = self._ids = self._last_used = None
+        self._buffer = None
+        self._memory.close()
+
+    def unlink(self):
+        """
+        Frees the block once every process has closed it.  Called by the process which created
+        the store, when its workers are done
+        """
+        self._memory.unlink()
@@ -0,0 +1,401 @@
+"""
+Headless harness which plays complete games through a guessing strategy, without Rich or stdin,
+fanned out across processes.  Per game results are streamed to a JSONL or CSV file and a summary
+of win rate, guess distribution and throughput is reported.
+
+Run with ``python -m src.wordall.simulate --help``
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Protocol
+
+import numpy as np
+
+from .candidates import CandidatePool  # type: ignore
+from .game_state import GameState, InvalidEntryError  # type: ignore
+from .opening_book import OpeningBook, open_opening_book  # type: ignore
+from .pattern_matrix import find_pattern_matrix  # type: ignore
+from .solver import best_guess  # type: ignore
+from .word_store import open_word_store, word_source_path  # type: ignore
+
+STRATEGIES = ("random", "solver", "transcript")
+OUTPUT_FORMATS = ("jsonl", "csv")
+CSV_FIELDS = ("answer", "solved", "turns", "guesses", "seconds")
+
+
+class Strategy(Protocol):  # pylint: disable=R0903
+    """
+    Anything which can choose the next guess of a running game
+    """
+
+    def next_guess(self, game: GameState) -> str:
+        """
+        Chooses the next guess
+        Args:
+            game: the running game, tracking its candidates
+
+        Returns:
+            the guess to play
+        """
+
+
+class RandomStrategy:  # pylint: disable=R0903
+    """
+    Guesses a random word out of the answers which are still possible.  The generator is
+    reseeded from the answer at the start of every game, so a game plays out the same way no
+    matter which process plays it.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def next_guess(self, game: GameState) -> str:  # pylint: disable=C0116
+        if not game.guesses and self.seed is not None:
+            self.rng.seed(f"{self.seed}:{game.word}")
+        guess = game.candidates.hint(self.rng)
+        if guess is None:
+            # The answer is not in the list and every word of it has been ruled out
+            raise InvalidEntryError(f"No candidate left for {game.word}")
+        return guess
+
+
+class SolverStrategy:  # pylint: disable=R0903
+    """
+    Plays the entropy maximizing solver's suggestion, from the opening book when one is given.
+    Without a book the first two moves are remembered, since they repeat across games.  Given
+    the word list's feedback matrix, the solver reads the codes from it instead of scoring.
+    """
+
+    MEMO_TURNS = 2
+
+    def __init__(
+        self, book: OpeningBook | None = None, matrix: np.ndarray | None = None
+    ):
+        self.book = book
+        self.matrix = matrix
+        self._memo: dict[tuple, str] = {}
+
+    def next_guess(self, game: GameState) -> str:  # pylint: disable=C0116
+        if len(game.guesses) >= self.MEMO_TURNS:
+            return self._solve(game)
+        history = (tuple(game.guesses), tuple(game.feedback))
+        if history not in self._memo:
+            self._memo[history] = self._solve(game)
+        return self._memo[history]
+
+    def _solve(self, game: GameState) -> str:
+        """Asks the solver, ending the game once no word of the list fits the feedback"""
+        guess = best_guess(game, book=self.book, matrix=self.matrix)
+        if guess is None:
+            raise InvalidEntryError(f"No candidate left for {game.word}")
+        return guess
+
+
+class TranscriptStrategy:  # pylint: disable=R0903
+    """
+    Replays recorded guesses.  Transcripts are keyed by answer, a game ends unsolved once its
+    transcript runs out of recorded guesses.
+    """
+
+    def __init__(self, transcripts: dict[str, list[str]]):
+        self.transcripts = transcripts
+
+    def next_guess(self, game: GameState) -> str:  # pylint: disable=C0116
+        recorded = self.transcripts.get(game.word, [])
+        turn = len(game.guesses)
+        if turn >= len(recorded):
+            raise InvalidEntryError(f"No recorded guess {turn + 1} for {game.word}")
+        return recorded[turn]
+
+    @classmethod
+    def from_file(cls, path: Path) -> "TranscriptStrategy":
+        """
+        Reads transcripts back from a results file written by this harness (JSONL)
+        Args:
+            path: results file
+
+        Returns:
+            strategy replaying the recorded games
+        """
+        with path.open(encoding="utf-8") as transcript_file:
+            records = (json.loads(line) for line in transcript_file if line.strip())
+            return cls({record["answer"]: record["guesses"] for record in records})
+
+
+class GameResult(NamedTuple):
+    """
+    Outcome of one simulated game
+    """
+
+    answer: str
+    solved: bool
+    turns: int
+    guesses: list[str]
+    seconds: float
+
+
+class SimulationSummary(NamedTuple):
+    """
+    Aggregate outcome of a simulation run
+    """
+
+    games: int
+    wins: int
+    distribution: dict[int, int]
+    seconds: float
+
+    @property
+    def win_rate(self) -> float:
+        """
+        Share of the games which were solved
+        Returns:
+            value between 0 and 1
+        """
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        """
+        Average number of guesses in the games which were solved
+        Returns:
+            the mean, or 0 when no game was solved
+        """
+        total = sum(
+            turns * count for turns, count in self.distribution.items() if turns
+        )
+        return total / self.wins if self.wins else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """
+        Throughput of the run
+        Returns:
+            games played per second of wall clock time
+        """
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+def play_game(answer: str, strategy: Strategy, pool: CandidatePool) -> GameResult:
+    """
+    Plays a single game to completion
+    Args:
+        answer: the word to find
+        strategy: chooses each guess
+        pool: possible answers of the word length
+
+    Returns:
+        the result of the game
+    """
+    start = time.perf_counter()
+    game = GameState(answer, pool.word_length, candidate_pool=pool)
+    while game.remaining_guesses > 0:
+        try:
+            game.make_guess(strategy.next_guess(game))
+        except InvalidEntryError:
+            break
+    return GameResult(
+        answer,
+        game.is_solved,
+        len(game.guesses),
+        list(game.guesses),
+        time.perf_counter() - start,
+    )
+
+
+# Strategy and pool of a worker process, created once when the worker starts
+_WORKER_STATE: dict = {}
+
+
+def make_strategy(
+    name: str,
+    pool: CandidatePool,
+    seed: int | None = None,
+    transcript: Path | None = None,
+) -> Strategy:
+    """
+    Creates a strategy by name
+    Args:
+        name: one of ``STRATEGIES``
+        pool: possible answers of the word length
+        seed: seed for the random strategy
+        transcript: results file replayed by the transcript strategy
+
+    Returns:
+        the strategy
+    """
+    if name == "random":
+        return RandomStrategy(seed)
+    if name == "solver":
+        # Worker processes all map the same matrix file, if one has been built for the list
+        return SolverStrategy(
+            open_opening_book(pool.store), find_pattern_matrix(pool.store)
+        )
+    if name == "transcript":
+        if transcript is None:
+            raise ValueError("The transcript strategy needs a transcript file")
+        return TranscriptStrategy.from_file(transcript)
+    raise ValueError(
+        f"Unknown strategy {name!r}, expected one of {', '.join(STRATEGIES)}"
+    )
+
+
+def _init_worker(word_source: Path, strategy_name: str, seed, transcript):
+    """Builds the pool and strategy of a worker process"""
+    pool = CandidatePool(open_word_store(word_source))
+    _WORKER_STATE["pool"] = pool
+    _WORKER_STATE["strategy"] = make_strategy(strategy_name, pool, seed, transcript)
+
+
+def _play_in_worker(answer: str) -> GameResult:
+    """Plays one game with the worker's strategy"""
+    return play_game(answer, _WORKER_STATE["strategy"], _WORKER_STATE["pool"])
+
+
+def run_games(  # pylint: disable=R0913
+    answers: list[str],
+    word_source: Path,
+    strategy_name: str,
+    *,
+    workers: int = 1,
+    seed: int | None = None,
+    transcript: Path | None = None,
+) -> Iterator[GameResult]:
+    """
+    Plays one game per answer, yielding the results in the same order as the answers while
+    later games are still being played
+    Args:
+        answers: the answer of each game
+        word_source: plain text word list of the possible answers
+        strategy_name: one of ``STRATEGIES``
+        workers: number of worker processes.  1 plays in the calling process
+        seed: seed for the random strategy
+        transcript: results file replayed by the transcript strategy
+
+    Returns:
+        iterator over the game results
+    """
+    if workers <= 1:
+        _init_worker(word_source, strategy_name, seed, transcript)
+        yield from map(_play_in_worker, answers)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(word_source, strategy_name, seed, transcript),
+    ) as executor:
+        chunk_size = max(1, min(256, len(answers) // (workers * 8)))
+        yield from executor.map(_play_in_worker, answers, chunksize=chunk_size)
+
+
+def write_results(
+    results: Iterable[GameResult], output, output_format: str = "jsonl"
+) -> SimulationSummary:
+    """
+    Streams results to a file while tallying the summary
+    Args:
+        results: game results, typically straight from ``run_games``
+        output: writable text file, or None to only summarize
+        output_format: one of ``OUTPUT_FORMATS``
+
+    Returns:
+        summary of the results
+    """
+    start = time.perf_counter()
+    writer = None
+    if output is not None and output_format == "csv":
+        writer = csv.writer(output)
+        writer.writerow(CSV_FIELDS)
+    games = wins = 0
+    distribution: Counter = Counter()
+    for result in results:
+        games += 1
+        wins += result.solved
+        # Lost games are counted under 0 guesses
+        distribution[result.turns if result.solved else 0] += 1
+        if writer is not None:
+            writer.writerow(
+                (
+                    result.answer,
+                    int(result.solved),
+                    result.turns,
+                    " ".join(result.guesses),
+                    f"{result.seconds:.6f}",
+                )
+            )
+        elif output is not None:
+            output.write(json.dumps(result._asdict()) + "\n")
+    return SimulationSummary(
+        games, wins, dict(sorted(distribution.items())), time.perf_counter() - start
+    )
+
+
+def main(arguments: list[str] | None = None) -> SimulationSummary:
+    """
+    Command line entry point
+    Args:
+        arguments: command line arguments, defaults to ``sys.argv``
+
+    Returns:
+        summary of the run
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--length", type=int, default=5, help="letters per word")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="random")
+    parser.add_argument(
+        "--games", type=int, help="number of games (default: every answer)"
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--seed", type=int, help="seed for answer order and random guesses"
+    )
+    parser.add_argument("--transcript", type=Path, help="JSONL results file to replay")
+    parser.add_argument(
+        "--output", type=Path, help="file to stream per game results to"
+    )
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="jsonl")
+    parser.add_argument("--words", type=Path, help="word list (default: shipped list)")
+    options = parser.parse_args(arguments)
+
+    word_source = options.words or word_source_path(options.length)
+    if options.strategy == "transcript" and options.transcript:
+        answers = list(TranscriptStrategy.from_file(options.transcript).transcripts)
+    else:
+        answers = list(open_word_store(word_source))
+        random.Random(options.seed).shuffle(answers)
+    if options.games is not None:
+        answers = (answers * (options.games // len(answers) + 1))[: options.games]
+
+    results = run_games(
+        answers,
+        word_source,
+        options.strategy,
+        workers=options.workers,
+        seed=options.seed,
+        transcript=options.transcript,
+    )
+    if options.output:
+        with options.output.open("w", encoding="utf-8", newline="") as output:
+            summary = write_results(results, output, options.format)
+    else:
+        summary = write_results(results, None)
+
+    print(f"games          {summary.games}")
+    print(f"win rate       {summary.win_rate:.2%}")
+    print(f"mean guesses   {summary.mean_guesses:.3f}")
+    for turns, count in summary.distribution.items():
+        print(f"  {turns or 'X'}: {count}")
+    print(f"games/second   {summary.games_per_second:.1f}")
+    return summary
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,324 @@
+"""
+Picks the next guess which is expected to reveal the most information about the answer, i.e.
+the guess whose feedback splits the remaining candidates most evenly.  Ranking a whole dictionary
+is CPU bound, so guesses can be sharded across a pool of worker processes
+"""
+
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from .batch_feedback import DEFAULT_BLOCK_PAIRS, score_block  # type: ignore
+from .constraints import NORMAL  # type: ignore
+
+if TYPE_CHECKING:
+    # Only for annotations: importing the tracker at runtime would load pydantic with the hints
+    from .game_state import GameState  # type: ignore
+    from .game_tracker import GameTracker  # type: ignore
+    from .opening_book import OpeningBook  # type: ignore
+
+DEFAULT_SHARD_SIZE = 512
+
+# Arrays shared by every shard a worker process scores, sent once when the worker starts
+_WORKER_STATE: dict[str, np.ndarray] = {}
+
+
+class RankedGuess(NamedTuple):
+    """
+    A guess (by its index in the guess list) and the information its feedback is expected to
+    reveal, in bits
+    """
+
+    guess_index: int
+    entropy: float
+
+
+def guess_entropies(
+    guesses: np.ndarray,
+    candidates: np.ndarray,
+    block_pairs: int = DEFAULT_BLOCK_PAIRS,
+) -> np.ndarray:
+    """
+    Computes the expected information of each guess over equally likely candidates
+    Args:
+        guesses: uint8 letter array of shape (G, L)
+        candidates: uint8 letter array of shape (C, L) of the answers still possible
+        block_pairs: maximum number of pairs scored at once
+
+    Returns:
+        float64 array of shape (G,) holding the entropy, in bits, of each guess' feedback
+    """
+    entropies = np.zeros(len(guesses))
+    count = len(candidates)
+    if count == 0:
+        return entropies
+    patterns = 3 ** guesses.shape[1]
+    # Bounded by the pairs scored and by the size of the per-row pattern histograms
+    rows_per_block = max(1, block_pairs // max(count, patterns))
+    for start in range(0, len(guesses), rows_per_block):
+        end = start + rows_per_block
+        codes = score_block(guesses[start:end], candidates)
+        entropies[start:end] = _code_entropies(codes, patterns)
+    return entropies
+
+
+def matrix_entropies(
+    matrix: np.ndarray,
+    candidate_indices: np.ndarray,
+    word_length: int,
+    block_pairs: int = DEFAULT_BLOCK_PAIRS,
+    rows: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Computes the expected information of guesses of a word list over equally likely
+    candidates, reading the feedback codes out of the list's pattern matrix rather than scoring
+    Args:
+        matrix: (N, N) feedback matrix of the word list (see ``pattern_matrix``)
+        candidate_indices: indexes into the word list of the answers still possible
+        word_length: number of letters in the words of the list
+        block_pairs: maximum number of codes gathered at once
+        rows: optional indexes into the word list of the guesses, every word by default
+
+    Returns:
+        float64 array holding the entropy, in bits, of each guess' feedback
+    """
+    entropies = np.zeros(len(matrix) if rows is None else len(rows))
+    count = len(candidate_indices)
+    if count == 0:
+        return entropies
+    patterns = 3**word_length
+    rows_per_block = max(1, block_pairs // max(count, patterns))
+    for start in range(0, len(entropies), rows_per_block):
+        end = start + rows_per_block
+        # Only the cells of the block are read, the matrix itself is never copied
+        if rows is None:
+            codes = np.take(matrix[start:end], candidate_indices, axis=1)
+        else:
+            codes = matrix[np.ix_(rows[start:end], candidate_indices)]
+        entropies[start:end] = _code_entropies(codes, patterns)
+    return entropies
+
+
+def _code_entropies(codes: np.ndarray, patterns: int) -> np.ndarray:
+    """Computes the entropy of each row of feedback codes, one row per guess"""
+    count = codes.shape[1]
+    codes = codes.astype(np.int64)
+    codes += np.arange(len(codes))[:, None] * patterns
+    counts = np.bincount(codes.ravel(), minlength=len(codes) * patterns)
+    sizes = counts.reshape(len(codes), patterns).astype(np.float64)
+    # H = log2(C) - sum(n * log2(n)) / C over the non-empty feedback buckets
+    weighted = sizes * np.log2(sizes, out=np.zeros_like(sizes), where=sizes > 0)
+    return math.log2(count) - weighted.sum(axis=1) / count
+
+
+def _init_worker(guesses: np.ndarray, candidates: np.ndarray):
+    """Keeps the arrays every shard of the ranking needs in the worker process"""
+    _WORKER_STATE["guesses"] = guesses
+    _WORKER_STATE["candidates"] = candidates
+
+
+def _score_shard(start: int, end: int) -> tuple[int, np.ndarray]:
+    """Computes the entropies of one shard of guesses inside a worker process"""
+    guesses = _WORKER_STATE["guesses"][start:end]
+    return start, guess_entropies(guesses, _WORKER_STATE["candidates"])
+
+
+def rank_guesses(  # pylint: disable=R0913,R0914
+    guesses: np.ndarray,
+    candidates: np.ndarray,
+    *,
+    workers: int = 1,
+    top_k: int | None = None,
+    time_budget: float | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> list[RankedGuess]:
+    """
+    Ranks guesses by the information their feedback is expected to reveal.  Ties are broken in
+    favour of guesses which could be the answer themselves, then by position in the guess list,
+    so the result does not depend on how the work was sharded.
+    Args:
+        guesses: uint8 letter array of shape (G, L) of the words which may be guessed
+        candidates: uint8 letter array of shape (C, L) of the answers still possible
+        workers: number of worker processes.  1 scores in the calling process
+        top_k: optional number of best guesses to return
+        time_budget: optional number of seconds after which only the shards finished so far
+            are ranked
+        shard_size: number of guesses scored per unit of work
+
+    Returns:
+        the guesses, best first
+    """
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    entropies = np.full(len(guesses), -1.0)
+    shards = [
+        (start, min(start + shard_size, len(guesses)))
+        for start in range(0, len(guesses), shard_size)
+    ]
+    if workers <= 1:
+        for start, end in shards:
+            entropies[start:end] = guess_entropies(guesses[start:end], candidates)
+            if deadline is not None and time.monotonic() > deadline:
+                break
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(guesses, candidates),
+        )
+        pending = {executor.submit(_score_shard, *shard) for shard in shards}
+        try:
+            while pending:
+                timeout = (
+                    None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+                done, pending = wait(
+                    pending, timeout=timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    start, shard_entropies = future.result()
+                    end = start + len(shard_entropies)
+                    entropies[start:end] = shard_entropies
+                if not done and (entropies >= 0).any():
+                    break
+                if not done:
+                    # Out of time before any shard finished; settle for the first one
+                    deadline = None
+        finally:
+            # Shards already running cannot be cancelled, so when out of time they are left to
+            # finish in the background rather than waited for
+            executor.shutdown(wait=not pending, cancel_futures=True)
+
+    return _ranked(entropies, guesses, candidates, top_k)
+
+
+def _ranked(
+    entropies: np.ndarray,
+    guesses: np.ndarray,
+    candidates: np.ndarray,
+    top_k: int | None,
+) -> list[RankedGuess]:
+    """Orders the guesses which were scored (those without a negative entropy), best first"""
+    scored = np.flatnonzero(entropies >= 0)
+    possible = _is_candidate(guesses[scored], candidates)
+    # lexsort uses the last key as the primary one
+    order = scored[np.lexsort((scored, ~possible, -entropies[scored]))]
+    return [RankedGuess(int(index), float(entropies[index])) for index in order[:top_k]]
+
+
+def _is_candidate(guesses: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Flags the guesses which are also among the candidates"""
+    candidate_words = {word.tobytes() for word in candidates}
+    return np.fromiter(
+        (word.tobytes() in candidate_words for word in guesses),
+        dtype=bool,
+        count=len(guesses),
+    )
+
+
+def best_guess_index(  # pylint: disable=R0913
+    words: np.ndarray,
+    candidate_indices: np.ndarray,
+    workers: int = 1,
+    time_budget: float | None = None,
+    matrix: np.ndarray | None = None,
+    *,
+    matrix_indices: np.ndarray | None = None,
+) -> int | None:
+    """
+    Picks the next guess out of a word list, given which of its words are still possible
+    Args:
+        words: uint8 letter array of shape (N, L) of every word which may be guessed
+        candidate_indices: indexes into ``words`` of the answers still possible
+        workers: number of worker processes to rank with
+        time_budget: optional number of seconds to spend ranking
+        matrix: optional (N, N) feedback matrix of ``words`` to read the codes from.  Reading
+            is cheap enough to rank every guess in the calling process, so ``workers`` and
+            ``time_budget`` only apply when scoring
+        matrix_indices: positions of ``words`` in the matrix's word list, when they are only
+            part of it
+
+    Returns:
+        index of the suggested guess, or None when no candidate remains
+    """
+    if len(candidate_indices) == 0:
+        return None
+    if len(candidate_indices) <= 2:
+        # Guessing a candidate can win outright and does at least as well as anything else
+        return int(candidate_indices[0])
+    if matrix is not None:
+        if matrix_indices is None:
+            entropies = matrix_entropies(matrix, candidate_indices, words.shape[1])
+        else:
+            entropies = matrix_entropies(
+                matrix,
+                matrix_indices[candidate_indices],
+                words.shape[1],
+                rows=matrix_indices,
+            )
+        ranked = _ranked(entropies, words, words[candidate_indices], top_k=1)
+        return ranked[0].guess_index
+    ranked = rank_guesses(
+        words,
+        words[candidate_indices],
+        workers=workers,
+        top_k=1,
+        time_budget=time_budget,
+    )
+    return ranked[0].guess_index
+
+
+def best_guess(
+    game: "GameTracker | GameState",
+    workers: int = 1,
+    time_budget: float | None = None,
+    book: "OpeningBook | None" = None,
+    matrix: np.ndarray | None = None,
+) -> str | None:
+    """
+    Suggests the next guess for a game which tracks its candidates (see the game's
+    ``candidate_pool``).  Any word of the pool may be suggested, not just the candidates, unless
+    the game is played in hard mode.
+    Args:
+        game: the running game
+        workers: number of worker processes to rank with
+        time_budget: optional number of seconds to spend ranking
+        book: optional opening book to take the move from while the game is still in it
+        matrix: optional feedback matrix of the pool's word list (see ``pattern_matrix``) to
+            read the codes from instead of scoring
+
+    Returns:
+        the suggested guess, or None when the game does not track candidates or none remain
+    """
+    candidates = game.candidates
+    if candidates is None:
+        return None
+    # In hard mode only the candidates are sure to reuse every revealed letter, and the book's
+    # later moves may not
+    hard = game.mode != NORMAL
+    if book is not None and not (hard and game.guesses):
+        move = book.lookup(game.guesses, game.feedback)
+        if move is not None:
+            return move
+    pool = candidates.pool
+    if hard:
+        indices = candidates.indices
+        index = best_guess_index(
+            pool.letters[indices],
+            np.arange(len(indices)),
+            workers=workers,
+            time_budget=time_budget,
+            matrix=matrix,
+            matrix_indices=indices,
+        )
+        return None if index is None else pool.store[int(indices[index])]
+    index = best_guess_index(
+        pool.letters,
+        candidates.indices,
+        workers=workers,
+        time_budget=time_budget,
+        matrix=matrix,
+    )
+    return None if index is None else pool.store[index]
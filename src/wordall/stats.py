@@ -0,0 +1,439 @@
+"""
+Streaming statistics over finished games: games played, win rate, streaks and the guess count
+distribution per player and overall, per answer totals for finding the hardest answers, and
+daily buckets for rolling windows.  Results are folded into fixed size numpy counters as they
+arrive, one at a time or in vectorized batches, so every query reads counters instead of
+rescanning history.  Players and answers are identified by dense integer ids, answers by their
+index in the word list of the aggregator's word length.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from .word_store import CACHE_DIR  # type: ignore
+
+SECONDS_PER_DAY = 86_400
+DEFAULT_WINDOW_DAYS = 28
+COUNT_TYPE = np.uint32
+
+
+def stats_path(word_length: int, cache_dir: Path = CACHE_DIR) -> Path:
+    """
+    Determines where the statistics of a word length are kept
+    Args:
+        word_length: number of letters in the answers
+        cache_dir: directory holding the statistics
+
+    Returns:
+        Path of the statistics file
+    """
+    return cache_dir / f"stats_{word_length}.npz"
+
+
+class Summary(NamedTuple):
+    """
+    Totals over a set of games.  Streaks are only kept for single players
+    """
+
+    played: int
+    won: int
+    distribution: tuple[int, ...]
+    current_streak: int = 0
+    max_streak: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        """
+        Share of the games which were won
+        Returns:
+            rate between 0 and 1, 0 when no game was played
+        """
+        return self.won / self.played if self.played else 0.0
+
+
+class AnswerStats(NamedTuple):
+    """
+    Totals of the games played against one answer
+    """
+
+    answer: int
+    played: int
+    won: int
+    mean_guesses: float
+
+    @property
+    def win_rate(self) -> float:
+        """
+        Share of the games against the answer which were won
+        Returns:
+            rate between 0 and 1, 0 when no game was played
+        """
+        return self.won / self.played if self.played else 0.0
+
+
+def _summarize(counts: np.ndarray, current_streak: int = 0, max_streak: int = 0):
+    """Builds a summary from a row of guess count buckets, the last bucket holding losses"""
+    distribution = tuple(counts[:-1].tolist())
+    won = sum(distribution)
+    return Summary(won + int(counts[-1]), won, distribution, current_streak, max_streak)
+
+
+def _grown(table: np.ndarray, rows: int) -> np.ndarray:
+    """Copies a table into a larger zeroed one"""
+    grown = np.zeros((rows, *table.shape[1:]), dtype=table.dtype)
+    grown[: len(table)] = table
+    return grown
+
+
+class StatsAggregator:  # pylint: disable=R0902
+    """
+    Incremental counters of finished games.  Each counter table has one bucket per winning
+    guess count plus a last bucket for losses
+    """
+
+    def __init__(
+        self,
+        answer_count: int,
+        max_guesses: int = 6,
+        window_days: int = DEFAULT_WINDOW_DAYS,
+        players: int = 16,
+    ):
+        """
+        Creates empty counters
+        Args:
+            answer_count: number of words in the word list answers are drawn from
+            max_guesses: number of guesses allowed per game
+            window_days: number of most recent days kept for rolling windows
+            players: initial capacity of the player tables, which grow as needed
+        """
+        self.max_guesses = max_guesses
+        self.window_days = window_days
+        buckets = max_guesses + 1
+        self._totals = np.zeros(buckets, dtype=np.int64)
+        self._answers = np.zeros((answer_count, buckets), dtype=COUNT_TYPE)
+        self._players = np.zeros((players, buckets), dtype=COUNT_TYPE)
+        self._current_streaks = np.zeros(players, dtype=COUNT_TYPE)
+        self._max_streaks = np.zeros(players, dtype=COUNT_TYPE)
+        # Ring of daily buckets, the row of day ``d`` being ``d % window_days``
+        self._days = np.zeros((window_days, buckets), dtype=COUNT_TYPE)
+        self.latest_day = -1
+
+    @property
+    def player_capacity(self) -> int:
+        """
+        Number of player ids the tables currently hold
+        Returns:
+            the capacity
+        """
+        return len(self._players)
+
+    def _reserve_players(self, count: int):
+        """Grows the player tables, doubling them, to hold ``count`` players"""
+        if count <= len(self._players):
+            return
+        capacity = max(count, 2 * len(self._players))
+        self._players = _grown(self._players, capacity)
+        self._current_streaks = _grown(self._current_streaks, capacity)
+        self._max_streaks = _grown(self._max_streaks, capacity)
+
+    def _advance_to(self, day: int):
+        """Moves the window forward to a new latest day, clearing the rows it reuses"""
+        if day <= self.latest_day:
+            return
+        first = max(self.latest_day + 1, day - self.window_days + 1)
+        for new_day in range(first, day + 1):
+            self._days[new_day % self.window_days] = 0
+        self.latest_day = day
+
+    def _bucket(self, guesses: int, solved: bool) -> int:
+        """Bucket of a result"""
+        return guesses - 1 if solved else self.max_guesses
+
+    def record(  # pylint: disable=R0913,R0917
+        self,
+        player: int,
+        answer: int,
+        guesses: int,
+        solved: bool,
+        timestamp: float | None = None,
+    ):
+        """
+        Adds one finished game
+        Args:
+            player: id of the player, from 0
+            answer: index of the answer in the word list
+            guesses: number of guesses made
+            solved: whether the last guess found the answer
+            timestamp: seconds since the epoch at which the game ended, defaults to now
+        """
+        bucket = self._bucket(guesses, solved)
+        self._reserve_players(player + 1)
+        self._totals[bucket] += 1
+        self._answers[answer, bucket] += 1
+        self._players[player, bucket] += 1
+        if solved:
+            self._current_streaks[player] += 1
+            self._max_streaks[player] = max(
+                self._max_streaks[player], self._current_streaks[player]
+            )
+        else:
+            self._current_streaks[player] = 0
+        day = int((time.time() if timestamp is None else timestamp) // SECONDS_PER_DAY)
+        self._advance_to(day)
+        if day > self.latest_day - self.window_days:
+            self._days[day % self.window_days, bucket] += 1
+
+    def record_batch(  # pylint: disable=R0913,R0917
+        self,
+        players: np.ndarray,
+        answers: np.ndarray,
+        guesses: np.ndarray,
+        solved: np.ndarray,
+        timestamps: np.ndarray,
+    ):
+        """
+        Adds many finished games at once, in the order they finished
+        Args:
+            players: id of the player of each game
+            answers: index of the answer of each game
+            guesses: number of guesses made in each game
+            solved: whether each game was won
+            timestamps: seconds since the epoch at which each game ended
+        """
+        players = np.asarray(players, dtype=np.int64)
+        if players.size == 0:
+            return
+        solved = np.asarray(solved, dtype=bool)
+        buckets = np.where(
+            solved, np.asarray(guesses, dtype=np.int64) - 1, self.max_guesses
+        )
+        width = self.max_guesses + 1
+        self._reserve_players(int(players.max()) + 1)
+
+        self._totals += np.bincount(buckets, minlength=width)
+        answer_keys = np.asarray(answers, dtype=np.int64) * width + buckets
+        self._answers += (
+            np.bincount(answer_keys, minlength=self._answers.size)
+            .reshape(self._answers.shape)
+            .astype(COUNT_TYPE)
+        )
+        # Sorting the keys keeps the cost independent of the number of players
+        keys, counts = np.unique(players * width + buckets, return_counts=True)
+        self._players.reshape(-1)[keys] += counts.astype(COUNT_TYPE)
+        self._update_streaks(players, solved)
+
+        self._record_days(np.asarray(timestamps, dtype=np.float64), buckets)
+
+    def _record_days(self, timestamps: np.ndarray, buckets: np.ndarray):
+        """Adds the results of a batch which fall within the window to its daily buckets"""
+        days = (timestamps // SECONDS_PER_DAY).astype(np.int64)
+        self._advance_to(int(days.max()))
+        recent = days > self.latest_day - self.window_days
+        width = self.max_guesses + 1
+        day_keys = (days[recent] % self.window_days) * width + buckets[recent]
+        self._days += (
+            np.bincount(day_keys, minlength=self._days.size)
+            .reshape(self._days.shape)
+            .astype(COUNT_TYPE)
+        )
+
+    def _update_streaks(self, players: np.ndarray, solved: np.ndarray):
+        """Folds the results of a batch, in order, into each player's streaks"""
+        order = np.argsort(players, kind="stable")
+        sorted_players, wins = players[order], solved[order].astype(np.int64)
+        losses = wins == 0
+        starts = np.flatnonzero(
+            np.concatenate(([True], sorted_players[1:] != sorted_players[:-1]))
+        )
+        sizes = np.diff(np.append(starts, len(sorted_players)))
+        group_players = sorted_players[starts]
+
+        # Length of the run of wins ending at each game: wins so far less the wins counted
+        # before the latest loss or the start of the player's games
+        won = np.cumsum(wins)
+        base = np.where(losses, won, 0)
+        base[starts] = won[starts] - wins[starts]
+        runs = won - np.maximum.accumulate(base)
+        # Wins before a player's first loss in the batch extend their existing streak
+        lost = np.cumsum(losses)
+        first_run = lost == np.repeat(lost[starts] - losses[starts], sizes)
+        runs += first_run * np.repeat(
+            self._current_streaks[group_players].astype(np.int64), sizes
+        )
+
+        self._current_streaks[group_players] = runs[starts + sizes - 1]
+        self._max_streaks[group_players] = np.maximum(
+            self._max_streaks[group_players], np.maximum.reduceat(runs, starts)
+        )
+
+    def player(self, player: int) -> Summary:
+        """
+        Totals of one player
+        Args:
+            player: id of the player
+
+        Returns:
+            the player's summary, empty for players without games
+        """
+        if player >= len(self._players):
+            return _summarize(np.zeros(self.max_guesses + 1, dtype=COUNT_TYPE))
+        return _summarize(
+            self._players[player],
+            int(self._current_streaks[player]),
+            int(self._max_streaks[player]),
+        )
+
+    def totals(self) -> Summary:
+        """
+        Totals over every game
+        Returns:
+            the summary
+        """
+        return _summarize(self._totals)
+
+    def window(self, days: int = 1, today: int | None = None) -> Summary:
+        """
+        Totals over the most recent days, e.g. 1 for daily and 7 for weekly figures
+        Args:
+            days: number of days up to and including today, at most ``window_days``
+            today: day the window ends on, in days since the epoch, defaults to the current
+                day
+
+        Returns:
+            the summary
+        """
+        if not 0 < days <= self.window_days:
+            raise ValueError(
+                f"the window must be between 1 and {self.window_days} days"
+            )
+        if today is None:
+            today = int(time.time() // SECONDS_PER_DAY)
+        window_days = np.arange(today - days + 1, today + 1)
+        # Only the days the ring still holds have games, later and older days are empty
+        held = (window_days > self.latest_day - self.window_days) & (
+            window_days <= self.latest_day
+        )
+        rows = window_days[held] % self.window_days
+        return _summarize(self._days[rows].sum(axis=0, dtype=np.int64))
+
+    def answer(self, answer: int) -> AnswerStats:
+        """
+        Totals of the games against one answer
+        Args:
+            answer: index of the answer in the word list
+
+        Returns:
+            the answer's totals
+        """
+        counts = self._answers[answer].astype(np.int64)
+        won = int(counts[:-1].sum())
+        guesses = int(counts[:-1] @ np.arange(1, self.max_guesses + 1))
+        return AnswerStats(
+            answer, won + int(counts[-1]), won, guesses / won if won else 0.0
+        )
+
+    def hardest(self, count: int = 10, min_games: int = 1) -> list[AnswerStats]:
+        """
+        Finds the answers with the lowest win rate, ties going to the most guesses needed
+        Args:
+            count: number of answers wanted
+            min_games: games an answer needs before it is considered
+
+        Returns:
+            the hardest answers, hardest first
+        """
+        counts = self._answers.astype(np.int64)
+        won = counts[:, :-1].sum(axis=1)
+        played = won + counts[:, -1]
+        guesses = counts[:, :-1] @ np.arange(1, self.max_guesses + 1)
+        eligible = np.flatnonzero(played >= max(min_games, 1))
+        win_rate = won[eligible] / played[eligible]
+        mean_guesses = guesses[eligible] / np.maximum(won[eligible], 1)
+        ranked = eligible[np.lexsort((-mean_guesses, win_rate))[:count]]
+        return [self.answer(int(answer)) for answer in ranked]
+
+    def save(self, path: Path, digest: bytes = b""):
+        """
+        Stores the counters, replacing the file atomically
+        Args:
+            path: file to write, typically from ``stats_path``
+            digest: content hash of the word list answers refer to
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temp_path.open("wb") as stats_file:
+            np.savez(
+                stats_file,
+                digest=np.frombuffer(digest, dtype=np.uint8),
+                totals=self._totals,
+                answers=self._answers,
+                players=self._players,
+                current_streaks=self._current_streaks,
+                max_streaks=self._max_streaks,
+                days=self._days,
+                latest_day=np.int64(self.latest_day),
+            )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(
+        cls, path: Path, answer_count: int, digest: bytes = b"", max_guesses: int = 6
+    ) -> "StatsAggregator":
+        """
+        Reads counters stored by ``save``.  Per answer totals are dropped when the word list
+        has changed since, as their indexes no longer refer to the same words
+        Args:
+            path: file written by ``save``
+            answer_count: number of words in the current word list
+            digest: content hash of the current word list
+            max_guesses: number of guesses allowed per game
+
+        Returns:
+            the aggregator, empty when the file is missing, unreadable or for other rules
+        """
+        try:
+            with np.load(path) as stored:
+                arrays = dict(stored)
+        except (OSError, ValueError):
+            return cls(answer_count, max_guesses)
+        days = arrays["days"]
+        if arrays["totals"].shape != (max_guesses + 1,):
+            return cls(answer_count, max_guesses)
+        aggregator = cls(answer_count, max_guesses, len(days), len(arrays["players"]))
+        aggregator._totals[:] = arrays["totals"]
+        if (
+            arrays["digest"].tobytes() == digest
+            and len(arrays["answers"]) == answer_count
+        ):
+            aggregator._answers[:] = arrays["answers"]
+        aggregator._players[:] = arrays["players"]
+        aggregator._current_streaks[:] = arrays["current_streaks"]
+        aggregator._max_streaks[:] = arrays["max_streaks"]
+        aggregator._days[:] = days
+        aggregator.latest_day = int(arrays["latest_day"])
+        return aggregator
+
+
+def describe(summary: Summary, width: int = 30) -> list[str]:
+    """
+    Lays out a summary the way the official game does: the headline figures, then a bar per
+    number of guesses
+    Args:
+        summary: the summary
+        width: characters available for the longest bar
+
+    Returns:
+        lines of plain text
+    """
+    lines = [
+        f"Played {summary.played}  Win % {summary.win_rate * 100:.0f}  "
+        f"Streak {summary.current_streak}  Max {summary.max_streak}"
+    ]
+    longest = max(summary.distribution, default=0) or 1
+    for guesses, count in enumerate(summary.distribution, start=1):
+        lines.append(f"{guesses} {'#' * max(1, count * width // longest)} {count}")
+    return lines
@@ -2,7 +2,23 @@
 List of utility methods to support running the Wordall Game.  Mainly called from the main.py script
 """
 
-from .game_tracker import GameTracker, GuessStatus  # type: ignore
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from rich.markup import escape
+from rich.text import Text
+
+from .feedback import (  # type: ignore
+    GuessStatus,
+    feedback_digits,
+    score_guess,
+    solved_code,
+)
+from .instrumentation import timed  # type: ignore
+
+if TYPE_CHECKING:
+    # Only for annotations: importing the tracker at runtime would load pydantic at startup
+    from .game_tracker import GameTracker  # type: ignore
 
 QWERTY_TOP = "QWERTYUIOP"
 QWERTY_MIDDLE = "ASDFGHJKL"
@@ -10,9 +26,17 @@ QWERTY_BOTTOM = "ZXCVBNM"
 UNMATCHED_BUT_FOUND_STYLE = "[bold white on gold3]"
 MATCHED_STYLE = "[bold white on green4]"
 NO_MATCH_STYLE = "[white on #666666]"
+# Style for each base 3 feedback digit: 0 (no match), 1 (word member), 2 (match)
+FEEDBACK_STYLES = (NO_MATCH_STYLE, UNMATCHED_BUT_FOUND_STYLE, MATCHED_STYLE)
+# Spaces between boards placed side by side
+BOARD_GAP = 2
+# The die is written out rather than as the :game_die: emoji code and the header is parsed with
+# emoji codes off, so drawing the first screen does not load Rich's emoji table
+HEADER = "[bold blue][blink] \N{GAME DIE} Hello from Word-all[/blink][/bold blue]"
 
 
-def show_results(game_stats: GameTracker, console_in):
+@timed("show_results")
+def show_results(game_stats: "GameTracker", console_in, definitions=None):
     """
     Encapsulates the logic to print the historic guesses and their status,
     the keyboard characters with indication of usage, and whether or not a
@@ -21,23 +45,94 @@ def show_results(game_stats: GameTracker, console_in):
         console_in:  Reference to the Rich Console with which the display shall be printed
         game_stats: Representation of the details of the current game.  Gives access
             to the word, historical guesses, and other methods to help with game evaluation
+        definitions: Optional ``BackgroundDefinitions`` to show the definition of the word from
     """
+    if hasattr(game_stats, "boards"):
+        show_boards(game_stats, console_in)
+        return
     refresh_display(console_in)
     if not game_stats.is_solved:
         console_in.print("[center] Try again [/]")
 
     for idx in range(game_stats.max_guesses):
         if game_stats.guesses and idx < len(game_stats.guesses):
-            current_guess = game_stats.guesses[idx]
-            guess_display = style_guess(current_guess, game_stats.word)
+            guess_display = style_feedback(
+                game_stats.guesses[idx], game_stats.feedback[idx]
+            )
         else:
             guess_display = f"[dim]{'_' * game_stats.word_size}[/]"
         console_in.print(guess_display, justify="center")
     show_keyboard(game_stats.char_tracker, console_in)
 
-    show_results_footer(game_stats, console_in)
+    show_results_footer(game_stats, console_in, definitions)
+
+
+def show_boards(game, console_in):
+    """
+    Displays a multi-board game: the boards side by side, as many per band as fit the console,
+    then the keyboard and how many boards are solved.  Solved boards no longer change, so their
+    lines come out of the ``board_lines`` cache instead of being styled again.
+    Args:
+        game: the running ``MultiBoardGame``
+        console_in: Reference to the Rich Console with which the display shall be printed
+    """
+    refresh_display(console_in)
+    columns = [
+        board_lines(
+            tuple(board.guesses),
+            tuple(board.feedback),
+            game.max_guesses,
+            game.word_size,
+        )
+        for board in game.boards
+    ]
+    per_band = max(1, (console_in.width + BOARD_GAP) // (game.word_size + BOARD_GAP))
+    gap = " " * BOARD_GAP
+    for first in range(0, len(columns), per_band):
+        end = first + per_band
+        for row in zip(*columns[first:end]):
+            console_in.print(gap.join(row), justify="center")
+        console_in.print()
+    show_keyboard(game.char_tracker, console_in)
+    console_in.print(f"{game.solved_count}/{len(game.boards)} boards solved")
+    if game.is_solved:
+        console_in.print("[bold green]:party_popper: you got them all!![/]")
+    elif game.remaining_guesses == 0:
+        console_in.print("[bold]:disappointed: Sorry, You are out of guesses..[/]")
+        console_in.print(" ".join(game.words))
+
+
+@lru_cache(maxsize=256)
+def board_lines(
+    guesses: tuple[str, ...],
+    feedback: tuple[int, ...],
+    max_guesses: int,
+    word_size: int,
+) -> tuple[str, ...]:
+    """
+    Styles the rows of one board of a multi-board game.  Unlike ``style_feedback`` a solved row
+    is kept to the width of the word, so the boards line up
+    Args:
+        guesses: the guesses the board has received
+        feedback: the feedback code of each of them
+        max_guesses: number of rows of the board
+        word_size: number of letters in the word
 
+    Returns:
+        markup of each row of the board
+    """
+    rows = [
+        "".join(
+            f"{FEEDBACK_STYLES[digit]}{gletter}[/]"
+            for gletter, digit in zip(guess, feedback_digits(code, word_size))
+        )
+        for guess, code in zip(guesses, feedback)
+    ]
+    blank = f"[dim]{'_' * word_size}[/]"
+    return tuple(rows + [blank] * (max_guesses - len(rows)))
 
+
+@timed("style_guess")
 def style_guess(current_guess, target_word: str):
     """
     Used for each line of the display for historical guesses.  Will apply the appropriate
@@ -51,45 +146,32 @@ def style_guess(current_guess, target_word: str):
     Returns:
         The guess with styling brackets around it to display with context to the target word
     """
-    display = ""
-    if target_word == current_guess:
-        display = f":partying_face: {MATCHED_STYLE}{current_guess}[/] :partying_face:"
-    else:
-        # Assist in letter match hints by counting how many times each letter appears in the
-        # target word
-        track_highlights: dict = {
-            letter: target_word.count(letter) for letter in current_guess
-        }
-
-        for gletter, wletter in zip(current_guess, target_word):
-            # Deduct the count by each matched letter so that it truly just matches highlights
-            if gletter == wletter:
-                track_highlights[gletter] -= 1
-
-        # Compare the guess to the chosen word letter by letter and apply styling
-        for gletter, wletter in zip(current_guess, target_word):
-            if gletter == wletter:
-                # Display green highlight if letters match
-                display += f"{MATCHED_STYLE}{gletter}[/]"
-            elif gletter in target_word:
-                if gletter in target_word and track_highlights[gletter] >= 1:
-                    # Display yellow highlight if doesn't match ANd the letter exists AND we
-                    # have enough unmatched representations left
-                    display += f"{UNMATCHED_BUT_FOUND_STYLE}{gletter}[/]"
-                else:
-                    # If no other highlights left, show that it does not match
-                    display += f"{NO_MATCH_STYLE}{gletter}[/]"
-            else:
-                # All other mathces fail, Show that it does not match
-                display += f"{NO_MATCH_STYLE}{gletter}[/]"
-            if track_highlights[gletter] > 0:
-                # Decrement the number of tracked Highlights to mark off when they should not
-                # be used anymore
-                track_highlights[gletter] -= 1
-    return display
-
-
-def show_results_footer(game_stats, console_in):
+    return style_feedback(current_guess, score_guess(current_guess, target_word))
+
+
+def style_feedback(current_guess: str, code: int) -> str:
+    """
+    Applies the rich styling for an already scored guess
+    Args:
+        current_guess:
+            A guess made by the user
+        code:
+            The base 3 feedback code of the guess (see ``feedback.TargetWord.score``)
+
+    Returns:
+        The guess with styling brackets around each letter matching its feedback
+    """
+    if code == solved_code(len(current_guess)):
+        return f":partying_face: {MATCHED_STYLE}{current_guess}[/] :partying_face:"
+    return "".join(
+        f"{FEEDBACK_STYLES[digit]}{gletter}[/]"
+        for gletter, digit in zip(
+            current_guess, feedback_digits(code, len(current_guess))
+        )
+    )
+
+
+def show_results_footer(game_stats, console_in, definitions=None):
     """
     Encapsulates the logic intended to be displayed at the end of a game.  Lets the
     player know if they solved it or they are out of any more guesses.
@@ -97,16 +179,26 @@ def show_results_footer(game_stats, console_in):
         console_in: Reference to the Rich Console with which the display shall be printed
         game_stats:  stores the data for the current game session such as the target word,
             guesses, etc.
+        definitions: Optional ``BackgroundDefinitions`` to show the definition of the word from.
+            Only a definition which has already arrived is shown
     """
     if game_stats.is_solved:
         console_in.print("[bold green]:party_popper: you got it!![/]")
         console_in.print(game_stats.word)
+    elif game_stats.remaining_guesses == 0:
+        console_in.print("[bold]:disappointed: Sorry, You are out of guesses..[/]")
+        console_in.print(game_stats.word)
     else:
-        if game_stats.remaining_guesses == 0:
-            console_in.print("[bold]:disappointed: Sorry, You are out of guesses..[/]")
-            console_in.print(game_stats.word)
+        if game_stats.remaining_candidates is not None:
+            console_in.print(f"[dim]{game_stats.remaining_candidates} words remain[/]")
+        return
+    # The game is over, so the definition no longer gives the answer away
+    definition = definitions.get(game_stats.word) if definitions else None
+    if definition:
+        console_in.print(f"[italic]{escape(definition)}[/]")
 
 
+@timed("keyboard_character_format")
 def keyboard_character_format(
     keyboard_row: str, used_letter_map: dict[str, GuessStatus]
 ) -> str:
@@ -169,6 +261,4 @@ def refresh_display(console_in):
      prompts, etc.)
     """
     console_in.clear()
-    console_in.rule(
-        "[bold blue][blink] :game_die: Hello from Word-all[/blink][/bold blue]"
-    )
+    console_in.rule(Text.from_markup(HEADER, emoji=False))
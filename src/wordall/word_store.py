@@ -0,0 +1,325 @@
+"""
+Compiles the plain text word lists found in ``src/data`` into a packed, fixed width binary store
+which can be memory-mapped at startup instead of being decoded and split on every launch.
+
+Word lists are looked up by length, first among the lists shipped in ``src/data`` and then among
+those split out of a larger lexicon by ``lexicon.ingest_lexicon``
+"""
+
+import hashlib
+import mmap
+import os
+import random
+import struct
+from functools import lru_cache
+from pathlib import Path
+
+from .instrumentation import timed  # type: ignore
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+CACHE_DIR = DATA_DIR / "cache"
+LEXICON_DIR = DATA_DIR / "lexicon"
+# Searched in order, so a shipped list wins over one ingested for the same length
+SOURCE_DIRS = (DATA_DIR, LEXICON_DIR)
+
+STORE_MAGIC = b"WALL"
+STORE_VERSION = 1
+# magic, format version, word length, word count, source size, source mtime (ns), sha256 digest
+STORE_HEADER = struct.Struct("<4sHHIQQ32s")
+
+
+class WordStoreError(ValueError):
+    """
+    Representation of an error condition when a word list cannot be compiled or a compiled store
+    cannot be read back.
+    """
+
+
+def word_source_path(
+    word_length: int, source_dirs: tuple[Path, ...] = SOURCE_DIRS
+) -> Path:
+    """
+    Finds the plain text word list for the given word length
+    Args:
+        word_length: Number of letters in each word of the list
+        source_dirs: directories to look in, in order of preference
+
+    Returns:
+        Path to the source text file for the word length
+    """
+    for source_dir in source_dirs:
+        source = source_dir / f"words_{word_length}.txt"
+        if source.is_file():
+            return source
+    raise WordStoreError(
+        f"no list of {word_length} letter words, "
+        f"lengths available: {available_lengths(source_dirs)}"
+    )
+
+
+def available_lengths(source_dirs: tuple[Path, ...] = SOURCE_DIRS) -> tuple[int, ...]:
+    """
+    Lists the word lengths which have a word list, without opening any of them
+    Args:
+        source_dirs: directories to look in
+
+    Returns:
+        the word lengths in increasing order
+    """
+    lengths = set()
+    for source_dir in source_dirs:
+        for source in source_dir.glob("words_*.txt"):
+            suffix = source.stem.removeprefix("words_")
+            if suffix.isdigit():
+                lengths.add(int(suffix))
+    return tuple(sorted(lengths))
+
+
+def store_path_for(source: Path) -> Path:
+    """
+    Determines where the compiled store for a given source word list lives
+    Args:
+        source: Path to the plain text word list
+
+    Returns:
+        Path of the compiled binary store inside of the cache directory
+    """
+    return CACHE_DIR / f"{source.stem}.bin"
+
+
+def compile_word_store(source: Path, target: Path | None = None) -> Path:
+    """
+    Reads the plain text word list one line at a time and writes out the packed binary store.
+    Words are upper-cased and stored back to back without separators so that word ``n`` starts
+    at ``header_size + n * word_length``.
+    Args:
+        source: Path to the plain text word list (one word per line)
+        target: Optional location for the compiled store.  Defaults to the cache directory
+
+    Returns:
+        Path to the freshly compiled store
+    """
+    target = target or store_path_for(source)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    digest = hashlib.sha256()
+    packed = bytearray()
+    word_length = 0
+    with source.open("rb") as source_file:
+        for line in source_file:
+            digest.update(line)
+            word = line.strip()
+            if not word:
+                continue
+            if not word.isalpha() or not word.isascii():
+                raise WordStoreError(
+                    f"{source.name} contains a non alphabetic entry: {word!r}"
+                )
+            if not word_length:
+                word_length = len(word)
+            elif len(word) != word_length:
+                raise WordStoreError(
+                    f"{source.name} mixes words of {word_length} and {len(word)} letters"
+                )
+            packed += word.upper()
+
+    stat = source.stat()
+    header = STORE_HEADER.pack(
+        STORE_MAGIC,
+        STORE_VERSION,
+        word_length,
+        len(packed) // word_length if word_length else 0,
+        stat.st_size,
+        stat.st_mtime_ns,
+        digest.digest(),
+    )
+    # Write to a temporary file first so that concurrent readers never map a partial store
+    temp_target = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with temp_target.open("wb") as store_file:
+        store_file.write(header)
+        store_file.write(packed)
+    os.replace(temp_target, target)
+    return target
+
+
+def is_store_current(source: Path, target: Path) -> bool:
+    """
+    Checks whether a compiled store still reflects its source word list.  Only the header is
+    read, so this is cheap enough to run on every launch.
+    Args:
+        source: Path to the plain text word list
+        target: Path to the compiled store
+
+    Returns:
+        True if the store exists, is of the current format, and matches the source's size and
+            modification time
+    """
+    try:
+        with target.open("rb") as store_file:
+            raw_header = store_file.read(STORE_HEADER.size)
+        stat = source.stat()
+    except FileNotFoundError:
+        return False
+    if len(raw_header) != STORE_HEADER.size:
+        return False
+    magic, version, _, _, size, mtime_ns, _ = STORE_HEADER.unpack(raw_header)
+    return (
+        magic == STORE_MAGIC
+        and version == STORE_VERSION
+        and size == stat.st_size
+        and mtime_ns == stat.st_mtime_ns
+    )
+
+
+class WordStore:  # pylint: disable=R0902
+    """
+    Read-only, memory-mapped view over a compiled word list.  Words are only decoded when they
+    are asked for, so opening a store costs the same no matter how many words it holds.
+    """
+
+    __slots__ = (
+        "path",
+        "word_length",
+        "digest",
+        "source_mtime_ns",
+        "_count",
+        "_file",
+        "_map",
+        "_view",
+    )
+
+    def __init__(self, path: Path):
+        """
+        Maps the compiled store at the given path
+        Args:
+            path: Path to a store produced by ``compile_word_store``
+        """
+        self.path = path
+        self._file = path.open("rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as map_error:
+            self._file.close()
+            raise WordStoreError(f"{path.name} is empty") from map_error
+        if len(self._map) < STORE_HEADER.size:
+            self.close()
+            raise WordStoreError(f"{path.name} is truncated")
+        magic, version, word_length, count, _, mtime_ns, digest = (
+            STORE_HEADER.unpack_from(self._map)
+        )
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            self.close()
+            raise WordStoreError(
+                f"{path.name} is not a version {STORE_VERSION} word store"
+            )
+        if len(self._map) != STORE_HEADER.size + count * word_length:
+            self.close()
+            raise WordStoreError(f"{path.name} is truncated")
+        self.word_length = word_length
+        self.digest = digest
+        # When this version of the word list was written
+        self.source_mtime_ns = mtime_ns
+        self._count = count
+        header_size = STORE_HEADER.size
+        self._view = memoryview(self._map)[header_size:]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        return self.raw(index).tobytes().decode("ascii")
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def raw(self, index: int) -> memoryview:
+        """
+        Zero-copy access to a word in the store
+        Args:
+            index: position of the word in the list.  Negative values count from the end
+
+        Returns:
+            memoryview over the upper-case ASCII bytes of the word
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word store index out of range")
+        start = index * self.word_length
+        end = start + self.word_length
+        return self._view[start:end]
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        Accessor for the packed words (without the header)
+        Returns:
+            memoryview over all of the words stored back to back
+        """
+        return self._view
+
+    def random_index(self, rng: random.Random | None = None) -> int:
+        """
+        Picks a random position in the store
+        Args:
+            rng: Optional random generator to use instead of the module level one
+
+        Returns:
+            An index between 0 and the number of words in the store
+        """
+        if not self._count:
+            raise WordStoreError(f"{self.path.name} holds no words")
+        return (rng or random).randrange(self._count)
+
+    def choice(self, rng: random.Random | None = None) -> str:
+        """
+        Picks a random word from the store
+        Args:
+            rng: Optional random generator to use instead of the module level one
+
+        Returns:
+            A random upper-case word from the store
+        """
+        return self[self.random_index(rng)]
+
+    def close(self):
+        """
+        Releases the mapping and the underlying file handle
+        """
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        self._map.close()
+        self._file.close()
+
+
+@timed("load_words")
+def open_word_store(source: Path, target: Path | None = None) -> WordStore:
+    """
+    Maps the compiled store for a word list, (re)compiling it first if the source has changed
+    Args:
+        source: Path to the plain text word list
+        target: Optional location for the compiled store.  Defaults to the cache directory
+
+    Returns:
+        The memory-mapped store
+    """
+    target = target or store_path_for(source)
+    if not is_store_current(source, target):
+        compile_word_store(source, target)
+    return WordStore(target)
+
+
+@lru_cache(maxsize=None)
+def load_word_store(word_length: int) -> WordStore:
+    """
+    Process wide accessor for the shipped word list of a given length.  The store is mapped once
+    per process and shared by every caller.
+    Args:
+        word_length: Number of letters in each word of the list
+
+    Returns:
+        The memory-mapped store for the word length
+    """
+    return open_word_store(word_source_path(word_length))
@@ -0,0 +1,106 @@
+"""
+Stores unit tests for adversarial games, whose answer dodges the guesses
+"""
+
+import io
+from collections import Counter
+
+import numpy as np
+import pytest
+from rich.console import Console
+
+from src.wordall.adversary import AdversarialGame  # type: ignore
+from src.wordall.candidates import get_candidate_pool  # type: ignore
+from src.wordall.constraints import HARD  # type: ignore
+from src.wordall.feedback import score_guess  # type: ignore
+from src.wordall.game_state import InvalidEntryError  # type: ignore
+from src.wordall.utilities import show_results  # type: ignore
+
+
+def largest_bucket(guess: str, words: list[str]) -> tuple[int, int]:
+    """
+    Partitions words by feedback with a dictionary, as a reference
+    Returns:
+    The code and size of the largest part, lowest code on ties
+    """
+    buckets = Counter(score_guess(guess, word) for word in words)
+    size = max(buckets.values())
+    return min(code for code, count in buckets.items() if count == size), size
+
+
+@pytest.mark.parametrize("word_length", [5, 6])
+def test_keeps_the_largest_bucket(word_length):  # pylint: disable=C0116
+    pool = get_candidate_pool(word_length)
+    game = AdversarialGame(pool)
+    guesses = ["CRANE", "SLOTH", "PUDGY", "EERIE"] if word_length == 5 else []
+    guesses = guesses or ["CRANES", "BOUGHT", "LIMPED", "EERIES"]
+    for guess in guesses:
+        before = game.candidates.words()
+        game.make_guess(guess)
+        code, size = largest_bucket(guess, before)
+        assert game.feedback[-1] == code
+        assert len(game.candidates) == size
+        assert all(score_guess(guess, word) == code for word in game.candidates.words())
+
+
+def test_answer_collapses_and_game_can_be_won():  # pylint: disable=C0116
+    game = AdversarialGame(get_candidate_pool(5), max_guesses=20)
+    assert game.word == ""
+    guesses = iter(["CRANE", "SLOTH", "PUDGY", "WIMPY", "BOXED", "FJORD"])
+    while len(game.candidates) > 1:
+        game.make_guess(next(guesses, None) or game.hint())
+    answer = game.candidates.words()[0]
+    assert game.word == answer
+    game.make_guess(answer)
+    assert game.is_solved
+    assert game.remaining_guesses == 0
+
+
+def test_lost_game_names_an_answer():  # pylint: disable=C0116
+    game = AdversarialGame(get_candidate_pool(5), max_guesses=2)
+    game.make_guess("CRANE")
+    assert game.word == ""
+    game.make_guess("SLOTH")
+    assert not game.is_solved
+    assert game.word in game.candidates.words()
+
+
+def test_rules_still_apply():  # pylint: disable=C0116
+    game = AdversarialGame(get_candidate_pool(5), dictionary={"CRANE"}, mode=HARD)
+    with pytest.raises(InvalidEntryError):
+        game.make_guess("QQQQQ")
+    game.make_guess("CRANE")
+    assert game.mode == HARD
+
+
+def test_new_game_starts_over():  # pylint: disable=C0116
+    game = AdversarialGame(get_candidate_pool(5))
+    game.make_guess("CRANE")
+    game.new_game()
+    assert game.word == ""
+    assert not game.guesses
+    assert len(game.candidates) == len(get_candidate_pool(5))
+    game.new_game(candidate_pool=get_candidate_pool(6))
+    game.make_guess("CRANES")
+    assert game.word_size == 6
+
+
+def test_scratch_codes_are_reused():  # pylint: disable=C0116
+    game = AdversarialGame(get_candidate_pool(5))
+    codes = game._codes  # pylint: disable=W0212
+    game.make_guess("CRANE")
+    game.make_guess("SLOTH")
+    assert game._codes is codes  # pylint: disable=W0212
+    assert isinstance(codes, np.ndarray)
+
+
+def test_show_results_once_collapsed():  # pylint: disable=C0116
+    output = io.StringIO()
+    console = Console(file=output, width=40, color_system=None)
+    game = AdversarialGame(get_candidate_pool(5), max_guesses=20)
+    while len(game.candidates) > 1:
+        game.make_guess(game.hint())
+    game.make_guess(game.word)
+    show_results(game, console)
+    assert "you got it!!" in output.getvalue()
+    assert game.word in output.getvalue().splitlines()
@@ -0,0 +1,79 @@
+"""
+Stores unit tests for the vectorized scorer, checking it against the single guess scorer
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.wordall.batch_feedback import (  # type: ignore
+    encode_words,
+    feedback_dtype,
+    score_against,
+    score_block,
+    score_matrix,
+    store_letters,
+)
+from src.wordall.feedback import score_guess  # type: ignore
+from src.wordall.word_store import load_word_store  # type: ignore
+
+
+def random_words(count, word_length, seed):  # pylint: disable=C0116
+    rng = random.Random(seed)
+    # A small alphabet forces plenty of repeated letters
+    return ["".join(rng.choices("ABEST", k=word_length)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("word_length", [4, 5, 6, 7])
+def test_matches_single_scorer(word_length):  # pylint: disable=C0116
+    guesses = random_words(60, word_length, seed=word_length)
+    answers = random_words(45, word_length, seed=word_length + 100)
+    out = np.zeros((60, 45), feedback_dtype(word_length))
+
+    score_matrix(encode_words(guesses), encode_words(answers), out, block_pairs=128)
+
+    expected = [[score_guess(guess, answer) for answer in answers] for guess in guesses]
+    assert out.tolist() == expected
+
+
+@pytest.mark.parametrize("word_length", [4, 5, 6, 7])
+def test_score_against_matches_single_scorer(word_length):  # pylint: disable=C0116
+    guesses = random_words(30, word_length, seed=word_length)
+    answers = random_words(45, word_length, seed=word_length + 100)
+    letters = encode_words(answers)
+    for guess in guesses:
+        codes = score_against(encode_words([guess])[0], letters)
+        assert codes.tolist() == [score_guess(guess, answer) for answer in answers]
+
+
+def test_score_block_allocates_output():  # pylint: disable=C0116
+    codes = score_block(encode_words(["SEVER"]), encode_words(["SEVER", "EERIE"]))
+    assert codes.dtype == np.uint8
+    assert codes.tolist() == [[242, score_guess("SEVER", "EERIE")]]
+
+
+def test_store_letters():  # pylint: disable=C0116
+    store = load_word_store(5)
+    letters = store_letters(store)
+    assert letters.shape == (len(store), 5)
+    assert letters[0].tolist() == (encode_words([store[0]])[0]).tolist()
+
+
+@pytest.mark.parametrize(
+    "shape, dtype, error",
+    [
+        pytest.param((2, 3), np.uint8, "cannot hold", id="Wrong shape"),
+        pytest.param((2, 2), np.int8, "too small", id="Wrong type"),
+    ],
+)
+def test_score_matrix_checks_output(shape, dtype, error):  # pylint: disable=C0116
+    words = encode_words(["SEVER", "SAVER"])
+    with pytest.raises(ValueError, match=error):
+        score_matrix(words, words, np.zeros(shape, dtype))
+
+
+def test_feedback_dtype():  # pylint: disable=C0116
+    assert feedback_dtype(5) == np.uint8
+    assert feedback_dtype(6) == np.uint16
+    assert feedback_dtype(12) == np.uint32
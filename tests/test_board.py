@@ -0,0 +1,111 @@
+"""
+Stores unit tests for the incremental board renderer
+"""
+
+import io
+
+import pytest
+from rich.console import Console
+from rich.text import Text
+
+from src.wordall.board import BoardRenderer  # type: ignore
+from src.wordall.feedback import GuessStatus  # type: ignore
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.utilities import (  # type: ignore
+    QWERTY_BOTTOM,
+    QWERTY_MIDDLE,
+    QWERTY_TOP,
+    keyboard_character_format,
+)
+
+
+def make_console(output: io.StringIO, terminal: bool = True) -> Console:
+    """
+    Console writing to memory
+    Returns:
+    A 40 column console
+    """
+    return Console(
+        file=output,
+        force_terminal=terminal,
+        width=40,
+        color_system="truecolor" if terminal else None,
+    )
+
+
+@pytest.mark.parametrize("row", [QWERTY_TOP, QWERTY_MIDDLE, QWERTY_BOTTOM])
+def test_keyboard_row_matches_markup(row):  # pylint: disable=C0116
+    renderer = BoardRenderer(make_console(io.StringIO()))
+    used_letters = {
+        "Q": GuessStatus.MATCH,
+        "E": GuessStatus.NO_MATCH,
+        "A": GuessStatus.WORD_MEMBER,
+        "M": GuessStatus.MATCH,
+    }
+    expected = renderer._render(  # pylint: disable=W0212
+        Text.from_markup(keyboard_character_format(row, used_letters))
+    )
+    actual = renderer._keyboard_row(row, used_letters)  # pylint: disable=W0212
+    assert actual == expected
+
+
+def test_only_changed_lines_are_redrawn():  # pylint: disable=C0116
+    output = io.StringIO()
+    console = make_console(output)
+    renderer = BoardRenderer(console)
+    game = GameState("SEVER")
+    renderer.draw(game)
+    first = renderer.frame(game)
+    assert output.getvalue().startswith("\x1b[2J\x1b[H")
+
+    game.make_guess("PILLS")
+    written = len(output.getvalue())
+    renderer.draw(game)
+    update = output.getvalue()[written:]
+    changed = [
+        row for row, line in enumerate(renderer.frame(game)) if line != first[row]
+    ]
+    # The new guess line plus the top (P, I) and middle (L, S) keyboard rows
+    assert len(changed) == 3
+    for row in changed:
+        assert f"\x1b[{row + 1};1H" in update
+    assert update.count(";1H") == len(changed) + 1
+
+
+def test_frame_keeps_its_shape_when_solved():  # pylint: disable=C0116
+    renderer = BoardRenderer(make_console(io.StringIO()))
+    game = GameState("SEVER")
+    before = renderer.frame(game)
+    game.make_guess("SEVER")
+    after = renderer.frame(game)
+    # Board lines stay put, the footer reveals the word underneath
+    assert len(after) > len(before)
+    assert after[0] == before[0]
+    assert "SEVER" in after[-1]
+
+
+def test_reset_redraws_everything():  # pylint: disable=C0116
+    output = io.StringIO()
+    console = make_console(output)
+    renderer = BoardRenderer(console)
+    game = GameState("SEVER")
+    renderer.draw(game)
+    renderer.reset()
+    written = len(output.getvalue())
+    renderer.draw(game)
+    update = output.getvalue()[written:]
+    assert update.startswith("\x1b[2J\x1b[H")
+    assert renderer.bytes_written == len(output.getvalue().encode("utf-8"))
+
+
+def test_plain_output_without_terminal():  # pylint: disable=C0116
+    output = io.StringIO()
+    console = make_console(output, terminal=False)
+    renderer = BoardRenderer(console)
+    game = GameState("SEVER")
+    game.make_guess("SAVER")
+    renderer.draw(game)
+    output = output.getvalue()
+    assert "\x1b" not in output
+    assert "SAVER" in output
+    assert "Try again" in output
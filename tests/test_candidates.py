@@ -0,0 +1,88 @@
+"""
+Stores unit tests for the incremental candidate narrowing used for "words remain" and hints
+"""
+
+import random
+
+import pytest
+
+from src.wordall.candidates import CandidatePool, get_candidate_pool  # type: ignore
+from src.wordall.feedback import score_guess  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+from src.wordall.word_store import open_word_store  # type: ignore
+
+WORDS = ["SEVER", "SAVER", "EERIE", "PAVER", "CHIMP", "FLAIL", "IDIOM", "STINT"]
+
+
+@pytest.fixture(name="pool")
+def small_pool(tmp_path):
+    """
+    Candidate pool over a handful of five letter words
+    Returns:
+    The pool
+    """
+    source = tmp_path / "words_5.txt"
+    source.write_text("\n".join(WORDS))
+    return CandidatePool(open_word_store(source, tmp_path / "words_5.bin"))
+
+
+def test_update_keeps_consistent_words(pool):  # pylint: disable=C0116
+    candidates = pool.new_set()
+    assert len(candidates) == len(WORDS)
+
+    assert candidates.update("PAVER", score_guess("PAVER", "SEVER")) == 1
+    assert candidates.words() == ["SEVER"]
+    assert candidates.hint() == "SEVER"
+
+    candidates.reset()
+    assert candidates.words() == WORDS
+
+
+def test_reset_reuses_the_buffer(pool):  # pylint: disable=C0116
+    candidates = pool.new_set()
+    candidates.update("PAVER", score_guess("PAVER", "SEVER"))
+    buffer = candidates.indices.base
+
+    candidates.reset()
+    assert candidates.indices.base is buffer
+    assert not candidates.indices.flags.owndata
+    assert candidates.update("CHIMP", score_guess("CHIMP", "SAVER")) == 2
+    assert candidates.indices.base is buffer
+    assert candidates.words() == ["SEVER", "SAVER"]
+    # The pool's own indexes are left untouched
+    assert pool.indices.tolist() == list(range(len(WORDS)))
+
+
+def test_matches_brute_force_filter():  # pylint: disable=C0116
+    pool = get_candidate_pool(6)
+    words = list(pool.store)
+    rng = random.Random(3)
+    for _ in range(5):
+        answer = rng.choice(words)
+        candidates = pool.new_set()
+        expected = words
+        for guess in rng.sample(words, 3):
+            code = score_guess(guess, answer)
+            candidates.update(guess, code)
+            expected = [word for word in expected if score_guess(guess, word) == code]
+            assert candidates.words() == expected
+            assert answer in expected
+
+
+def test_tracker_narrows_candidates(pool):  # pylint: disable=C0116
+    game = GameTracker("SEVER", candidate_pool=pool)
+    assert game.remaining_candidates == len(WORDS)
+
+    game.make_guess("STINT")
+    assert game.remaining_candidates == 2
+    assert game.hint() in ("SEVER", "SAVER")
+
+    game.new_game("CHIMP")
+    assert game.remaining_candidates == len(WORDS)
+
+
+def test_tracker_without_candidates():  # pylint: disable=C0116
+    game = GameTracker("SEVER")
+    game.make_guess("SAVER")
+    assert game.remaining_candidates is None
+    assert game.hint() is None
@@ -0,0 +1,150 @@
+"""
+Stores unit tests for the hard and strict mode constraints
+"""
+
+import random
+
+import pytest
+
+from src.wordall.candidates import get_candidate_pool  # type: ignore
+from src.wordall.constraints import (  # type: ignore
+    HARD,
+    NORMAL,
+    STRICT,
+    LetterConstraints,
+    constraints_for,
+)
+from src.wordall.feedback import score_guess  # type: ignore
+from src.wordall.game_snapshot import GameSnapshot  # type: ignore
+from src.wordall.game_state import GameState, InvalidEntryError  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+from src.wordall.solver import best_guess  # type: ignore
+
+
+def constraints_after(answer: str, guesses: list[str], strict: bool):
+    """
+    Constraints revealed by playing guesses against an answer
+    Returns:
+    The constraints
+    """
+    constraints = LetterConstraints(len(answer), strict)
+    for guess in guesses:
+        constraints.update(guess, score_guess(guess, answer))
+    return constraints
+
+
+@pytest.mark.parametrize(
+    "guess, violation",
+    [
+        pytest.param("SAVED", None, id="answer"),
+        pytest.param("SAUVE", None, id="grays_allowed"),
+        pytest.param("SALVE", None, id="yellow_in_place_allowed"),
+        pytest.param("RAVES", "1st letter must be S", id="green_moved"),
+        pytest.param("SALES", "Guess must contain V", id="yellow_dropped"),
+        pytest.param("SAVVY", "Guess must contain E", id="second_yellow_dropped"),
+    ],
+)
+def test_hard_mode(guess, violation):  # pylint: disable=C0116
+    # SAUVE against SAVED: S and A green, U gray, V and E yellow
+    constraints = constraints_after("SAVED", ["SAUVE"], strict=False)
+    assert constraints.violation(guess) == violation
+
+
+@pytest.mark.parametrize(
+    "guess, violation",
+    [
+        pytest.param("SAVED", None, id="answer"),
+        pytest.param("SAVES", None, id="consistent"),
+        pytest.param("SAUVE", "U is not in the word", id="gray_letter"),
+        pytest.param("SALVE", "V is not the 4th letter", id="yellow_in_place"),
+        pytest.param("VASES", "1st letter must be S", id="green_moved"),
+    ],
+)
+def test_strict_mode(guess, violation):  # pylint: disable=C0116
+    constraints = constraints_after("SAVED", ["SAUVE"], strict=True)
+    assert constraints.violation(guess) == violation
+
+
+def test_duplicate_letters():  # pylint: disable=C0116
+    # EERIE against THERE: the first E and the R yellow, the last E green, the rest gray, so
+    # the word holds exactly two E
+    strict = constraints_after("THERE", ["EERIE"], strict=True)
+    assert strict.violation("RXXXE") == "Guess must contain 2 copies of E"
+    assert strict.violation("RXEEE") == "The word holds only 2 E"
+    assert strict.violation("RXEXE") is None
+    hard = constraints_after("THERE", ["EERIE"], strict=False)
+    assert hard.violation("RXEEE") is None
+    assert hard.violation("RXXXE") == "Guess must contain 2 copies of E"
+
+
+def test_strict_accepts_exactly_the_consistent_guesses():  # pylint: disable=C0116
+    words = list(get_candidate_pool(5).store)
+    rng = random.Random(3)
+    for _ in range(50):
+        answer = rng.choice(words)
+        played = rng.sample(words, 2)
+        constraints = constraints_after(answer, played, strict=True)
+        for guess in rng.sample(words, 200):
+            consistent = all(
+                score_guess(earlier, guess) == score_guess(earlier, answer)
+                for earlier in played
+            )
+            assert (constraints.violation(guess) is None) == consistent, (
+                answer,
+                played,
+                guess,
+            )
+
+
+def test_reset():  # pylint: disable=C0116
+    constraints = constraints_after("SAVED", ["SAUVE"], strict=True)
+    constraints.reset()
+    assert constraints.violation("QUICK") is None
+
+
+def test_modes():  # pylint: disable=C0116
+    assert constraints_for(NORMAL, 5) is None
+    assert not constraints_for(HARD, 5).strict
+    assert constraints_for(STRICT, 6).strict
+    with pytest.raises(ValueError):
+        constraints_for("easy", 5)
+
+
+@pytest.mark.parametrize("game_type", [GameState, GameTracker])
+def test_games_enforce_hard_mode(game_type):  # pylint: disable=C0116
+    game = game_type("SAVED", mode=HARD)
+    assert game.mode == HARD
+    game.make_guess("SAUVE")
+    with pytest.raises(InvalidEntryError, match="Guess must contain V. Try again."):
+        game.make_guess("SALES")
+    assert len(game.guesses) == 1
+    game.make_guess("SAVES")
+    game.new_game("CRANE")
+    game.make_guess("PILLS")
+    assert game_type("SAVED").mode == NORMAL
+
+
+def test_snapshot_keeps_the_mode():  # pylint: disable=C0116
+    game = GameState("SAVED", mode=STRICT)
+    game.make_guess("SAUVE")
+    restored = GameSnapshot.from_state(game).to_state()
+    assert restored.mode == STRICT
+    with pytest.raises(InvalidEntryError):
+        restored.make_guess("SALES")
+
+
+def test_from_history_restores_constraints():  # pylint: disable=C0116
+    game = GameState.from_history(
+        "SAVED", 5, ["SAUVE"], [score_guess("SAUVE", "SAVED")], mode=HARD
+    )
+    with pytest.raises(InvalidEntryError):
+        game.make_guess("CRANE")
+
+
+def test_hard_mode_hints_are_playable():  # pylint: disable=C0116
+    pool = get_candidate_pool(5)
+    game = GameState("SAVED", candidate_pool=pool, mode=STRICT)
+    game.make_guess("CRANE")
+    game.make_guess("ADIEU")
+    hint = best_guess(game)
+    game.make_guess(hint)
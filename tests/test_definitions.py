@@ -0,0 +1,180 @@
+"""
+Stores unit tests for the definition lookup service, run against a local stub of the API
+"""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from rich.console import Console
+
+from src.wordall.definitions import (  # type: ignore
+    NOT_FOUND,
+    BackgroundDefinitions,
+    DefinitionCache,
+    DefinitionService,
+    parse_definition,
+)
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.utilities import show_results_footer  # type: ignore
+
+DEFINITIONS = {
+    "sever": [
+        {
+            "word": "sever",
+            "meanings": [
+                {
+                    "partOfSpeech": "verb",
+                    "definitions": [{"definition": "To cut free."}],
+                }
+            ],
+        }
+    ],
+    "saver": [
+        {"word": "saver", "meanings": [{"definitions": [{"definition": "[x]"}]}]}
+    ],
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers like the dictionary API for the words above, slowly, and counts requests
+    """
+
+    requests: list[str] = []
+
+    def do_GET(self):  # pylint: disable=C0103,C0116
+        word = self.path.rsplit("/", 1)[-1]
+        StubHandler.requests.append(word)
+        time.sleep(0.05)
+        if word == "broke":
+            self.send_response(500)
+            body = b"{}"
+        elif word in DEFINITIONS:
+            self.send_response(200)
+            body = json.dumps(DEFINITIONS[word]).encode()
+        else:
+            self.send_response(404)
+            body = b'{"title": "No Definitions Found"}'
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):  # pylint: disable=W0221
+        pass
+
+
+@pytest.fixture(name="api_url")
+def stub_api():
+    """
+    Runs the stub API on a free port for the duration of a test
+    Returns:
+    The base URL of the stub
+    """
+    StubHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v2/entries/en/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        pytest.param(
+            DEFINITIONS["sever"], "(verb) To cut free.", id="With part of speech"
+        ),
+        pytest.param(DEFINITIONS["saver"], "[x]", id="Without part of speech"),
+        pytest.param({"title": "No Definitions Found"}, None, id="Not found"),
+        pytest.param([{"meanings": []}], None, id="No meanings"),
+    ],
+)
+def test_parse_definition(payload, expected):  # pylint: disable=C0116
+    assert parse_definition(payload) == expected
+
+
+def test_lookups_are_coalesced_and_cached(api_url, tmp_path):  # pylint: disable=C0116
+    async def scenario():
+        service = DefinitionService(DefinitionCache(tmp_path), base_url=api_url)
+        found = await asyncio.gather(*(service.lookup("SEVER") for _ in range(20)))
+        again = await service.lookup("sever")
+        await service.aclose()
+        return found, again
+
+    found, again = asyncio.run(scenario())
+    assert set(found) == {"(verb) To cut free."}
+    assert again == found[0]
+    assert StubHandler.requests == ["sever"]
+    assert json.loads((tmp_path / "SEVER.json").read_text())["definition"] == again
+
+
+def test_disk_cache_survives_restart_until_expiry(
+    api_url, tmp_path
+):  # pylint: disable=C0116
+    async def lookup(ttl):
+        service = DefinitionService(
+            DefinitionCache(tmp_path, ttl=ttl), base_url=api_url
+        )
+        definition = await service.lookup("SEVER")
+        await service.aclose()
+        return definition
+
+    assert asyncio.run(lookup(60)) == "(verb) To cut free."
+    assert asyncio.run(lookup(60)) == "(verb) To cut free."
+    assert len(StubHandler.requests) == 1
+    assert asyncio.run(lookup(0)) == "(verb) To cut free."
+    assert len(StubHandler.requests) == 2
+
+
+def test_missing_and_failed_lookups(api_url):  # pylint: disable=C0116
+    async def scenario():
+        service = DefinitionService(DefinitionCache(None), base_url=api_url)
+        results = [await service.lookup(word) for word in ("QWXYZ", "BROKE", "../X")]
+        results += [await service.lookup(word) for word in ("QWXYZ", "BROKE")]
+        await service.aclose()
+        return results, service.cache
+
+    results, cache = asyncio.run(scenario())
+    assert results == [None] * 5
+    # Words without a definition are remembered, failures are retried
+    assert StubHandler.requests == ["qwxyz", "broke", "broke"]
+    assert cache.get("QWXYZ") == NOT_FOUND
+
+
+def test_lru_is_bounded():  # pylint: disable=C0116
+    cache = DefinitionCache(None, max_entries=2)
+    for word in ("ONE", "TWO", "SIX"):
+        cache.put(word, word.lower())
+    assert cache.get("ONE") is None
+    assert cache.get("SIX") == "six"
+
+
+def test_prewarm_and_background_footer(api_url, tmp_path):  # pylint: disable=C0116
+    definitions = BackgroundDefinitions(
+        DefinitionService(DefinitionCache(tmp_path), base_url=api_url)
+    )
+    try:
+        assert definitions.prewarm(["SEVER", "SAVER", "QWXYZ"]).result(5) == 2
+        assert definitions.get("SAVER") == "[x]"
+        assert definitions.get("PAVER") is None
+        definitions.request("PAVER").result(5)
+        assert definitions.get("PAVER") is None
+
+        game = GameState("SEVER")
+        output = io.StringIO()
+        console = Console(file=output, width=60)
+        game.make_guess("SAVER")
+        show_results_footer(game, console, definitions)
+        assert "cut free" not in output.getvalue()
+        game.make_guess("SEVER")
+        show_results_footer(game, console, definitions)
+        assert "(verb) To cut free." in output.getvalue()
+    finally:
+        definitions.close()
@@ -0,0 +1,33 @@
+"""
+Stores unit tests for the shared dictionary index used to validate guesses
+"""
+
+from src.wordall.dictionary import WordIndex, get_word_index  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+
+
+def test_word_index_membership():  # pylint: disable=C0116
+    index = WordIndex(["sever", "SAVER"], 5)
+    assert len(index) == 2
+    assert "SEVER" in index
+    assert "saver" in index
+    assert "PAVER" not in index
+    assert 12345 not in index
+
+
+def test_shipped_index_is_shared_and_lazy():  # pylint: disable=C0116
+    get_word_index.cache_clear()
+    five_letters = get_word_index(5)
+    assert get_word_index.cache_info().currsize == 1
+    assert get_word_index(5) is five_letters
+    assert "WHICH" in five_letters
+    assert "WHICHS" not in five_letters
+    assert len(five_letters) == 5757
+
+    assert "ZYGOTE" in get_word_index(6)
+
+
+def test_tracker_uses_shipped_index():  # pylint: disable=C0116
+    game = GameTracker("THERE", 5, dictionary=get_word_index(5))
+    game.make_guess("WHICH")
+    assert game.remaining_guesses == 5
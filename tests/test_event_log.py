@@ -0,0 +1,163 @@
+"""
+Stores unit tests for the session event log
+"""
+
+import pytest
+
+from src.wordall.event_log import (  # type: ignore
+    KIND_END,
+    KIND_GUESS,
+    KIND_NEW,
+    RECORD_SIZE,
+    EventLog,
+    load_histories,
+    load_sessions,
+    pack_letters,
+    read_segment,
+    unpack_letters,
+)
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.server import GameServer, SessionStore  # type: ignore
+from src.wordall.word_store import load_word_store  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "word",
+    [
+        pytest.param("", id="empty"),
+        pytest.param("SEVER", id="five"),
+        pytest.param("ZYZZYVASZZZZ", id="twelve"),
+    ],
+)
+def test_pack_round_trip(word):  # pylint: disable=C0116
+    packed = pack_letters(word)
+    assert packed < 1 << 64
+    assert unpack_letters(packed) == word
+
+
+def play(log: EventLog, session: int, answer: int, guesses: list[tuple[str, int]]):
+    """
+    Logs a new game followed by its guesses
+    """
+    log.append(session, KIND_NEW, 5, answer)
+    for turn, (guess, code) in enumerate(guesses):
+        log.append(session, KIND_GUESS, 5, answer, guess, code, turn)
+
+
+def test_append_and_recover(tmp_path):  # pylint: disable=C0116
+    log = EventLog(tmp_path, sync_every=2)
+    play(log, 1, 10, [("PILLS", 0), ("SAVER", 200)])
+    play(log, 2, 20, [("CRANE", 5)])
+    log.append(2, KIND_END, 5, 20)
+    play(log, 3, 30, [])
+    log.close()
+
+    histories = load_histories(tmp_path)
+    assert set(histories) == {1, 3}
+    assert histories[1].answer == 10
+    assert histories[1].guesses == ["PILLS", "SAVER"]
+    assert histories[1].feedback == [0, 200]
+    assert not histories[3].guesses
+
+
+def test_torn_tail_is_dropped(tmp_path):  # pylint: disable=C0116
+    log = EventLog(tmp_path)
+    play(log, 1, 10, [("PILLS", 0), ("SAVER", 200)])
+    log.close()
+    segment = next(tmp_path.glob("segment_*"))
+    raw = segment.read_bytes()
+    # A crash part way through writing the last record, and a corrupted one before it
+    segment.write_bytes(raw[: len(raw) - RECORD_SIZE // 2])
+    assert len(read_segment(segment)) == 2
+    damaged = bytearray(raw)
+    damaged[-RECORD_SIZE] ^= 0xFF
+    segment.write_bytes(bytes(damaged))
+    assert load_histories(tmp_path)[1].guesses == ["PILLS"]
+
+
+def test_reopening_starts_a_new_segment(tmp_path):  # pylint: disable=C0116
+    log = EventLog(tmp_path)
+    play(log, 1, 10, [("PILLS", 0)])
+    log.close()
+    log = EventLog(tmp_path)
+    log.append(1, KIND_GUESS, 5, 10, "SAVER", 200, 1)
+    log.close()
+    assert len(list(tmp_path.glob("segment_*"))) == 2
+    assert load_histories(tmp_path)[1].guesses == ["PILLS", "SAVER"]
+
+
+def test_snapshot_compacts_and_tail_is_replayed(tmp_path):  # pylint: disable=C0116
+    log = EventLog(tmp_path, segment_bytes=256)
+    for session in range(20):
+        play(log, session, session, [("PILLS", session)])
+    log.sync()
+    histories = load_histories(tmp_path)
+    log.snapshot(histories.items())
+    assert log.records_since_snapshot == 0
+    assert len(list(tmp_path.glob("snapshot_*"))) == 1
+    assert len(list(tmp_path.glob("segment_*"))) == 1
+
+    log.append(4, KIND_GUESS, 5, 4, "SAVER", 7, 1)
+    log.append(5, KIND_END, 5, 5)
+    log.close()
+    recovered = load_histories(tmp_path)
+    assert len(recovered) == 19
+    assert recovered[4].guesses == ["PILLS", "SAVER"]
+    assert recovered[4].feedback == [4, 7]
+    assert recovered[19] == histories[19]
+
+
+def test_recovered_game_matches_played_game(tmp_path):  # pylint: disable=C0116
+    played = GameState("SEVER")
+    log = EventLog(tmp_path)
+    log.append(7, KIND_NEW, 5, 0)
+    for turn, guess in enumerate(["PILLS", "RIVER", "SAVER"]):
+        played.make_guess(guess)
+        log.append(7, KIND_GUESS, 5, 0, guess, played.feedback[-1], turn)
+    log.close()
+
+    recovered = load_sessions(tmp_path, stores=lambda _: ["SEVER"])[7]
+    assert recovered.guesses == played.guesses
+    assert recovered.feedback == played.feedback
+    assert recovered.used_letters == played.used_letters
+    assert recovered.remaining_guesses == played.remaining_guesses
+    recovered.make_guess("SEVER")
+    assert recovered.is_solved
+
+
+def test_server_sessions_survive_restart(tmp_path):  # pylint: disable=C0116
+    server = GameServer(SessionStore(event_log=EventLog(tmp_path)))
+    _, kept, _ = server.respond("NEW 5").split()
+    _, ended, _ = server.respond("NEW 6").split()
+    answer = server.sessions.get(kept).word
+    guess = "PILLS" if answer != "PILLS" else "SAVER"
+    assert server.respond(f"GUESS {kept} {guess}").startswith("OK")
+    assert server.respond(f"END {ended}") == "OK"
+    server.sessions.event_log.close()
+
+    restarted = GameServer(SessionStore())
+    assert restarted.sessions.restore(load_histories(tmp_path)) == 1
+    assert restarted.respond(f"SHOW {kept}") == f"OK {guess} 5"
+    assert restarted.sessions.get(kept).word == answer
+    assert restarted.respond(f"SHOW {ended}").startswith("ERR unknown session")
+
+
+def test_checkpoint_snapshots_the_store(tmp_path):  # pylint: disable=C0116
+    log = EventLog(tmp_path)
+    store = SessionStore(event_log=log)
+    session_id, game = store.create(5)
+    store.checkpoint(snapshot_every=1)
+    assert log.records_since_snapshot == 0
+    log.close()
+    history = load_histories(tmp_path)[int(session_id, 16)]
+    assert history.word_length == 5
+    assert load_word_store(5)[history.answer] == game.word
+
+
+def test_empty_snapshot(tmp_path):  # pylint: disable=C0116
+    log = EventLog(tmp_path)
+    play(log, 1, 10, [])
+    log.append(1, KIND_END, 5, 10)
+    log.snapshot([])
+    log.close()
+    assert not load_histories(tmp_path)
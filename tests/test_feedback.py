@@ -0,0 +1,61 @@
+"""
+Stores unit tests for the shared scoring core used by the game tracker and the display
+"""
+
+import pytest
+
+from src.wordall.feedback import (  # type: ignore
+    GuessStatus,
+    TargetWord,
+    feedback_digits,
+    feedback_statuses,
+    score_guess,
+    solved_code,
+)
+from src.wordall.game_tracker import GameTracker  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "word, guess, digits",
+    [
+        pytest.param("SEVER", "SEVER", b"\x02\x02\x02\x02\x02", id="Solved"),
+        pytest.param("SEVER", "SAVER", b"\x02\x00\x02\x02\x02", id="One miss"),
+        pytest.param("SEVER", "EERIE", b"\x01\x02\x01\x00\x00", id="Surplus E"),
+        pytest.param("FLAIL", "PILLS", b"\x00\x01\x01\x01\x00", id="Two hints"),
+        pytest.param("BBXYZ", "XBBXX", b"\x01\x02\x01\x00\x00", id="Match first"),
+        pytest.param("CHERUB", "CHASED", b"\x02\x02\x00\x00\x01\x00", id="Six"),
+    ],
+)
+def test_score_guess(word, guess, digits):  # pylint: disable=C0116
+    code = score_guess(guess, word)
+    assert feedback_digits(code, len(word)) == digits
+    assert (code == solved_code(len(word))) == (word == guess)
+
+
+def test_target_word_is_reusable():  # pylint: disable=C0116
+    target = TargetWord("SEVER")
+    assert target.score("EERIE") == target.score("EERIE")
+    assert target.score("SEVER") == solved_code(5)
+
+
+def test_feedback_statuses():  # pylint: disable=C0116
+    assert feedback_statuses(score_guess("SAVER", "SEVER"), 5) == (
+        GuessStatus.MATCH,
+        GuessStatus.NO_MATCH,
+        GuessStatus.MATCH,
+        GuessStatus.MATCH,
+        GuessStatus.MATCH,
+    )
+
+
+def test_tracker_records_feedback():  # pylint: disable=C0116
+    game = GameTracker("SEVER")
+    game.make_guess("EERIE")
+    assert game.feedback == [score_guess("EERIE", "SEVER")]
+    assert game.used_letters == {
+        "E": GuessStatus.MATCH,
+        "R": GuessStatus.WORD_MEMBER,
+        "I": GuessStatus.NO_MATCH,
+    }
+    game.reset()
+    assert not game.feedback
@@ -0,0 +1,141 @@
+"""
+Stores unit tests for the slotted game state and its serialization boundary
+"""
+
+import pytest
+
+from src.wordall.candidates import CandidatePool  # type: ignore
+from src.wordall.feedback import GuessStatus  # type: ignore
+from src.wordall.game_snapshot import GameSnapshot  # type: ignore
+from src.wordall.game_state import GameState, InvalidEntryError  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+from src.wordall.word_store import open_word_store  # type: ignore
+
+WORDS = ["SEVER", "SAVER", "EERIE", "PAVER", "EVENT", "AERIE", "SLIDE"]
+
+
+@pytest.mark.parametrize(
+    "word, size, guesses",
+    [
+        pytest.param("SEVER", 5, [], id="No guess"),
+        pytest.param("SEVER", 5, ["AERIE", "EVENT", "SAVER"], id="Unsolved"),
+        pytest.param("SEVER", 5, ["EVENT", "SEVER"], id="Solved"),
+        pytest.param("CHERUB", 6, ["CHASED", "CHOSEN", "CHERUB"], id="Six letters"),
+        pytest.param(
+            "SEVER",
+            5,
+            ["AERIE", "EVENT", "SAVER", "SLIDE", "ABIDE", "CHIDE"],
+            id="Out of guesses",
+        ),
+    ],
+)
+def test_matches_game_tracker(word, size, guesses):  # pylint: disable=C0116
+    state = GameState(word, size)
+    tracker = GameTracker(word, size)
+    for guess in guesses:
+        state.make_guess(guess)
+        tracker.make_guess(guess)
+
+    assert state.guesses == tracker.guesses
+    assert state.guess_count == len(guesses)
+    assert state.feedback == tracker.feedback
+    assert state.char_tracker == dict(tracker.char_tracker)
+    assert state.remaining_guesses == tracker.remaining_guesses
+    assert state.is_solved == tracker.is_solved
+
+
+@pytest.mark.parametrize(
+    "guess, error",
+    [
+        pytest.param(
+            "STAKES",
+            "Your guess can be no more or less than 5 characters. Try again.",
+            id="Guess too long",
+        ),
+        pytest.param(
+            "SO_SO",
+            "your guess can only contain values from the english alphabet. Try again.",
+            id="Invalid characters",
+        ),
+        pytest.param(
+            "AEIOU", "AEIOU is not in the word list. Try again.", id="Unknown"
+        ),
+    ],
+)
+def test_make_failing_guess(guess, error):  # pylint: disable=C0116
+    state = GameState("SEVER", 5, dictionary=set(WORDS))
+    with pytest.raises(InvalidEntryError) as raised:
+        state.make_guess(guess)
+    assert str(raised.value) == error
+    assert state.remaining_guesses == 6
+
+    state.make_guess("SEVER")
+    with pytest.raises(UserWarning):
+        state.make_guess("SAVER")
+
+
+def test_used_letters_keep_best_status():  # pylint: disable=C0116
+    state = GameState("SEVER")
+    state.make_guess("EERIE")
+    assert state.used_letters == {
+        "E": GuessStatus.MATCH,
+        "R": GuessStatus.WORD_MEMBER,
+        "I": GuessStatus.NO_MATCH,
+    }
+
+
+def test_reset_and_new_game(tmp_path):  # pylint: disable=C0116
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join(WORDS))
+    pool = CandidatePool(open_word_store(source))
+    state = GameState("SEVER", 5, candidate_pool=pool)
+    state.make_guess("SAVER")
+    assert state.remaining_candidates < len(WORDS)
+
+    state.reset()
+    assert not state.word
+    assert not state.guesses
+    assert not state.used_letters
+    assert state.remaining_candidates == len(WORDS)
+
+    state.new_game("PAVER")
+    state.make_guess("PAVER")
+    assert state.is_solved
+    assert state.remaining_candidates == 1
+    assert state.hint() == "PAVER"
+
+
+def test_guess_after_reset():  # pylint: disable=C0116
+    state = GameState("SEVER", 5)
+    state.reset()
+    state.make_guess("AERIE")
+    assert state.feedback == [0]
+    assert not state.is_solved
+
+
+def test_slots_only():  # pylint: disable=C0116
+    state = GameState("SEVER")
+    assert not hasattr(state, "__dict__")
+
+
+def test_snapshot_round_trip(tmp_path):  # pylint: disable=C0116
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join(WORDS))
+    pool = CandidatePool(open_word_store(source))
+    state = GameState("SEVER", 5, candidate_pool=pool, max_guesses=4)
+    state.make_guess("AERIE")
+    state.make_guess("EVENT")
+
+    restored = GameSnapshot.model_validate_json(
+        GameSnapshot.from_state(state).model_dump_json()
+    ).to_state(candidate_pool=pool)
+    assert restored.guesses == state.guesses
+    assert restored.feedback == state.feedback
+    assert restored.max_guesses == 4
+    assert restored.remaining_candidates == state.remaining_candidates
+
+
+def test_snapshot_replay_is_validated():  # pylint: disable=C0116
+    snapshot = GameSnapshot(word="SEVER", guesses=["SEVER", "SAVER"])
+    with pytest.raises(UserWarning):
+        snapshot.to_state()
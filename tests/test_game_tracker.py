@@ -143,6 +143,17 @@ def test__reset(game_fixture: GameTracker):  # pylint: disable=C0116
     assert not game_fixture.guesses
 
 
+def test_guess_after_reset(game_fixture: GameTracker):  # pylint: disable=C0116
+    game_fixture.reset()
+    game_fixture.make_guess("AERIE")
+    assert game_fixture.guesses == ["AERIE"]
+    assert game_fixture.feedback == [0]
+    assert not game_fixture.is_solved
+    empty = GameTracker("")
+    empty.make_guess("CRANE")
+    assert empty.remaining_guesses == 5
+
+
 def test_new_game(game_fixture: GameTracker):  # pylint: disable=C0116
     game_fixture.make_guess("AERIE")
     assert game_fixture.word
@@ -217,3 +228,19 @@ def test_used_letters(  # pylint: disable=C0116
     assert len(game_fixture.used_letters) == len(used_letter_list)
     for letter in used_letter_list:
         assert letter in game_fixture.used_letters.keys()
+
+
+def test_dictionary_validation():  # pylint: disable=C0116
+    game = GameTracker("SEVER", 5, dictionary={"SEVER", "SAVER", "EVENT"})
+    with pytest.raises(InvalidEntryError, match="AEIOU is not in the word list"):
+        game.make_guess("AEIOU")
+    assert game.remaining_guesses == 6
+
+    game.make_guess("SAVER")
+    assert game.guesses == ["SAVER"]
+
+    game.new_game("CHERUB", 6, dictionary={"CHERUB"})
+    with pytest.raises(InvalidEntryError):
+        game.make_guess("CHASED")
+    game.make_guess("CHERUB")
+    assert game.is_solved
@@ -0,0 +1,130 @@
+"""
+Stores unit tests for the stage timers, their exports and the session profilers
+"""
+
+import pstats
+
+import pytest
+
+from src.wordall.game_state import GameState, InvalidEntryError  # type: ignore
+from src.wordall.instrumentation import (  # type: ignore
+    Histogram,
+    Metrics,
+    SamplingProfiler,
+    instrument_from_env,
+    metrics,
+    profile_session,
+)
+from src.wordall.utilities import keyboard_character_format  # type: ignore
+
+
+@pytest.fixture(name="recording")
+def enabled_metrics():
+    """
+    Shared metrics recording from a clean slate for one test
+    Returns:
+    The shared metrics
+    """
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+def test_histogram_quantiles():  # pylint: disable=C0116
+    histogram = Histogram()
+    assert histogram.quantile(0.5) == 0.0
+    for _ in range(99):
+        histogram.observe(3e-6)
+    histogram.observe(0.5)
+    assert histogram.count == 100
+    assert histogram.quantile(0.5) == 4e-6
+    assert 0.5 <= histogram.quantile(1.0) < 1.0
+    histogram.observe(1000.0)
+    assert histogram.quantile(1.0) == float("inf")
+
+
+def test_disabled_records_nothing():  # pylint: disable=C0116
+    registry = Metrics()
+    calls = []
+    function = registry.timed("stage")(calls.append)
+    function(1)
+    with registry.timer("block"):
+        pass
+    registry.count("events")
+    assert calls == [1]
+    assert registry.histograms["stage"].count == 0
+    assert "block" not in registry.histograms
+    assert not registry.counters
+    assert registry.prometheus_text() == "\n"
+
+
+def test_hot_paths_are_timed(recording):  # pylint: disable=C0116
+    game = GameState("SAVED", dictionary={"SAVED", "CRANE"})
+    game.make_guess("CRANE")
+    with pytest.raises(InvalidEntryError):
+        game.make_guess("QQQQQ")
+    keyboard_character_format("QWERTY", game.used_letters)
+    assert recording.histograms["make_guess"].count == 2
+    assert recording.counters["make_guess_errors"] == 1
+    assert recording.histograms["keyboard_character_format"].count == 1
+
+
+def test_prometheus_dump(recording, tmp_path):  # pylint: disable=C0116
+    recording.observe("make_guess", 3e-6)
+    recording.observe("make_guess", 0.5)
+    recording.count("sessions", 2)
+    path = tmp_path / "metrics.prom"
+    recording.dump(path)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert "wordall_sessions_total 2" in lines
+    assert 'wordall_stage_seconds_bucket{stage="make_guess",le="4e-06"} 1' in lines
+    assert 'wordall_stage_seconds_bucket{stage="make_guess",le="+Inf"} 2' in lines
+    assert 'wordall_stage_seconds_count{stage="make_guess"} 2' in lines
+
+
+def test_loguru_records(recording):  # pylint: disable=C0116
+    from loguru import logger  # pylint: disable=C0415
+
+    records = []
+    sink = logger.add(lambda message: records.append(message.record), level="INFO")
+    try:
+        recording.observe("style_guess", 3e-6)
+        recording.log_records()
+    finally:
+        logger.remove(sink)
+    assert records[0]["message"] == "stage timings"
+    assert records[0]["extra"]["stage"] == "style_guess"
+    assert records[0]["extra"]["p50_us"] == 4.0
+
+
+def test_instrument_from_env(tmp_path):  # pylint: disable=C0116
+    environ = {
+        "WORDALL_METRICS": str(tmp_path / "metrics.prom"),
+        "WORDALL_PROFILE": str(tmp_path / "session.pstats"),
+    }
+    metrics.reset()
+    with instrument_from_env(environ):
+        assert metrics.enabled
+        GameState("SAVED").make_guess("CRANE")
+    assert not metrics.enabled
+    dump = (tmp_path / "metrics.prom").read_text(encoding="utf-8")
+    assert 'wordall_stage_seconds_count{stage="make_guess"} 1' in dump
+    profile = pstats.Stats(str(tmp_path / "session.pstats"))
+    assert any(name == "make_guess" for _, _, name in profile.stats)
+    metrics.reset()
+
+
+def test_sampling_profiler(tmp_path):  # pylint: disable=C0116
+    path = tmp_path / "session.folded"
+    with profile_session(path, sampling=True):
+        sum(range(100_000))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    while not profiler.stacks:
+        sum(range(10_000))
+    profiler.stop()
+    assert any("test_sampling_profiler" in stack for stack in profiler.stacks)
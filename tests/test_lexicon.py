@@ -0,0 +1,68 @@
+"""
+Stores unit tests for splitting a lexicon into per-length word lists and finding them by length
+"""
+
+import pytest
+
+from src.wordall.game_state import GameState  # type: ignore
+from src.wordall.lexicon import ingest_lexicon, main, normalize  # type: ignore
+from src.wordall.word_store import (  # type: ignore
+    WordStoreError,
+    available_lengths,
+    open_word_store,
+    word_source_path,
+)
+
+
+@pytest.mark.parametrize(
+    "line, word",
+    [
+        pytest.param(b"crane\n", b"CRANE", id="lower"),
+        pytest.param(b"  Crane \r\n", b"CRANE", id="padded"),
+        pytest.param(b"\n", None, id="blank"),
+        pytest.param(b"ice cream\n", None, id="two_words"),
+        pytest.param(b"don't\n", None, id="apostrophe"),
+        pytest.param("café\n".encode(), None, id="accent"),
+        pytest.param(b"r2d2\n", None, id="digits"),
+    ],
+)
+def test_normalize(line, word):  # pylint: disable=C0116
+    assert normalize(line) == word
+
+
+def test_ingest_partitions_by_length(tmp_path):  # pylint: disable=C0116
+    source = tmp_path / "lexicon.txt"
+    source.write_bytes(
+        b"crane\nCrane\nsaved\n\ncat\nbanana\nzebra's\npalindrome\ncomprehensively\nbanana\n"
+    )
+    summary = ingest_lexicon(source, tmp_path / "lists")
+    assert summary.words == {5: 2, 6: 1, 10: 1}
+    assert summary.duplicates == 2
+    # "cat" and "comprehensively" are out of range, "zebra's" is not a word
+    assert summary.rejected == 3
+    assert summary.total == 4
+    assert (tmp_path / "lists" / "words_5.txt").read_bytes() == b"CRANE\nSAVED\n"
+    assert not list((tmp_path / "lists").glob("*.tmp"))
+
+
+def test_ingested_lists_are_found_by_length(tmp_path):  # pylint: disable=C0116
+    shipped = tmp_path / "data"
+    shipped.mkdir()
+    (shipped / "words_5.txt").write_bytes(b"CRANE\n")
+    source = tmp_path / "lexicon.txt"
+    source.write_bytes(b"saved\nplanets\nstation\n")
+    main([str(source), "--target", str(tmp_path / "lexicon")])
+    source_dirs = (shipped, tmp_path / "lexicon")
+
+    assert available_lengths(source_dirs) == (5, 7)
+    # The shipped list wins over the ingested one
+    assert word_source_path(5, source_dirs) == shipped / "words_5.txt"
+    seven = word_source_path(7, source_dirs)
+    store = open_word_store(seven, tmp_path / "words_7.bin")
+    assert list(store) == ["PLANETS", "STATION"]
+    game = GameState(store[0], 7, dictionary=set(store))
+    game.make_guess("STATION")
+    assert game.remaining_guesses == 5
+    store.close()
+    with pytest.raises(WordStoreError, match=r"lengths available: \(5, 7\)"):
+        word_source_path(8, source_dirs)
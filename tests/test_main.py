@@ -0,0 +1,46 @@
+"""
+Stores unit tests for the startup path of the console game
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.mark.parametrize("module", ["pydantic", "numpy", "httpx"])
+def test_heavy_modules_are_deferred(module):  # pylint: disable=C0116
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, main; print({module!r} in sys.modules)"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_preload_imports_deferred_modules():  # pylint: disable=C0116
+    import main  # pylint: disable=C0415
+
+    main.preload()
+    for name in main.DEFERRED_MODULES:
+        assert name in sys.modules
+
+
+def test_preload_leaves_pydantic_deferred():  # pylint: disable=C0116
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, main; main.preload(); print('pydantic' in sys.modules)",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
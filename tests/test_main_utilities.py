@@ -81,12 +81,19 @@ def test_show_results():  # pylint: disable=C0116
             f"{MATCHED_STYLE}D[/]{NO_MATCH_STYLE}A[/]",
         ),
         (
+            # The target's second E (position 3) is unmatched, so the trailing E is a hint
             "STRESSEDA",
             "IMPRSSEDE",
             f"{NO_MATCH_STYLE}I[/]{NO_MATCH_STYLE}M[/]{NO_MATCH_STYLE}P[/]"
             f"{UNMATCHED_BUT_FOUND_STYLE}R[/]{MATCHED_STYLE}S[/]"
             f"{MATCHED_STYLE}S[/]{MATCHED_STYLE}E[/]{MATCHED_STYLE}D[/]"
-            f"{NO_MATCH_STYLE}E[/]",
+            f"{UNMATCHED_BUT_FOUND_STYLE}E[/]",
+        ),
+        (
+            "BBXYZ",
+            "XBBXX",
+            f"{UNMATCHED_BUT_FOUND_STYLE}X[/]{MATCHED_STYLE}B[/]"
+            f"{UNMATCHED_BUT_FOUND_STYLE}B[/]{NO_MATCH_STYLE}X[/]{NO_MATCH_STYLE}X[/]",
         ),
         (
             "STINT",
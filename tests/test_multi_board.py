@@ -0,0 +1,144 @@
+"""
+Stores unit tests for multi-board games and their display
+"""
+
+import io
+import random
+
+import pytest
+from rich.console import Console
+
+from src.wordall.feedback import GuessStatus, score_guess  # type: ignore
+from src.wordall.game_state import InvalidEntryError  # type: ignore
+from src.wordall.multi_board import BATCH_BOARDS, MultiBoardGame  # type: ignore
+from src.wordall.utilities import board_lines, show_results  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "boards, max_guesses",
+    [
+        pytest.param(1, 6, id="single"),
+        pytest.param(2, 7, id="dordle"),
+        pytest.param(4, 9, id="quordle"),
+        pytest.param(32, 37, id="duotrigordle"),
+    ],
+)
+def test_default_max_guesses(boards, max_guesses):  # pylint: disable=C0116
+    assert MultiBoardGame(["CRANE"] * boards).max_guesses == max_guesses
+
+
+def test_guess_scores_every_open_board():  # pylint: disable=C0116
+    words = ["SAVED", "EERIE", "THERE", "LLAMA"]
+    game = MultiBoardGame(words)
+    game.make_guess("eerie")
+    for board, word in zip(game.boards, words):
+        assert board.guesses == ["EERIE"]
+        assert board.feedback == [score_guess("EERIE", word)]
+    assert game.solved_count == 1
+    assert game.guess_count == 1
+    assert game.remaining_guesses == 8
+
+
+def test_many_boards_are_scored_in_a_batch():  # pylint: disable=C0116
+    rng = random.Random(5)
+    words = ["".join(rng.choices("ABEST", k=5)) for _ in range(BATCH_BOARDS * 2)]
+    game = MultiBoardGame(words, max_guesses=20)
+    for guess in rng.sample(words, 10):
+        game.make_guess(guess)
+    for board, word in zip(game.boards, words):
+        assert board.feedback == [score_guess(guess, word) for guess in board.guesses]
+        played = board.guess_count
+        assert board.guesses == game.guesses[:played]
+
+
+def test_solved_boards_stop_receiving_guesses():  # pylint: disable=C0116
+    game = MultiBoardGame(["SAVED", "THERE"])
+    game.make_guess("THERE")
+    game.make_guess("CRANE")
+    assert game.boards[1].guesses == ["THERE"]
+    assert game.boards[0].guesses == ["THERE", "CRANE"]
+    game.make_guess("SAVED")
+    assert game.is_solved
+    assert game.remaining_guesses == 0
+    assert game.guesses == ["THERE", "CRANE", "SAVED"]
+
+
+def test_out_of_guesses():  # pylint: disable=C0116
+    game = MultiBoardGame(["SAVED", "THERE"], max_guesses=2)
+    game.make_guess("CRANE")
+    game.make_guess("THERE")
+    assert not game.is_solved
+    assert game.remaining_guesses == 0
+    with pytest.raises(UserWarning):
+        game.make_guess("SAVED")
+
+
+@pytest.mark.parametrize("mode", ["hard", "strict"])
+def test_mode_holds_every_open_board(mode):  # pylint: disable=C0116
+    game = MultiBoardGame(["SAVED", "EERIE", "LLAMA"], mode=mode)
+    assert game.mode == mode
+    assert all(board.mode == mode for board in game.boards)
+    game.make_guess("SEVER")
+    with pytest.raises(InvalidEntryError, match="Board 1"):
+        game.make_guess("CHIMP")
+    with pytest.raises(InvalidEntryError, match="Board 2"):
+        game.make_guess("SAVED")
+    assert game.guess_count == 1
+
+
+def test_solved_boards_stop_constraining():  # pylint: disable=C0116
+    game = MultiBoardGame(["SAVED", "EERIE"], mode="hard")
+    game.make_guess("SAVED")
+    # Board 1 would want S, A, V and D back, but it is solved
+    game.make_guess("EERIE")
+    assert game.is_solved
+
+    normal = MultiBoardGame(["SAVED", "EERIE"])
+    normal.make_guess("SEVER")
+    normal.make_guess("CHIMP")
+    assert normal.guess_count == 2
+
+
+def test_invalid_guesses():  # pylint: disable=C0116
+    game = MultiBoardGame(["SAVED", "THERE"], dictionary={"SAVED", "THERE"})
+    with pytest.raises(InvalidEntryError):
+        game.make_guess("CRANE")
+    with pytest.raises(InvalidEntryError):
+        game.make_guess("SAVE")
+    assert game.guess_count == 0
+    with pytest.raises(ValueError):
+        MultiBoardGame(["SAVED", "THE"])
+
+
+def test_used_letters_follow_open_boards():  # pylint: disable=C0116
+    game = MultiBoardGame(["SAVED", "TRAIN"])
+    game.make_guess("SAVED")
+    # S is green on the solved board but absent from the one still open
+    assert game.used_letters["S"] == GuessStatus.NO_MATCH
+    assert game.used_letters["A"] == GuessStatus.WORD_MEMBER
+
+
+def test_boards_are_shown_side_by_side():  # pylint: disable=C0116
+    output = io.StringIO()
+    console = Console(file=output, width=40, color_system=None, emoji=False)
+    words = ["SAVED", "TRAIN", "THERE", "CRANE", "LLAMA", "PILLS", "ADIEU"]
+    game = MultiBoardGame(words)
+    game.make_guess("SAVED")
+    show_results(game, console)
+    lines = output.getvalue().splitlines()
+    # Six boards fit across 40 columns, the seventh starts a second band
+    assert lines[1] == "  ".join(["SAVED"] * 6)
+    assert lines[2 + game.max_guesses].strip() == "SAVED"
+    assert "1/7 boards solved" in output.getvalue()
+
+
+def test_solved_boards_are_not_styled_again():  # pylint: disable=C0116
+    board_lines.cache_clear()
+    console = Console(file=io.StringIO(), width=40)
+    game = MultiBoardGame(["SAVED", "TRAIN"])
+    game.make_guess("SAVED")
+    show_results(game, console)
+    game.make_guess("CRANE")
+    show_results(game, console)
+    info = board_lines.cache_info()  # pylint: disable=E1120
+    assert (info.hits, info.misses) == (1, 3)
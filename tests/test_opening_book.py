@@ -0,0 +1,102 @@
+"""
+Stores unit tests for the precomputed opening book of solver moves
+"""
+
+import pytest
+
+from src.wordall.candidates import CandidatePool  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+from src.wordall.opening_book import (  # type: ignore
+    OpeningBook,
+    build_opening_book,
+    open_opening_book,
+    opening_book_path,
+)
+from src.wordall.pattern_matrix import open_pattern_matrix  # type: ignore
+from src.wordall.solver import best_guess  # type: ignore
+from src.wordall.word_store import open_word_store  # type: ignore
+
+WORDS = ["SEVER", "SAVER", "EERIE", "PAVER", "CHIMP", "FLAIL", "IDIOM", "STINT"]
+
+
+@pytest.fixture(name="pool")
+def small_pool(tmp_path):
+    """
+    Candidate pool over a handful of five letter words
+    Returns:
+    The pool
+    """
+    source = tmp_path / "words_5.txt"
+    source.write_text("\n".join(WORDS))
+    return CandidatePool(open_word_store(source, tmp_path / "words_5.bin"))
+
+
+@pytest.mark.parametrize("answer", WORDS)
+def test_book_matches_solver(pool, answer):  # pylint: disable=C0116
+    book = build_opening_book(pool, depth=3)
+    game = GameTracker(answer, candidate_pool=pool)
+    for _ in range(3):
+        if game.is_solved:
+            break
+        move = book.lookup(game.guesses, game.feedback)
+        assert move == best_guess(game)
+        game.make_guess(move)
+
+
+def test_build_from_matrix(pool, tmp_path):  # pylint: disable=C0116
+    book = build_opening_book(pool, depth=3)
+    matrix = open_pattern_matrix(pool.store, tmp_path / "cache")
+    from_matrix = build_opening_book(pool, depth=3, matrix=matrix)
+    assert from_matrix.nodes.tobytes() == book.nodes.tobytes()
+    assert from_matrix.edges.tobytes() == book.edges.tobytes()
+
+
+def test_build_rejects_empty_lists(tmp_path):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    source.write_text("")
+    empty = CandidatePool(open_word_store(source, tmp_path / "words_5.bin"))
+    with pytest.raises(ValueError, match="empty word list"):
+        build_opening_book(empty)
+
+
+def test_lookup_leaves_the_book(pool):  # pylint: disable=C0116
+    book = build_opening_book(pool, depth=1)
+    assert len(book) == 1
+    opener = book.lookup([], [])
+    game = GameTracker("SEVER", candidate_pool=pool)
+    game.make_guess(opener)
+    # Deeper than the book
+    assert book.lookup(game.guesses, game.feedback) is None
+    # Off the book's line
+    other = next(word for word in WORDS if word != opener)
+    assert book.lookup([other], [0]) is None
+
+
+def test_save_and_load(pool, tmp_path):  # pylint: disable=C0116
+    book = build_opening_book(pool)
+    assert open_opening_book(pool.store, tmp_path) is None
+
+    path = opening_book_path(5, pool.store.digest, tmp_path)
+    book.save(path)
+    loaded = open_opening_book(pool.store, tmp_path)
+    assert loaded.depth == book.depth
+    assert loaded.nodes.tobytes() == book.nodes.tobytes()
+    assert loaded.edges.tobytes() == book.edges.tobytes()
+
+
+def test_load_rejects_other_word_lists(pool, tmp_path):  # pylint: disable=C0116
+    path = tmp_path / "book.bin"
+    build_opening_book(pool).save(path)
+    source = tmp_path / "other_5.txt"
+    source.write_text("\n".join(WORDS[:4]))
+    other = open_word_store(source, tmp_path / "other_5.bin")
+    with pytest.raises(ValueError, match="different word list"):
+        OpeningBook.load(path, other)
+
+
+def test_best_guess_uses_book(pool):  # pylint: disable=C0116
+    book = build_opening_book(pool, depth=1)
+    # Point the root at a move the solver would never pick, to tell the two apart
+    book.nodes[0]["guess"] = WORDS.index("IDIOM")
+    game = GameTracker("SEVER", candidate_pool=pool)
+    assert best_guess(game, book=book) == "IDIOM"
@@ -0,0 +1,198 @@
+"""
+Stores unit tests for the cached, memory-mapped feedback pattern matrix
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.wordall import pattern_matrix  # type: ignore
+from src.wordall.feedback import score_guess  # type: ignore
+from src.wordall.word_store import open_word_store  # type: ignore
+
+WORDS = ["SEVER", "SAVER", "EERIE", "PAVER", "CHIMP", "FLAIL"]
+
+
+@pytest.fixture(name="scored_pairs")
+def count_scored_pairs(monkeypatch):
+    """
+    Counts the pairs which are actually scored (rather than copied) while building
+    Returns:
+    Single element list holding the running count
+    """
+    counter = [0]
+    original = pattern_matrix.score_matrix
+
+    def counting_score_matrix(guesses, answers, out, block_pairs):
+        counter[0] += len(guesses) * len(answers)
+        return original(guesses, answers, out, block_pairs)
+
+    monkeypatch.setattr(pattern_matrix, "score_matrix", counting_score_matrix)
+    return counter
+
+
+def write_words(path, words):  # pylint: disable=C0116
+    path.write_text("\n".join(word.lower() for word in words))
+    # Make sure the word store notices the change even on coarse file system clocks
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def expected_matrix(words):  # pylint: disable=C0116
+    return [[score_guess(guess, answer) for answer in words] for guess in words]
+
+
+def test_build_and_reuse(tmp_path, scored_pairs):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    write_words(source, WORDS)
+    store = open_word_store(source, tmp_path / "words_5.bin")
+
+    matrix = pattern_matrix.open_pattern_matrix(store, tmp_path / "cache")
+    assert matrix.tolist() == expected_matrix(WORDS)
+    assert not matrix.flags.writeable
+    assert scored_pairs[0] == len(WORDS) ** 2
+
+    # A second process (or call) only maps the existing file
+    again = pattern_matrix.open_pattern_matrix(store, tmp_path / "cache")
+    assert np.array_equal(again, matrix)
+    assert scored_pairs[0] == len(WORDS) ** 2
+
+
+def test_incremental_rebuild(tmp_path, scored_pairs):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    cache_dir = tmp_path / "cache"
+    write_words(source, WORDS)
+    old_store = open_word_store(source, tmp_path / "words_5.bin")
+    old_path = pattern_matrix.build_pattern_matrix(old_store, cache_dir)
+    old_store.close()
+    scored_pairs[0] = 0
+
+    # One word inserted in the middle, one appended and one dropped
+    updated = WORDS[:2] + ["IDIOM"] + WORDS[2:5] + ["STINT"]
+    write_words(source, updated)
+    store = open_word_store(source, tmp_path / "words_5.bin")
+    matrix = pattern_matrix.open_pattern_matrix(store, cache_dir)
+
+    assert matrix.tolist() == expected_matrix(updated)
+    # Only the rows and columns of the two new words were scored
+    assert scored_pairs[0] == 2 * len(updated) + 2 * (len(updated) - 2)
+    # Processes still on the old list may be using its matrix
+    assert old_path.exists()
+    assert len(list(cache_dir.glob("patterns_5_*.words.npy"))) == 2
+
+
+def test_newer_builds_are_not_extended(tmp_path, scored_pairs):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    cache_dir = tmp_path / "cache"
+    write_words(source, WORDS)
+    old_store = open_word_store(source, tmp_path / "words_5.bin")
+    write_words(source, WORDS + ["STINT"])
+    new_store = open_word_store(source, tmp_path / "words_6.bin")
+    new_path = pattern_matrix.build_pattern_matrix(new_store, cache_dir)
+    # Built after the list changed, whatever the file system clock says
+    built_ns = new_store.source_mtime_ns + 1
+    os.utime(new_path, ns=(built_ns, built_ns))
+    scored_pairs[0] = 0
+
+    # A process still on the old list builds its own matrix from scratch
+    matrix = pattern_matrix.open_pattern_matrix(old_store, cache_dir)
+    assert matrix.tolist() == expected_matrix(WORDS)
+    assert scored_pairs[0] == len(WORDS) ** 2
+    assert new_path.exists()
+
+
+def test_main_removes_older_builds(tmp_path, monkeypatch):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    cache_dir = tmp_path / "cache"
+    write_words(source, WORDS)
+    old_store = open_word_store(source, tmp_path / "words_5.bin")
+    old_path = pattern_matrix.build_pattern_matrix(old_store, cache_dir)
+    write_words(source, WORDS + ["STINT"])
+    store = open_word_store(source, tmp_path / "words_5.bin")
+
+    monkeypatch.setattr(pattern_matrix, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(pattern_matrix, "load_word_store", lambda word_length: store)
+    pattern_matrix.main(["5"])
+    assert not old_path.exists()
+    assert sorted(path.name for path in cache_dir.iterdir()) == sorted(
+        [
+            pattern_matrix.pattern_matrix_path(5, store.digest, cache_dir).name,
+            pattern_matrix.pattern_matrix_path(5, store.digest, cache_dir)
+            .with_suffix(".words.npy")
+            .name,
+        ]
+    )
+
+
+def test_matrix_path_is_keyed_by_digest(tmp_path):  # pylint: disable=C0116
+    first = pattern_matrix.pattern_matrix_path(5, b"\x01" * 32, tmp_path)
+    second = pattern_matrix.pattern_matrix_path(5, b"\x02" * 32, tmp_path)
+    assert first != second
+    assert first.name.startswith("patterns_5_")
+
+
+def test_matrix_is_indexed_like_the_store(tmp_path):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    write_words(source, WORDS)
+    store = open_word_store(source, tmp_path / "words_5.bin")
+    matrix = pattern_matrix.open_pattern_matrix(store, tmp_path / "cache")
+    assert matrix.shape == (len(store), len(store))
+    assert matrix[2, 0] == score_guess(store[2], store[0])
+
+
+def test_find_only_maps_built_matrices(tmp_path):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    write_words(source, WORDS)
+    store = open_word_store(source, tmp_path / "words_5.bin")
+    assert pattern_matrix.find_pattern_matrix(store, tmp_path / "cache") is None
+    built = pattern_matrix.open_pattern_matrix(store, tmp_path / "cache")
+    found = pattern_matrix.find_pattern_matrix(store, tmp_path / "cache")
+    assert np.array_equal(found, built)
+
+
+def test_open_rebuilds_a_removed_matrix(tmp_path, monkeypatch):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    write_words(source, WORDS)
+    store = open_word_store(source, tmp_path / "words_5.bin")
+    original = pattern_matrix.build_pattern_matrix
+
+    def build_then_lose(*args):
+        # A concurrent build for a newer list removes the file before it is mapped
+        monkeypatch.setattr(pattern_matrix, "build_pattern_matrix", original)
+        path = original(*args)
+        path.unlink()
+        return path
+
+    monkeypatch.setattr(pattern_matrix, "build_pattern_matrix", build_then_lose)
+    matrix = pattern_matrix.open_pattern_matrix(store, tmp_path / "cache")
+    assert matrix.tolist() == expected_matrix(WORDS)
+
+
+def test_vanished_previous_builds_are_scored(
+    tmp_path, scored_pairs, monkeypatch
+):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    cache_dir = tmp_path / "cache"
+    write_words(source, WORDS)
+    old_store = open_word_store(source, tmp_path / "words_5.bin")
+    old_path = pattern_matrix.build_pattern_matrix(old_store, cache_dir)
+    write_words(source, WORDS + ["STINT"])
+    store = open_word_store(source, tmp_path / "words_5.bin")
+    scored_pairs[0] = 0
+
+    original = pattern_matrix._previous_build  # pylint: disable=W0212
+
+    def found_then_removed(*args):
+        # The build command removes the previous build right after it was found
+        previous_build = original(*args)
+        for path in previous_build:
+            path.unlink()
+        return previous_build
+
+    monkeypatch.setattr(pattern_matrix, "_previous_build", found_then_removed)
+    matrix = pattern_matrix.open_pattern_matrix(store, cache_dir)
+    assert matrix.tolist() == expected_matrix(WORDS + ["STINT"])
+    assert scored_pairs[0] == (len(WORDS) + 1) ** 2
+    assert not old_path.exists()
+    assert not list(cache_dir.glob("*.tmp"))
@@ -0,0 +1,106 @@
+"""
+Stores unit tests for the pattern and letter constraint query index
+"""
+
+import re
+
+import pytest
+
+from src.wordall.query import (  # type: ignore
+    QuerySyntaxError,
+    WordQueryIndex,
+    get_query_index,
+    main,
+)
+
+
+def naive(words: list[str], predicate) -> list[str]:
+    """
+    Scans the words one by one, as a reference
+    Returns:
+    The words satisfying the predicate in alphabetical order
+    """
+    return sorted(word for word in words if predicate(word))
+
+
+@pytest.mark.parametrize(
+    "word_length, query, predicate",
+    [
+        pytest.param(5, "S?A?E", lambda w: re.fullmatch("S.A.E", w), id="pattern"),
+        pytest.param(
+            5, "[BC]R[^A]..", lambda w: re.fullmatch("[BC]R[^A]..", w), id="sets"
+        ),
+        pytest.param(5, "ST*", lambda w: w.startswith("ST"), id="prefix"),
+        pytest.param(5, "ZZZ*", lambda w: w.startswith("ZZZ"), id="empty-prefix"),
+        pytest.param(
+            5, "+RT -E", lambda w: "R" in w and "T" in w and "E" not in w, id="letters"
+        ),
+        pytest.param(5, "O=2", lambda w: w.count("O") == 2, id="exactly"),
+        pytest.param(5, "E>=2", lambda w: w.count("E") >= 2, id="at-least"),
+        pytest.param(5, "A<=1 +A", lambda w: w.count("A") == 1, id="at-most"),
+        pytest.param(5, "E=0", lambda w: "E" not in w, id="none"),
+        pytest.param(5, "E<=9", lambda w: True, id="past-length"),
+        pytest.param(
+            5,
+            "s?a?e -r",
+            lambda w: re.fullmatch("S.A.E", w) and "R" not in w,
+            id="lower",
+        ),
+        pytest.param(
+            6,
+            "ST* [^A]?[AEIOU]??? S<=1",
+            lambda w: re.fullmatch("ST[AEIOU]...", w) and w.count("S") == 1,
+            id="six-letters",
+        ),
+    ],
+)
+def test_matches_naive_scan(word_length, query, predicate):  # pylint: disable=C0116
+    index = get_query_index(word_length)
+    expected = naive(index.words, predicate)
+    assert list(index.search(query)) == expected
+    assert index.count(query) == len(expected)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        pytest.param("S?A?", id="short-pattern"),
+        pytest.param("S?A?EE", id="long-pattern"),
+        pytest.param("S[AB?E", id="unclosed-set"),
+        pytest.param("+R2", id="contains-digit"),
+        pytest.param("1*", id="prefix-digit"),
+        pytest.param("O==2", id="count-operator"),
+        pytest.param("SÄUVE", id="not-ascii"),
+    ],
+)
+def test_syntax_errors(query):  # pylint: disable=C0116
+    with pytest.raises(QuerySyntaxError):
+        get_query_index(5).count(query)
+
+
+def test_search_streams_up_to_limit():  # pylint: disable=C0116
+    index = WordQueryIndex(["CRANE", "BRINE", "CRONE", "TRACE"])
+    assert index.words == ["BRINE", "CRANE", "CRONE", "TRACE"]
+    assert list(index.search("?R?NE", limit=2)) == ["BRINE", "CRANE"]
+    assert not list(index.search("?R?NE", limit=0))
+    matches = index.search("")
+    assert next(matches) == "BRINE"
+    assert list(matches) == ["CRANE", "CRONE", "TRACE"]
+
+
+def test_prefix_is_a_contiguous_run():  # pylint: disable=C0116
+    index = WordQueryIndex(["CRANE", "BRINE", "CRONE", "CROWD", "TRACE"])
+    assert list(index.iter_bits(index.prefix("CRO"))) == ["CRONE", "CROWD"]
+    assert list(index.iter_bits(index.prefix(""))) == index.words
+    assert index.prefix("CRX") == 0
+
+
+def test_command_line(capsys):  # pylint: disable=C0116
+    assert main(["--limit", "2", "--", "S?A?E", "-R"]) == len(
+        list(get_query_index(5).search("S?A?E -R"))
+    )
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+    assert lines[-1].endswith("words match")
+    with pytest.raises(SystemExit):
+        main(["S?A?"])
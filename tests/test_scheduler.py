@@ -0,0 +1,54 @@
+"""
+Stores unit tests for the deterministic answer scheduler
+"""
+
+import datetime
+
+import pytest
+
+from src.wordall.scheduler import EPOCH, AnswerScheduler  # type: ignore
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 17, 64, 2315, 12972])
+def test_each_pass_is_a_permutation(size):  # pylint: disable=C0116
+    scheduler = AnswerScheduler(size, "seed")
+    for cycle in range(2):
+        first = cycle * size
+        answers = [scheduler[game] for game in range(first, first + size)]
+        assert sorted(answers) == list(range(size))
+
+
+def test_passes_are_shuffled_differently():  # pylint: disable=C0116
+    scheduler = AnswerScheduler(2315, "seed")
+    first = [scheduler[game] for game in range(20)]
+    second = [scheduler[game] for game in range(2315, 2335)]
+    assert first != second
+
+
+def test_same_seed_same_schedule():  # pylint: disable=C0116
+    games = range(0, 100_000, 997)
+    first = [AnswerScheduler(2315, 42)[game] for game in games]
+    assert first == [AnswerScheduler(2315, "42")[game] for game in games]
+    assert first != [AnswerScheduler(2315, 43)[game] for game in games]
+
+
+@pytest.mark.parametrize("game", [0, 1, 500, 2314, 2315, 9999])
+def test_game_of_inverts_the_schedule(game):  # pylint: disable=C0116
+    scheduler = AnswerScheduler(2315, "seed")
+    assert scheduler.game_of(scheduler[game], game // 2315) == game
+
+
+def test_daily_answer():  # pylint: disable=C0116
+    scheduler = AnswerScheduler(2315, "seed")
+    assert scheduler.for_day(EPOCH) == scheduler[0]
+    assert scheduler.for_day(EPOCH + datetime.timedelta(days=3)) == scheduler[3]
+
+
+def test_invalid_arguments():  # pylint: disable=C0116
+    with pytest.raises(ValueError):
+        AnswerScheduler(0, "seed")
+    scheduler = AnswerScheduler(10, "seed")
+    with pytest.raises(IndexError):
+        _ = scheduler[-1]
+    with pytest.raises(IndexError):
+        scheduler.game_of(10)
@@ -0,0 +1,152 @@
+"""
+Stores unit tests for the asyncio game server and its load generator
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from src.wordall.loadgen import run_local  # type: ignore
+from src.wordall.server import GameServer, SessionStore  # type: ignore
+
+
+class FakeClock:  # pylint: disable=R0903
+    """
+    Clock which only moves when told to
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="server")
+def make_server():
+    """
+    Server over a store with a controllable clock
+    Returns:
+    A game server
+    """
+    return GameServer(SessionStore(idle_timeout=60, clock=FakeClock()))
+
+
+def new_session(server: GameServer, length: int = 5) -> str:
+    """
+    Starts a session through the protocol
+    Returns:
+    The session id
+    """
+    status, session_id, word_size = server.respond(f"NEW {length}").split()
+    assert status == "OK"
+    assert word_size == str(length)
+    return session_id
+
+
+def test_play_to_solution(server):  # pylint: disable=C0116
+    session_id = new_session(server)
+    answer = server.sessions.get(session_id).word
+    assert server.respond(f"guess {session_id} {answer.lower()}") == "OK 22222 0 SOLVED"
+    assert server.respond(f"SHOW {session_id}") == f"OK {answer} 0"
+    assert server.respond(f"GUESS {session_id} {answer}").startswith("ERR Unable")
+
+
+def test_play_to_loss(server):  # pylint: disable=C0116
+    session_id = new_session(server, 6)
+    game = server.sessions.get(session_id)
+    guess = "CHERUB" if game.word != "CHERUB" else "CHASED"
+    for remaining in range(5, 0, -1):
+        response = server.respond(f"GUESS {session_id} {guess}").split()
+        assert response[2:] == [str(remaining), "PLAYING"]
+    assert server.respond(f"GUESS {session_id} {guess}").split()[2:] == [
+        "0",
+        "LOST",
+        game.word,
+    ]
+
+
+@pytest.mark.parametrize(
+    "line, error",
+    [
+        pytest.param("NEW 3", "ERR word length must be one of (", id="Bad length"),
+        pytest.param("NEW five", "ERR invalid literal", id="Length not a number"),
+        pytest.param("GUESS nope CRANE", "ERR unknown session nope", id="No session"),
+        pytest.param("END nope", "ERR unknown session nope", id="End no session"),
+        pytest.param("", "ERR unknown command ''", id="Empty"),
+        pytest.param("DANCE", "ERR unknown command 'DANCE'", id="Unknown"),
+    ],
+)
+def test_errors(server, line, error):  # pylint: disable=C0116
+    assert server.respond(line).startswith(error)
+
+
+def test_invalid_guess_is_reported(server):  # pylint: disable=C0116
+    session_id = new_session(server)
+    assert server.respond(f"GUESS {session_id} QQQQQ") == (
+        "ERR QQQQQ is not in the word list. Try again."
+    )
+    assert server.respond(f"SHOW {session_id}") == "OK - 6"
+
+
+def test_idle_sessions_are_evicted(server):  # pylint: disable=C0116
+    clock = server.sessions.clock
+    first = new_session(server)
+    clock.now = 30
+    second = new_session(server)
+    clock.now = 61
+    assert server.sessions.evict_idle() == 1
+    server.sessions.get(second)
+    clock.now = 100
+    assert server.sessions.evict_idle() == 0
+    assert server.respond(f"SHOW {first}").startswith("ERR unknown session")
+    assert len(server.sessions) == 1
+    assert server.respond(f"END {second}") == "OK"
+    assert not server.sessions
+
+
+def test_least_recently_used_evicted_over_capacity():  # pylint: disable=C0116
+    sessions = SessionStore(max_sessions=2, rng=random.Random(0))
+    first, _ = sessions.create(5)
+    second, _ = sessions.create(5)
+    sessions.get(first)
+    sessions.create(5)
+    assert len(sessions) == 2
+    assert sessions.evicted == 1
+    sessions.get(first)
+    with pytest.raises(ValueError):
+        sessions.get(second)
+
+
+def test_tcp_round_trip():  # pylint: disable=C0116
+    async def scenario():
+        game_server = GameServer(SessionStore())
+        server = await game_server.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"NEW\n")
+            session_id = (await reader.readline()).split()[1].decode()
+            writer.write(f"SHOW {session_id}\n".encode())
+            shown = await reader.readline()
+            writer.write(b"X" * 1024 + b"\n")
+            too_long = await reader.readline()
+            closed = await reader.readline()
+            writer.close()
+        game_server.stop_sweeping()
+        return shown, too_long, closed
+
+    shown, too_long, closed = asyncio.run(scenario())
+    assert shown == b"OK - 6\n"
+    assert too_long == b"ERR line too long\n"
+    assert closed == b""
+
+
+def test_load_generator():  # pylint: disable=C0116
+    report = asyncio.run(run_local(connections=4, games=3, seed=1))
+    assert report.sessions == 12
+    assert report.errors == 0
+    assert 12 <= report.guesses <= 72
+    assert 0 < report.percentile(50) <= report.percentile(99)
+    assert report.sessions_per_second > 0
@@ -0,0 +1,221 @@
+"""
+Stores unit tests for the session store shared by the worker processes of a server
+"""
+
+import asyncio
+import multiprocessing
+import socket
+
+import pytest
+
+from src.wordall import shared_sessions  # type: ignore
+from src.wordall.feedback import score_guess  # type: ignore
+from src.wordall.game_state import InvalidEntryError  # type: ignore
+from src.wordall.server import GameServer  # type: ignore
+from src.wordall.shared_sessions import EMPTY, SharedSessionStore  # type: ignore
+
+GUESSES = ("CRANE", "SLOTH", "EERIE")
+
+
+class FakeClock:  # pylint: disable=R0903
+    """
+    Clock which only moves when told to
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="store")
+def make_store():
+    """
+    Small store with a controllable clock, freed after the test
+    Returns:
+    The store
+    """
+    store = SharedSessionStore(idle_timeout=60, max_sessions=4, clock=FakeClock())
+    yield store
+    store.close()
+    store.unlink()
+
+
+def play_guesses(store: SharedSessionStore, session_ids, guesses):
+    """
+    Plays guesses in sessions, in a worker process
+    """
+    for session_id in session_ids:
+        for guess in guesses:
+            store.play(session_id, guess)
+    store.close()
+
+
+def create_sessions(store: SharedSessionStore, count: int, queue):
+    """
+    Starts sessions and plays a guess in each, in a worker process, reporting their ids
+    """
+    for _ in range(count):
+        session_id, _ = store.create(5)
+        store.play(session_id, GUESSES[0])
+        queue.put(session_id)
+    store.close()
+
+
+def test_round_trip(store):  # pylint: disable=C0116
+    session_id, game = store.create(5)
+    assert len(store) == 1
+    assert store.version(session_id) == 2
+    for turn, guess in enumerate(GUESSES, 1):
+        played = store.play(session_id, guess)
+        assert played.feedback[-1] == score_guess(guess, game.word)
+        assert store.version(session_id) == 2 + 2 * turn
+    store._games.clear()  # pylint: disable=W0212
+    rebuilt = store.get(session_id)
+    assert rebuilt is not played
+    assert rebuilt.word == game.word
+    assert rebuilt.guesses == list(GUESSES)
+    assert rebuilt.feedback == played.feedback
+    assert store.char_tracker(session_id) == played.char_tracker
+    assert store.get(session_id) is rebuilt
+
+
+@pytest.mark.parametrize(
+    "session_id",
+    [
+        pytest.param("nope", id="short"),
+        pytest.param("zzzzzzzzzzzzzzzz", id="not-hex"),
+        pytest.param("0000000000000001", id="reserved"),
+        pytest.param("0123456789abcdef", id="absent"),
+        pytest.param("0123456789abcdef0", id="long"),
+    ],
+)
+def test_unknown_sessions(store, session_id):  # pylint: disable=C0116
+    store.create(5)
+    for lookup in (store.get, store.version, store.char_tracker, store.remove):
+        with pytest.raises(InvalidEntryError, match="unknown session"):
+            lookup(session_id)
+    with pytest.raises(InvalidEntryError, match="unknown session"):
+        store.play(session_id, "CRANE")
+
+
+def test_invalid_guess_changes_nothing(store):  # pylint: disable=C0116
+    session_id, _ = store.create(5)
+    with pytest.raises(InvalidEntryError):
+        store.play(session_id, "QQQQQ")
+    assert store.version(session_id) == 2
+    assert not store.get(session_id).guesses
+
+
+def test_colliding_ids_probe_and_are_cleaned_up(
+    store, monkeypatch
+):  # pylint: disable=C0116
+    # Every id has home slot 3 of the 8
+    keys = iter(range(3 + 8, 3 + 8 * 100, 8))
+    monkeypatch.setattr(shared_sessions.secrets, "randbits", lambda bits: next(keys))
+    session_ids = [store.create(5)[0] for _ in range(4)]
+    assert store._ids[3:7].tolist() == [  # pylint: disable=W0212
+        int(session_id, 16) for session_id in session_ids
+    ]
+    with pytest.raises(InvalidEntryError, match="too many sessions"):
+        store.create(5)
+    store.remove(session_ids[1])
+    store.play(session_ids[3], "CRANE")
+    assert store.get(session_ids[3]).guesses == ["CRANE"]
+    replacement, _ = store.create(5)
+    assert store._ids.item(4) == int(replacement, 16)  # pylint: disable=W0212
+    for session_id in session_ids[2:] + [session_ids[0], replacement]:
+        store.remove(session_id)
+    assert not store
+    assert (store._ids == EMPTY).all()  # pylint: disable=W0212
+
+
+def test_idle_sessions_are_evicted(store):  # pylint: disable=C0116
+    first, _ = store.create(5)
+    store.clock.now = 30
+    second, _ = store.create(5)
+    store.clock.now = 61
+    assert store.evict_idle() == 1
+    store.get(second)
+    store.clock.now = 100
+    assert store.evict_idle() == 0
+    with pytest.raises(InvalidEntryError):
+        store.get(first)
+    assert len(store) == 1
+    assert store.evicted == 1
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_other_process_advances_session(method):  # pylint: disable=C0116
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"no {method} start method")
+    context = multiprocessing.get_context(method)
+    store = SharedSessionStore(max_sessions=4, context=context)
+    try:
+        session_id, _ = store.create(5)
+        assert not store.get(session_id).guesses
+        worker = context.Process(
+            target=play_guesses, args=(store, [session_id], GUESSES[:2])
+        )
+        worker.start()
+        worker.join()
+        assert worker.exitcode == 0
+        assert store.get(session_id).guesses == list(GUESSES[:2])
+        assert store.version(session_id) == 6
+    finally:
+        store.close()
+        store.unlink()
+
+
+def test_concurrent_workers():  # pylint: disable=C0116
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("no fork start method")
+    store = SharedSessionStore(
+        max_sessions=100, context=multiprocessing.get_context("fork")
+    )
+    try:
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        workers = [
+            context.Process(target=create_sessions, args=(store, 20, queue))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        session_ids = [queue.get(timeout=30) for _ in range(60)]
+        for worker in workers:
+            worker.join()
+        assert len(set(session_ids)) == len(store) == 60
+        assert all(store.get(i).guesses == [GUESSES[0]] for i in session_ids)
+    finally:
+        store.close()
+        store.unlink()
+
+
+def test_game_server_over_shared_store(store):  # pylint: disable=C0116
+    server = GameServer(store)
+    _, session_id, _ = server.respond("NEW").split()
+    answer = store.get(session_id).word
+    assert server.respond(f"GUESS {session_id} {answer}") == "OK 22222 0 SOLVED"
+    assert server.respond(f"SHOW {session_id}") == f"OK {answer} 0"
+    assert server.respond(f"END {session_id}") == "OK"
+    assert server.respond(f"SHOW {session_id}").startswith("ERR unknown session")
+
+
+def test_server_on_listening_socket(store):  # pylint: disable=C0116
+    async def scenario():
+        game_server = GameServer(store)
+        with socket.create_server(("127.0.0.1", 0)) as sock:
+            server = await game_server.start(sock=sock)
+            async with server:
+                reader, writer = await asyncio.open_connection(*sock.getsockname())
+                writer.write(b"NEW 6\n")
+                response = await reader.readline()
+                writer.close()
+        game_server.stop_sweeping()
+        return response
+
+    status, _, length = asyncio.run(scenario()).split()
+    assert (status, length) == (b"OK", b"6")
+    assert len(store) == 1
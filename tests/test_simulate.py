@@ -0,0 +1,125 @@
+"""
+Stores unit tests for the headless bulk simulation harness
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from src.wordall.candidates import CandidatePool  # type: ignore
+from src.wordall.simulate import (  # type: ignore
+    RandomStrategy,
+    SolverStrategy,
+    TranscriptStrategy,
+    main,
+    play_game,
+    run_games,
+    write_results,
+)
+from src.wordall.word_store import open_word_store  # type: ignore
+
+WORDS = ["SEVER", "SAVER", "EERIE", "PAVER", "CHIMP", "FLAIL", "IDIOM", "STINT"]
+
+
+@pytest.fixture(name="word_source")
+def small_word_list(tmp_path):
+    """
+    Small five letter word list
+    Returns:
+    Path to the word list
+    """
+    source = tmp_path / "words_5.txt"
+    source.write_text("\n".join(WORDS))
+    return source
+
+
+def test_play_game(word_source):  # pylint: disable=C0116
+    pool = CandidatePool(open_word_store(word_source))
+    result = play_game("CHIMP", SolverStrategy(), pool)
+    assert result.solved
+    assert result.guesses[-1] == "CHIMP"
+    assert result.turns == len(result.guesses) <= 6
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        pytest.param(SolverStrategy(), id="solver"),
+        pytest.param(RandomStrategy(3), id="random"),
+    ],
+)
+def test_strategy_runs_out_of_candidates(
+    word_source, strategy
+):  # pylint: disable=C0116
+    pool = CandidatePool(open_word_store(word_source))
+    result = play_game("ABBEY", strategy, pool)
+    assert not result.solved
+    assert 0 < result.turns < 6
+
+
+def test_transcript_strategy(word_source):  # pylint: disable=C0116
+    pool = CandidatePool(open_word_store(word_source))
+    strategy = TranscriptStrategy({"SEVER": ["SAVER", "SEVER"], "CHIMP": ["FLAIL"]})
+    assert play_game("SEVER", strategy, pool).guesses == ["SAVER", "SEVER"]
+    lost = play_game("CHIMP", strategy, pool)
+    assert not lost.solved
+    assert lost.guesses == ["FLAIL"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_games_is_ordered_and_repeatable(
+    word_source, workers
+):  # pylint: disable=C0116
+    answers = WORDS * 3
+    results = list(run_games(answers, word_source, "random", workers=workers, seed=4))
+    assert [result.answer for result in results] == answers
+    again = list(run_games(answers, word_source, "random", seed=4))
+    assert [result.guesses for result in results] == [
+        result.guesses for result in again
+    ]
+
+
+def test_write_results_jsonl_and_summary(word_source):  # pylint: disable=C0116
+    output = io.StringIO()
+    summary = write_results(run_games(WORDS, word_source, "solver"), output)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [record["answer"] for record in records] == WORDS
+    assert summary.games == len(WORDS)
+    assert summary.win_rate == 1.0
+    assert sum(summary.distribution.values()) == len(WORDS)
+    assert 1 <= summary.mean_guesses <= 6
+    assert summary.games_per_second > 0
+
+
+def test_write_results_csv(word_source):  # pylint: disable=C0116
+    output = io.StringIO()
+    write_results(run_games(WORDS[:2], word_source, "solver"), output, "csv")
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert [row["answer"] for row in rows] == WORDS[:2]
+    assert rows[0]["guesses"].split(" ")[-1] == WORDS[0]
+
+
+def test_main_replays_its_own_output(word_source, tmp_path):  # pylint: disable=C0116
+    recorded = tmp_path / "results.jsonl"
+    first = main(
+        ["--words", str(word_source), "--seed", "2", "--output", str(recorded)]
+    )
+    replayed = main(
+        [
+            "--words",
+            str(word_source),
+            "--strategy",
+            "transcript",
+            "--transcript",
+            str(recorded),
+        ]
+    )
+    assert replayed.distribution == first.distribution
+    assert first.games == len(WORDS)
+
+
+def test_random_strategy_needs_candidates(word_source):  # pylint: disable=C0116
+    pool = CandidatePool(open_word_store(word_source))
+    assert play_game("IDIOM", RandomStrategy(seed=1), pool).solved
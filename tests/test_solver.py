@@ -0,0 +1,116 @@
+"""
+Stores unit tests for the entropy maximizing solver
+"""
+
+import math
+import time
+
+import pytest
+
+from src.wordall import solver  # type: ignore
+from src.wordall.batch_feedback import encode_words  # type: ignore
+from src.wordall.candidates import CandidatePool  # type: ignore
+from src.wordall.constraints import HARD, NORMAL  # type: ignore
+from src.wordall.game_tracker import GameTracker  # type: ignore
+from src.wordall.pattern_matrix import open_pattern_matrix  # type: ignore
+from src.wordall.solver import (  # type: ignore
+    best_guess,
+    guess_entropies,
+    matrix_entropies,
+    rank_guesses,
+)
+from src.wordall.word_store import open_word_store  # type: ignore
+
+WORDS = ["SEVER", "SAVER", "EERIE", "PAVER", "CHIMP", "FLAIL", "IDIOM", "STINT"]
+
+
+def test_guess_entropies():  # pylint: disable=C0116
+    candidates = encode_words(["SAVER", "PAVER", "CAVER", "WAVER"])
+    entropies = guess_entropies(encode_words(["SPCWX", "SAVER", "XXXXX"]), candidates)
+    # Splits the candidates four ways, two ways (SAVER / the rest) and not at all
+    assert entropies[0] == pytest.approx(2.0)
+    assert entropies[1] == pytest.approx(2 - 0.75 * math.log2(3))
+    assert entropies[2] == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_rank_is_deterministic(workers):  # pylint: disable=C0116
+    words = encode_words(WORDS)
+    ranked = rank_guesses(words, words, workers=workers, shard_size=3)
+    assert ranked == rank_guesses(words, words, shard_size=8)
+    assert sorted(guess.guess_index for guess in ranked) == list(range(len(WORDS)))
+    entropies = [guess.entropy for guess in ranked]
+    assert entropies == sorted(entropies, reverse=True)
+
+
+def test_rank_cutoffs():  # pylint: disable=C0116
+    words = encode_words(WORDS)
+    assert len(rank_guesses(words, words, top_k=2)) == 2
+    # Even without any time the first shard is ranked
+    assert len(rank_guesses(words, words, time_budget=0, shard_size=2)) == 2
+
+
+def slow_shard(start, end):  # pylint: disable=C0116
+    # Every shard but the first is still being scored when the time runs out
+    if start:
+        time.sleep(3)
+    state = solver._WORKER_STATE  # pylint: disable=W0212
+    return start, guess_entropies(state["guesses"][start:end], state["candidates"])
+
+
+def test_time_budget_with_workers(monkeypatch):  # pylint: disable=C0116
+    words = encode_words(WORDS)
+    # Forked workers see the patched module
+    monkeypatch.setattr(solver, "_score_shard", slow_shard)
+    started = time.monotonic()
+    ranked = rank_guesses(words, words, workers=2, shard_size=2, time_budget=0.5)
+    assert time.monotonic() - started < 2
+    assert len(ranked) == 2
+
+
+def test_ties_prefer_possible_answers():  # pylint: disable=C0116
+    guesses = encode_words(["XXXXX", "SAVER"])
+    ranked = rank_guesses(guesses, encode_words(["SAVER"]))
+    assert [guess.guess_index for guess in ranked] == [1, 0]
+
+
+def test_best_guess(tmp_path):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    source.write_text("\n".join(WORDS))
+    pool = CandidatePool(open_word_store(source, tmp_path / "words_5.bin"))
+
+    game = GameTracker("SEVER", candidate_pool=pool)
+    opener = best_guess(game)
+    assert opener in WORDS
+    game.make_guess(opener)
+    while not game.is_solved:
+        game.make_guess(best_guess(game))
+    assert len(game.guesses) <= 4
+
+    assert best_guess(GameTracker("SEVER")) is None
+
+
+@pytest.mark.parametrize("mode", [NORMAL, HARD])
+def test_best_guess_from_matrix(tmp_path, mode):  # pylint: disable=C0116
+    source = tmp_path / "words_5.txt"
+    source.write_text("\n".join(WORDS))
+    pool = CandidatePool(open_word_store(source, tmp_path / "words_5.bin"))
+    matrix = open_pattern_matrix(pool.store, tmp_path / "cache")
+
+    indices = pool.indices[[1, 3, 6]]
+    assert matrix_entropies(matrix, indices, 5) == pytest.approx(
+        guess_entropies(pool.letters, pool.letters[indices])
+    )
+    # Hard mode ranks the candidates only, gathered one block of rows at a time
+    for block_pairs in (1, 1 << 18):
+        assert matrix_entropies(
+            matrix, indices, 5, block_pairs, rows=indices
+        ) == pytest.approx(
+            guess_entropies(pool.letters[indices], pool.letters[indices])
+        )
+    for answer in WORDS:
+        game = GameTracker(answer, candidate_pool=pool, mode=mode)
+        while not game.is_solved:
+            move = best_guess(game, matrix=matrix)
+            assert move == best_guess(game)
+            game.make_guess(move)
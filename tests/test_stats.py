@@ -0,0 +1,145 @@
+"""
+Stores unit tests for the streaming statistics aggregator
+"""
+
+import numpy as np
+import pytest
+
+from src.wordall.stats import (  # type: ignore
+    SECONDS_PER_DAY,
+    StatsAggregator,
+    Summary,
+    describe,
+)
+
+
+def test_record_counts_and_streaks():  # pylint: disable=C0116
+    stats = StatsAggregator(10)
+    for guesses, solved in [(3, True), (4, True), (6, False), (2, True)]:
+        stats.record(1, 5, guesses, solved, 0.0)
+    assert stats.player(1) == Summary(4, 3, (0, 1, 1, 1, 0, 0), 1, 2)
+    assert stats.player(0) == Summary(0, 0, (0,) * 6)
+    assert stats.player(99).played == 0
+    assert stats.totals() == Summary(4, 3, (0, 1, 1, 1, 0, 0))
+    assert stats.player(1).win_rate == 0.75
+
+
+def test_player_tables_grow():  # pylint: disable=C0116
+    stats = StatsAggregator(10, players=2)
+    stats.record(1000, 0, 1, True, 0.0)
+    assert stats.player_capacity >= 1001
+    assert stats.player(1000).played == 1
+
+
+@pytest.mark.parametrize(
+    "batch", [pytest.param(1, id="single"), pytest.param(333, id="batched")]
+)
+def test_batches_match_single_records(batch):  # pylint: disable=C0116
+    rng = np.random.default_rng(0)
+    count = 2000
+    players = rng.integers(0, 40, count)
+    answers = rng.integers(0, 50, count)
+    guesses = rng.integers(1, 7, count)
+    solved = rng.random(count) < 0.7
+    timestamps = np.sort(rng.uniform(0, 40 * SECONDS_PER_DAY, count))
+
+    single = StatsAggregator(50)
+    for result in zip(players, answers, guesses, solved, timestamps):
+        single.record(*(int(value) for value in result[:3]), bool(result[3]), result[4])
+    batched = StatsAggregator(50)
+    for start in range(0, count, batch):
+        end = start + batch
+        batched.record_batch(
+            players[start:end],
+            answers[start:end],
+            guesses[start:end],
+            solved[start:end],
+            timestamps[start:end],
+        )
+
+    for player in range(40):
+        assert batched.player(player) == single.player(player)
+    assert batched.totals() == single.totals()
+    assert batched.window(7, today=39) == single.window(7, today=39)
+    assert batched.hardest(5) == single.hardest(5)
+
+
+def test_streak_carries_across_batches():  # pylint: disable=C0116
+    stats = StatsAggregator(1)
+    stats.record_batch([0, 0, 1], [0, 0, 0], [2, 3, 6], [True, True, False], [0, 0, 0])
+    stats.record_batch([0, 0, 0], [0, 0, 0], [1, 6, 2], [True, False, True], [0, 0, 0])
+    assert stats.player(0).current_streak == 1
+    assert stats.player(0).max_streak == 3
+    assert stats.player(1).max_streak == 0
+
+
+def test_windows_roll_over():  # pylint: disable=C0116
+    stats = StatsAggregator(1, window_days=7)
+    stats.record(0, 0, 2, True, 0.5 * SECONDS_PER_DAY)
+    stats.record(0, 0, 6, False, 3.5 * SECONDS_PER_DAY)
+    stats.record(0, 0, 4, True, 5.5 * SECONDS_PER_DAY)
+    assert stats.window(1, today=5).played == 1
+    assert stats.window(3, today=5).played == 2
+    assert stats.window(7, today=5).played == 3
+    stats.record(0, 0, 4, True, 10.5 * SECONDS_PER_DAY)
+    assert stats.window(7, today=10).played == 2
+    # Games older than the window only count towards the totals
+    stats.record(0, 0, 1, True, 0.0)
+    assert stats.window(7, today=10).played == 2
+    assert stats.totals().played == 5
+    with pytest.raises(ValueError):
+        stats.window(8)
+
+
+def test_windows_end_today():  # pylint: disable=C0116
+    stats = StatsAggregator(1, window_days=7)
+    stats.record(0, 0, 2, True, 3.5 * SECONDS_PER_DAY)
+    stats.record(0, 0, 3, True, 5.5 * SECONDS_PER_DAY)
+    # A day without play
+    assert stats.window(1, today=6).played == 0
+    assert stats.window(7, today=6).played == 2
+    assert stats.window(7, today=9).played == 2
+    assert stats.window(7, today=10).played == 1
+    assert stats.window(7, today=13).played == 0
+    # Today's games, recorded with the current time
+    assert stats.window(1).played == 0
+    stats.record(1, 0, 4, True)
+    assert stats.window(1).played == 1
+    assert stats.window(7).played == 1
+
+
+def test_hardest_answers():  # pylint: disable=C0116
+    stats = StatsAggregator(4)
+    for answer, results in {
+        0: [(2, True), (3, True)],
+        1: [(6, False), (5, True)],
+        2: [(6, True), (4, True)],
+        3: [(6, False)],
+    }.items():
+        for guesses, solved in results:
+            stats.record(0, answer, guesses, solved, 0.0)
+    assert [entry.answer for entry in stats.hardest(3)] == [3, 1, 2]
+    assert [entry.answer for entry in stats.hardest(3, min_games=2)] == [1, 2, 0]
+    assert stats.answer(2).mean_guesses == 5.0
+
+
+def test_save_and_load(tmp_path):  # pylint: disable=C0116
+    path = tmp_path / "stats.npz"
+    stats = StatsAggregator(3)
+    stats.record(0, 2, 3, True, 0.0)
+    stats.save(path, b"digest")
+    loaded = StatsAggregator.load(path, 3, b"digest")
+    assert loaded.player(0) == stats.player(0)
+    assert loaded.answer(2).played == 1
+    # A changed word list keeps the player totals but not the per answer ones
+    changed = StatsAggregator.load(path, 3, b"other")
+    assert changed.player(0) == stats.player(0)
+    assert changed.answer(2).played == 0
+    assert StatsAggregator.load(tmp_path / "missing.npz", 3).totals().played == 0
+
+
+def test_describe():  # pylint: disable=C0116
+    lines = describe(Summary(4, 3, (0, 1, 2, 0, 0, 0), 1, 2), width=10)
+    assert lines[0] == "Played 4  Win % 75  Streak 1  Max 2"
+    assert lines[2] == "2 ##### 1"
+    assert lines[3] == "3 ########## 2"
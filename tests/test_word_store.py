@@ -0,0 +1,99 @@
+"""
+Stores unit tests for the compiled, memory-mapped word store which replaces parsing the word list
+text files on every launch
+"""
+
+import os
+import random
+
+import pytest
+
+from src.wordall.word_store import (  # type: ignore
+    STORE_HEADER,
+    WordStore,
+    WordStoreError,
+    compile_word_store,
+    is_store_current,
+    load_word_store,
+    open_word_store,
+)
+
+
+@pytest.fixture(name="word_source")
+def source_file(tmp_path):
+    """
+    Small word list with windows line endings, mirroring the shipped five letter list
+    Returns:
+    Path to the word list text file
+    """
+    source = tmp_path / "words_5.txt"
+    source.write_bytes(b"which\r\nthere\r\ntheir\r\nabout\r\nwould")
+    return source
+
+
+def test_compile_and_read(word_source, tmp_path):  # pylint: disable=C0116
+    target = compile_word_store(word_source, tmp_path / "words_5.bin")
+    assert target.stat().st_size == STORE_HEADER.size + 5 * 5
+
+    store = WordStore(target)
+    assert len(store) == 5
+    assert store.word_length == 5
+    assert list(store) == ["WHICH", "THERE", "THEIR", "ABOUT", "WOULD"]
+    assert store[-1] == "WOULD"
+    assert bytes(store.raw(2)) == b"THEIR"
+    with pytest.raises(IndexError):
+        store.raw(5)
+    store.close()
+
+
+def test_choice_is_seedable(word_source, tmp_path):  # pylint: disable=C0116
+    store = open_word_store(word_source, tmp_path / "words_5.bin")
+    first = [store.choice(random.Random(7)) for _ in range(3)]
+    second = [store.choice(random.Random(7)) for _ in range(3)]
+    assert first == second
+    assert all(word in list(store) for word in first)
+    store.close()
+
+
+def test_rebuilds_when_source_changes(word_source, tmp_path):  # pylint: disable=C0116
+    target = tmp_path / "words_5.bin"
+    store = open_word_store(word_source, target)
+    digest = store.digest
+    store.close()
+    assert is_store_current(word_source, target)
+
+    word_source.write_bytes(word_source.read_bytes() + b"\r\nthese")
+    stat = word_source.stat()
+    os.utime(word_source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert not is_store_current(word_source, target)
+
+    store = open_word_store(word_source, target)
+    assert len(store) == 6
+    assert store[5] == "THESE"
+    assert store.digest != digest
+    store.close()
+
+
+@pytest.mark.parametrize(
+    "content, error",
+    [
+        pytest.param(
+            b"which\nthe\n", "mixes words of 5 and 3 letters", id="Mixed lengths"
+        ),
+        pytest.param(b"which\nth3re\n", "non alphabetic entry", id="Non alphabetic"),
+    ],
+)
+def test_compile_rejects_bad_lists(tmp_path, content, error):  # pylint: disable=C0116
+    source = tmp_path / "words_bad.txt"
+    source.write_bytes(content)
+    with pytest.raises(WordStoreError, match=error):
+        compile_word_store(source, tmp_path / "words_bad.bin")
+
+
+@pytest.mark.parametrize("length, size", [(5, 5757), (6, 15788)])
+def test_shipped_word_lists(length, size):  # pylint: disable=C0116
+    store = load_word_store(length)
+    assert len(store) == size
+    assert store.word_length == length
+    assert all(len(store[idx]) == length for idx in (0, size // 2, size - 1))
+    assert store[0].isupper()